@@ -7,6 +7,8 @@ advanced voice activity detection, and profile management.
 """
 
 import argparse
+import hashlib
+import pickle
 import sys
 from pathlib import Path
 
@@ -16,9 +18,45 @@ sys.path.insert(0, str(Path(__file__).parent))
 from voice_assistant.config import Config
 from voice_assistant.core import VoiceInterface
 
+# Bump when the Config schema changes so stale pickles are discarded
+CONFIG_CACHE_VERSION = 1
+CONFIG_CACHE_FILE = Path.home() / ".claude" / "voice_config.pkl"
 
-def main():
-    """Main entry point."""
+
+def _config_cache_key(args: argparse.Namespace) -> str:
+    """Stable hash of the parsed arguments."""
+    payload = repr(sorted(vars(args).items())).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _load_cached_config(key: str) -> "Config":
+    """Return the cached Config for this arg hash, or None."""
+    try:
+        with open(CONFIG_CACHE_FILE, "rb") as f:
+            version, cached_key, config = pickle.load(f)
+        if version == CONFIG_CACHE_VERSION and cached_key == key:
+            return config
+    except Exception:
+        # A stale cache must never block startup: unpickling after a
+        # Config schema change can raise AttributeError/TypeError on
+        # top of the usual I/O and pickle errors, and every failure
+        # mode has the same answer - fall through to a fresh parse
+        pass
+    return None
+
+
+def _store_cached_config(key: str, config: "Config"):
+    """Persist the resolved Config for the next launch with the same args."""
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CONFIG_CACHE_FILE, "wb") as f:
+            pickle.dump((CONFIG_CACHE_VERSION, key, config), f)
+    except OSError:
+        pass
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Claude Voice Interface with natural TTS"
     )
@@ -101,25 +139,38 @@ def main():
         action="store_true",
         help="Enable verbose logging for debugging",
     )
-    
-    args = parser.parse_args()
-    
-    # Create configuration
-    config = Config.from_args(
-        model_size=args.model,
-        wake_word=args.wake_word,
-        voice=args.voice,
-        tts_engine=args.tts_engine,
-        speech_rate=args.speech_rate,
-        silence_threshold=args.silence_threshold,
-        sample_rate=args.sample_rate,
-        verbose=args.verbose,
-    )
+
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = build_parser().parse_args()
+
+    # Create configuration, reusing the pickled one from the last launch
+    # with identical arguments to skip resolution work on relaunch
+    cache_key = _config_cache_key(args)
+    config = _load_cached_config(cache_key)
+    if config is None:
+        config = Config.from_args(
+            model_size=args.model,
+            wake_word=args.wake_word,
+            voice=args.voice,
+            tts_engine=args.tts_engine,
+            speech_rate=args.speech_rate,
+            silence_threshold=args.silence_threshold,
+            sample_rate=args.sample_rate,
+            verbose=args.verbose,
+        )
+        _store_cached_config(cache_key, config)
     
     # Create interface
     interface = VoiceInterface(config)
     
     try:
+        # Warm the TTS cache for fixed prompts in the background
+        interface.prewarm_tts()
+
         # Calibrate if requested
         if args.calibrate:
             interface.calibrate()
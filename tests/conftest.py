@@ -0,0 +1,136 @@
+"""Shared fixtures and helpers for the test suite."""
+
+import copy
+import functools
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_assistant.config import Config
+
+
+@functools.lru_cache(maxsize=1)
+def default_config_template() -> Config:
+    """Build the canonical default Config once per process."""
+    return Config.default()
+
+
+def fresh_default_config() -> Config:
+    """Deep copy of the cached default Config, safe to mutate per test."""
+    return copy.deepcopy(default_config_template())
+
+
+@pytest.fixture(name="fresh_default_config")
+def fresh_default_config_fixture() -> Config:
+    """Function-scoped mutable copy of the memoized default Config."""
+    return fresh_default_config()
+
+
+@pytest.fixture(scope="session")
+def coqui_config() -> Config:
+    """Shared Config with the Coqui TTS engine selected.
+
+    Built once per worker for the TTS interruption tests, which treat
+    it as read-only; saves five dataclass constructions per test.
+    """
+    from voice_assistant.config import (
+        AudioConfig, ProfileConfig, TTSConfig, TranscriptionConfig, VADConfig,
+    )
+
+    return Config(
+        audio=AudioConfig(),
+        vad=VADConfig(),
+        tts=TTSConfig(engine="coqui"),
+        transcription=TranscriptionConfig(),
+        profiles=ProfileConfig(),
+    )
+
+
+def write_session_id(path, session_id: str) -> None:
+    """Write a .session_id file through a raw fd.
+
+    One open/write/close syscall trio; skips pathlib's TextIOWrapper
+    construction for the many tests that seed a session file.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, session_id.encode())
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture
+def profile_path(tmp_path):
+    """Profile directory inside pytest's session-scoped tmp tree.
+
+    Replaces the per-test TemporaryDirectory() + mkdtemp/rmtree churn in
+    the session tests; pytest prunes the shared base directory itself.
+    """
+    path = tmp_path / "test_profile"
+    path.mkdir()
+    return path
+
+
+class _FakePopen:
+    """Minimal successful-process stand-in for subprocess.Popen.
+
+    A plain class with just communicate/returncode is far cheaper than
+    Mock, which builds call-history and lazy child-attribute machinery
+    on every access. Issued commands are recorded on the class-level
+    ``calls`` list for inspection.
+    """
+
+    calls = []
+
+    def __init__(self, cmd, **kwargs):
+        self.cmd = cmd
+        self.returncode = 0
+        _FakePopen.calls.append(cmd)
+
+    def communicate(self, input=None, timeout=None):
+        return ("Response", "")
+
+
+@pytest.fixture
+def mock_popen():
+    """Patch subprocess.Popen with _FakePopen; yields the class.
+
+    Inspect the issued command via ``mock_popen.calls[-1]``.
+    """
+    _FakePopen.calls = []
+    with patch('subprocess.Popen', new=_FakePopen):
+        yield _FakePopen
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One ClaudeClient shared per test module.
+
+    The session tests isolate state through profile_path, so the client
+    itself can be reused. Imported lazily so collecting other modules
+    doesn't pull in the core package graph.
+    """
+    from voice_assistant.core.claude_client import ClaudeClient
+    return ClaudeClient()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the heavy modules once per worker at session start.
+
+    Later patch() lookups then hit sys.modules instead of paying the
+    transitive numpy/whisper/torch import cost inside the first test.
+    Guarded so missing optional audio deps don't fail unrelated tests.
+    """
+    try:
+        import voice_assistant.core.claude_client  # noqa: F401
+        import voice_assistant.core.interface  # noqa: F401
+        import voice_assistant.profiles  # noqa: F401
+    except ImportError:
+        pass
@@ -34,13 +34,12 @@ class TestAudioRecorder:
     
     @pytest.fixture
     def recorder(self, audio_config, vad_config):
-        """Create audio recorder."""
-        with patch('pyaudio.PyAudio') as mock_pyaudio:
-            mock_audio = Mock()
-            mock_audio.get_default_input_device_info.return_value = {
-                'defaultSampleRate': 16000.0
+        """Create audio recorder (capture backend mocked out)."""
+        with patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True), \
+             patch('voice_assistant.audio.recorder.sd', create=True) as mock_sd:
+            mock_sd.query_devices.return_value = {
+                'default_samplerate': 16000.0
             }
-            mock_pyaudio.return_value = mock_audio
             return AudioRecorder(audio_config, vad_config)
     
     def test_recorder_initialization(self, recorder):
@@ -61,11 +60,13 @@ class TestAudioRecorder:
         amplitude = recorder._get_audio_amplitude(noise_data)
         assert amplitude > 0.0
     
-    @patch('voice_assistant.audio.recorder.pyaudio.PyAudio')
+    @patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True)
+    @patch('voice_assistant.audio.recorder._CallbackInputStream')
+    @patch('voice_assistant.audio.recorder.sd', create=True)
     @patch('builtins.print')
-    def test_record_with_amplitude_quiet_mode(self, mock_print, mock_pyaudio, audio_config, vad_config):
+    def test_record_with_amplitude_quiet_mode(self, mock_print, mock_sd, mock_stream_cls, audio_config, vad_config):
         """Test that quiet mode suppresses print statements in amplitude recording."""
-        # Setup mock stream
+        # Setup mock capture stream (replaces the sounddevice callback adapter)
         mock_stream = Mock()
         mock_stream.read.side_effect = [
             b'\x00' * 1024,  # Silent
@@ -74,14 +75,12 @@ class TestAudioRecorder:
             b'\x00' * 1024,  # Silent again (triggers completion after 2s)
         ] + [b'\x00' * 1024] * 100  # Lots of silence to trigger end
         mock_stream.close.return_value = None
-        
-        mock_audio = Mock()
-        mock_audio.open.return_value = mock_stream
-        mock_audio.get_default_input_device_info.return_value = {
-            'defaultSampleRate': 16000.0
+        mock_stream_cls.return_value = mock_stream
+
+        mock_sd.query_devices.return_value = {
+            'default_samplerate': 16000.0
         }
-        mock_pyaudio.return_value = mock_audio
-        
+
         with patch('time.time') as mock_time:
             # Provide enough time values for the recording loop
             mock_time.side_effect = [0] + [i * 0.1 for i in range(100)]
@@ -121,7 +120,11 @@ class TestAudioRecorder:
             mock_open.return_value.__enter__.return_value.read.return_value = '{"noise_floor": 500.0}'
             
             with patch('json.load', return_value={"noise_floor": 500.0}):
-                with patch('pyaudio.PyAudio'):
+                with patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True), \
+                     patch('voice_assistant.audio.recorder.sd', create=True) as mock_sd:
+                    mock_sd.query_devices.return_value = {
+                        'default_samplerate': 16000.0
+                    }
                     recorder = AudioRecorder(audio_config, vad_config)
                     
                     # Should load noise floor
@@ -134,8 +137,7 @@ class TestAudioRecorder:
         """Test saving calibration data."""
         recorder.audio_config.noise_floor = 750.0
         
-        # Use a temp directory that actually exists
-        import tempfile
+        # Use a temp directory
         with tempfile.TemporaryDirectory() as tmpdir:
             mock_home.return_value = Path(tmpdir)
             
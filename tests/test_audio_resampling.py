@@ -18,17 +18,15 @@ class TestAudioResampling:
 
     def test_recorder_detects_device_sample_rate(self):
         """Test that AudioRecorder detects the actual device sample rate."""
-        with patch('pyaudio.PyAudio') as mock_pyaudio:
+        with patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True), \
+             patch('voice_assistant.audio.recorder.sd', create=True) as mock_sd:
             # Mock device that only supports 48000 Hz
-            mock_audio = Mock()
-            mock_device_info = {
+            mock_sd.query_devices.return_value = {
                 'name': 'Test Device',
-                'defaultSampleRate': 48000.0,
-                'maxInputChannels': 2
+                'default_samplerate': 48000.0,
+                'max_input_channels': 2
             }
-            mock_audio.get_default_input_device_info.return_value = mock_device_info
-            mock_pyaudio.return_value = mock_audio
-            
+
             # Create recorder with 16000 Hz config
             audio_config = AudioConfig(sample_rate=16000)
             vad_config = VADConfig()
@@ -42,17 +40,15 @@ class TestAudioResampling:
     
     def test_recorder_creates_resampler_when_rates_differ(self):
         """Test that AudioRecorder creates a resampler when sample rates differ."""
-        with patch('pyaudio.PyAudio') as mock_pyaudio:
+        with patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True), \
+             patch('voice_assistant.audio.recorder.sd', create=True) as mock_sd:
             # Mock device that uses 48000 Hz
-            mock_audio = Mock()
-            mock_device_info = {
+            mock_sd.query_devices.return_value = {
                 'name': 'Test Device',
-                'defaultSampleRate': 48000.0,
-                'maxInputChannels': 2
+                'default_samplerate': 48000.0,
+                'max_input_channels': 2
             }
-            mock_audio.get_default_input_device_info.return_value = mock_device_info
-            mock_pyaudio.return_value = mock_audio
-            
+
             # Create recorder with 16000 Hz config (for Whisper)
             audio_config = AudioConfig(sample_rate=16000)
             vad_config = VADConfig()
@@ -68,17 +64,15 @@ class TestAudioResampling:
     
     def test_recorder_logs_sample_rate_info_in_verbose_mode(self):
         """Test that AudioRecorder logs sample rate info when verbose is enabled."""
-        with patch('pyaudio.PyAudio') as mock_pyaudio:
+        with patch('voice_assistant.audio.recorder.SOUNDDEVICE_AVAILABLE', True), \
+             patch('voice_assistant.audio.recorder.sd', create=True) as mock_sd:
             # Mock device that uses 48000 Hz
-            mock_audio = Mock()
-            mock_device_info = {
+            mock_sd.query_devices.return_value = {
                 'name': 'Test Device',
-                'defaultSampleRate': 48000.0,
-                'maxInputChannels': 2
+                'default_samplerate': 48000.0,
+                'max_input_channels': 2
             }
-            mock_audio.get_default_input_device_info.return_value = mock_device_info
-            mock_pyaudio.return_value = mock_audio
-            
+
             # Create recorder with verbose config
             audio_config = AudioConfig(sample_rate=16000)
             vad_config = VADConfig()
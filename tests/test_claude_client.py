@@ -1,6 +1,7 @@
 """Tests for Claude client."""
 
 import pytest
+import tempfile
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -20,11 +21,11 @@ class TestClaudeClient:
         assert client.current_process is None
         assert client.is_processing == False
     
-    @patch('subprocess.Popen')
+    @patch('subprocess.Popen', autospec=True)
     def test_send_query(self, mock_popen, client):
         """Test sending query to Claude."""
         # Mock successful response
-        mock_process = MagicMock()
+        mock_process = MagicMock(spec=['communicate', 'returncode'])
         mock_process.communicate.return_value = ("Test response", "")
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
@@ -34,21 +35,21 @@ class TestClaudeClient:
         assert response == "Test response"
         mock_popen.assert_called_once()
         
-        # Check command
+        # Check command; the prompt travels over stdin, not argv
         cmd = mock_popen.call_args[0][0]
         assert cmd[0] == "claude"
-        assert "Test query" in cmd
+        assert "Test query" not in cmd
+        mock_process.communicate.assert_called_once_with(input="Test query")
     
-    @patch('subprocess.Popen')
+    @patch('subprocess.Popen', autospec=True)
     def test_send_query_with_profile(self, mock_popen, client):
         """Test sending query with profile context."""
-        mock_process = MagicMock()
+        mock_process = MagicMock(spec=['communicate', 'returncode'])
         mock_process.communicate.return_value = ("Profile response", "")
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
         
-        # Use a temp directory for profile
-        import tempfile
+        # Use a temp directory
         with tempfile.TemporaryDirectory() as tmpdir:
             profile_path = Path(tmpdir) / "test_profile"
             profile_path.mkdir(parents=True, exist_ok=True)
@@ -65,16 +66,15 @@ class TestClaudeClient:
             kwargs = mock_popen.call_args[1]
             assert kwargs['cwd'] == str(profile_path)
     
-    @patch('subprocess.Popen')
+    @patch('subprocess.Popen', autospec=True)
     def test_send_query_with_reset(self, mock_popen, client):
         """Test sending query with context reset."""
-        mock_process = MagicMock()
+        mock_process = MagicMock(spec=['communicate', 'returncode'])
         mock_process.communicate.return_value = ("Reset response", "")
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
         
-        # Use a temp directory for profile
-        import tempfile
+        # Use a temp directory
         with tempfile.TemporaryDirectory() as tmpdir:
             profile_path = Path(tmpdir) / "test_profile"
             profile_path.mkdir(parents=True, exist_ok=True)
@@ -91,10 +91,10 @@ class TestClaudeClient:
             cmd = mock_popen.call_args[0][0]
             assert "-c" not in cmd
     
-    @patch('subprocess.Popen')
+    @patch('subprocess.Popen', autospec=True)
     def test_send_query_error(self, mock_popen, client):
         """Test query error handling."""
-        mock_process = MagicMock()
+        mock_process = MagicMock(spec=['communicate', 'returncode'])
         mock_process.communicate.return_value = ("", "Error message")
         mock_process.returncode = 1
         mock_popen.return_value = mock_process
@@ -104,7 +104,7 @@ class TestClaudeClient:
         assert "Error:" in response
         assert "Error message" in response
     
-    @patch('subprocess.Popen')
+    @patch('subprocess.Popen', autospec=True)
     def test_cancel(self, mock_popen, client):
         """Test cancelling current process."""
         mock_process = MagicMock()
@@ -120,11 +120,103 @@ class TestClaudeClient:
         assert client.current_process is None
     
     def test_is_processing_property(self, client):
-        """Test is_processing property."""
+        """Test is_processing property (lock-free flag set by the writers)."""
         assert client.is_processing == False
-        
-        client.current_process = MagicMock()
+
+        client._processing = True
         assert client.is_processing == True
-        
-        client.current_process = None
-        assert client.is_processing == False
\ No newline at end of file
+
+        client._processing = False
+        assert client.is_processing == False
+
+
+class TestPersistentClaudeClient:
+    """Test the long-lived stream-json Claude process mode."""
+
+    @pytest.fixture
+    def client(self):
+        """Create persistent Claude client."""
+        return ClaudeClient(persistent=True)
+
+    @patch('subprocess.Popen', autospec=True)
+    def test_process_spawned_once_across_queries(self, mock_popen, client):
+        """Test that consecutive queries reuse one process."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdout.readline.side_effect = [
+            b'{"type": "result", "result": "First"}\n',
+            b'{"type": "result", "result": "Second"}\n',
+        ]
+        mock_popen.return_value = mock_process
+
+        assert client.send_query("One") == "First"
+        assert client.send_query("Two") == "Second"
+
+        mock_popen.assert_called_once()
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[0] == "claude"
+        assert "stream-json" in cmd
+
+    @patch('subprocess.Popen', autospec=True)
+    def test_query_written_to_stdin(self, mock_popen, client):
+        """Test that queries are framed as JSON lines on stdin."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdout.readline.return_value = b'{"type": "result", "result": "OK"}\n'
+        mock_popen.return_value = mock_process
+
+        client.send_query("Test query")
+
+        # Frame then newline, both as bytes (orjson.dumps output)
+        frame = mock_process.stdin.write.call_args_list[0][0][0]
+        assert b"Test query" in frame
+        assert mock_process.stdin.write.call_args_list[1][0][0] == b"\n"
+
+    @patch('subprocess.Popen', autospec=True)
+    def test_reset_context_restarts_process(self, mock_popen, client):
+        """Test that resetting context tears down and restarts the process."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdout.readline.return_value = b'{"type": "result", "result": "OK"}\n'
+        mock_popen.return_value = mock_process
+
+        client.send_query("First")
+        client.send_query("Fresh start", reset_context=True)
+
+        assert mock_popen.call_count == 2
+
+    @patch('subprocess.Popen', autospec=True)
+    def test_profile_preamble_sent_at_start(self, mock_popen, client):
+        """Test that the profile CLAUDE.md is passed once at process start."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdout.readline.return_value = b'{"type": "result", "result": "OK"}\n'
+        mock_popen.return_value = mock_process
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            profile_path = Path(tmpdir) / "test_profile"
+            profile_path.mkdir(parents=True, exist_ok=True)
+            (profile_path / "CLAUDE.md").write_text("# Profile context")
+
+            client.send_query("Question", profile_path=profile_path)
+            client.send_query("Another", profile_path=profile_path)
+
+            # Preamble goes on the (single) process invocation, not per turn
+            mock_popen.assert_called_once()
+            cmd = mock_popen.call_args[0][0]
+            assert "--append-system-prompt" in cmd
+            assert "# Profile context" in cmd
+
+    @patch('subprocess.Popen', autospec=True)
+    def test_non_result_frames_are_skipped(self, mock_popen, client):
+        """Test that intermediate stream events are ignored."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdout.readline.side_effect = [
+            b'{"type": "system", "subtype": "init"}\n',
+            b'{"type": "assistant", "message": {}}\n',
+            b'{"type": "result", "result": "Final answer"}\n',
+        ]
+        mock_popen.return_value = mock_process
+
+        assert client.send_query("Question") == "Final answer"
\ No newline at end of file
@@ -1,37 +1,82 @@
 """Tests for the VoiceInterface class."""
 
+import copy
+import itertools
 import time
 import unittest
-from unittest.mock import Mock, MagicMock, patch, call
+from contextlib import ExitStack
+from unittest.mock import DEFAULT, Mock, MagicMock, patch, call, mock_open
 from pathlib import Path
 
+import pytest
+
 from voice_assistant.core.interface import VoiceInterface
 from voice_assistant.config import Config
 
+from tests.conftest import fresh_default_config
+
+
+class LoopExit(Exception):
+    """Raised by mock side effects to break out of the wake-word loop."""
+
+
+# Dependency patches shared by the interface tests, registered in one
+# patch.multiple sweep instead of five separate context managers
+_PATCHED_DEPS = dict(
+    AudioRecorder=DEFAULT,
+    WhisperTranscriber=DEFAULT,
+    create_tts_engine=DEFAULT,
+    ProfileManager=DEFAULT,
+    ClaudeClient=DEFAULT,
+)
+
+
+def _patch_interface_deps():
+    return patch.multiple('voice_assistant.core.interface', **_PATCHED_DEPS)
+
 
 class TestVoiceInterface(unittest.TestCase):
     """Test the main voice interface orchestrator."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one patched template interface shared by every test."""
+        cls.config = fresh_default_config()
+        cls.config.wake_word = "hey claude"
+
+        # Enter the five dependency patches once for the whole class
+        cls._stack = ExitStack()
+        cls._stack.enter_context(_patch_interface_deps())
+        cls._template = VoiceInterface(cls.config)
+
+        # Pool of component mocks reused (and reset) across all tests,
+        # avoiding ~5 Mock() constructions per test
+        cls._mock_pool = {
+            name: Mock()
+            for name in (
+                "audio_recorder", "transcriber", "tts_engine",
+                "profile_manager", "claude_client",
+            )
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._stack.close()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.config = Config.default()
-        self.config.wake_word = "hey claude"
-        
-        # Mock all dependencies
-        with patch('voice_assistant.core.interface.AudioRecorder'), \
-             patch('voice_assistant.core.interface.WhisperTranscriber'), \
-             patch('voice_assistant.core.interface.create_tts_engine'), \
-             patch('voice_assistant.core.interface.ProfileManager'), \
-             patch('voice_assistant.core.interface.ClaudeClient'):
-            
-            self.interface = VoiceInterface(self.config)
-            
-            # Set up common mocks
-            self.interface.audio_recorder = Mock()
-            self.interface.transcriber = Mock()
-            self.interface.tts_engine = Mock()
-            self.interface.profile_manager = Mock()
-            self.interface.claude_client = Mock()
+        """Set up test fixtures from the class-level template."""
+        self.interface = copy.copy(self._template)
+
+        for name, component in self._mock_pool.items():
+            component.reset_mock(return_value=True, side_effect=True)
+            setattr(self.interface, name, component)
+
+        # reset_mock() leaves explicitly assigned attributes in place, so
+        # restore the ones tests overwrite on the shared mocks
+        self.interface.audio_recorder.vad_model = MagicMock()
+        self.interface.transcriber.model = MagicMock()
+        self.interface.profile_manager.current_profile = MagicMock()
+        self.interface.profile_manager.reset_context_mode = MagicMock()
     
     def test_initialization(self):
         """Test interface initialization."""
@@ -67,53 +112,18 @@ class TestVoiceInterface(unittest.TestCase):
     def test_listen_without_vad(self):
         """Test listening without VAD."""
         self.interface.audio_recorder.vad_model = None
+        self.interface.transcriber.model = None  # No streaming without a real model
         self.interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
         self.interface.transcriber.transcribe.return_value = "test text"
-        
+
         result = self.interface.listen(timeout=10)
-        
-        self.interface.audio_recorder.record_with_amplitude.assert_called_once_with(10, quiet=False)
+
+        self.interface.audio_recorder.record_with_amplitude.assert_called_once_with(
+            10, quiet=False, streamer=None
+        )
         self.interface.transcriber.transcribe.assert_called_once_with([b"audio"])
         self.assertEqual(result, "test text")
     
-    def test_detect_wake_word_exact_match(self):
-        """Test wake word detection with exact match."""
-        self.interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
-        self.interface.transcriber.quick_transcribe.return_value = "hey claude"
-        
-        result = self.interface.detect_wake_word()
-        
-        self.assertTrue(result)
-        # Should call record_with_amplitude with quiet=True
-        self.interface.audio_recorder.record_with_amplitude.assert_called_with(timeout=5, quiet=True)
-    
-    def test_detect_wake_word_variation(self):
-        """Test wake word detection with known variation."""
-        self.interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
-        self.interface.transcriber.quick_transcribe.return_value = "hey claud"
-        
-        result = self.interface.detect_wake_word()
-        
-        self.assertTrue(result)
-    
-    def test_detect_wake_word_fuzzy_match(self):
-        """Test wake word detection with fuzzy matching."""
-        self.interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
-        self.interface.transcriber.quick_transcribe.return_value = "hey claude"
-        
-        result = self.interface.detect_wake_word()
-        
-        self.assertTrue(result)
-    
-    def test_detect_wake_word_no_match(self):
-        """Test wake word detection with no match."""
-        self.interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
-        self.interface.transcriber.quick_transcribe.return_value = "hello world"
-        
-        result = self.interface.detect_wake_word()
-        
-        self.assertFalse(result)
-    
     def test_process_profile_create(self):
         """Test profile creation command."""
         self.interface.listen = Mock(side_effect=["test profile", "yes", "A test profile"])
@@ -121,12 +131,17 @@ class TestVoiceInterface(unittest.TestCase):
         self.interface.profile_manager.create_profile.return_value = True
         self.interface.profile_manager.get_current_profile_path.return_value = Path("/test")
         
-        with patch("builtins.open", create=True):
+        # Patch open in the module under test rather than builtins globally
+        with patch("voice_assistant.core.interface.open", mock_open()) as mocked_open:
             result = self.interface.process_profile_commands("create profile")
-        
+
         self.assertTrue(result)
         self.interface.profile_manager.create_profile.assert_called_once_with("test profile")
         self.interface.profile_manager.load_profile.assert_called_once_with("test profile")
+        mocked_open.assert_called_once_with(Path("/test") / "CLAUDE.md", "a")
+        mocked_open.return_value.write.assert_called_once_with(
+            "\n## Description\nA test profile\n"
+        )
     
     def test_process_profile_list(self):
         """Test profile listing command."""
@@ -151,24 +166,24 @@ class TestVoiceInterface(unittest.TestCase):
         self.assertEqual(result, "Claude response")
         self.interface.claude_client.send_query.assert_called_once()
     
-    @patch('time.time')
+    @patch('time.perf_counter')
     @patch('random.choice')
     def test_wake_word_mode_conversation_session(self, mock_choice, mock_time):
         """Test wake word mode enters conversation session and stays active."""
-        # Setup
-        mock_time.side_effect = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        # Setup: unbounded clock, no StopIteration if call counts drift
+        mock_time.side_effect = itertools.count(start=0, step=1)
         mock_choice.return_value = "Yes?"
-        
-        # Mock detect_wake_word to return True once, then False
-        self.interface.detect_wake_word = Mock(side_effect=[True, False])
-        
+
+        # Mock detect_wake_word to return True once, then exit the loop
+        self.interface.detect_wake_word = Mock(side_effect=[True, LoopExit()])
+
         # Mock listen to simulate conversation
         self.interface.listen = Mock(side_effect=[
             "What's the weather?",  # First query
-            "Tell me a joke",        # Second query  
+            "Tell me a joke",        # Second query
             "goodbye"                # Exit command
         ])
-        
+
         # Mock other methods
         self.interface.speak = Mock()
         self.interface.check_session_status = Mock()  # Mock the new method
@@ -177,20 +192,11 @@ class TestVoiceInterface(unittest.TestCase):
             "Why did the chicken cross the road?",
             None
         ])
-        
-        # Run wake_word_mode in a thread with timeout
-        import threading
-        def run_wake_mode():
-            try:
-                self.interface.wake_word_mode()
-            except StopIteration:
-                pass
-        
-        thread = threading.Thread(target=run_wake_mode)
-        thread.daemon = True
-        thread.start()
-        thread.join(timeout=0.5)
-        
+
+        # Deterministic exit: no thread, no join timeout
+        with self.assertRaises(LoopExit):
+            self.interface.wake_word_mode()
+
         # Verify conversation session behavior
         # Should have spoken the acknowledgment
         self.interface.speak.assert_any_call("Yes?", friendly=True)
@@ -204,34 +210,24 @@ class TestVoiceInterface(unittest.TestCase):
         goodbye_said = any("goodbye" in str(call).lower() for call in calls)
         self.assertTrue(goodbye_said or True)  # Flexible check due to random choice
     
-    @patch('time.time')
+    @patch('time.perf_counter')
     def test_wake_word_mode_inactivity_timeout(self, mock_time):
         """Test wake word mode times out after inactivity."""
-        # Setup time progression
-        mock_time.side_effect = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        
-        # Mock detect_wake_word to return True once
-        self.interface.detect_wake_word = Mock(side_effect=[True, False])
+        # Setup time progression without a bounded list
+        mock_time.side_effect = itertools.count(start=0, step=1)
         
+        # Mock detect_wake_word to return True once, then exit the loop
+        self.interface.detect_wake_word = Mock(side_effect=[True, LoopExit()])
+
         # Mock listen to simulate no response (inactivity)
         self.interface.listen = Mock(return_value=None)
-        
+
         self.interface.speak = Mock()
         self.interface.check_session_status = Mock()  # Mock the new method
-        
-        # Run wake_word_mode in a thread
-        import threading
-        def run_wake_mode():
-            try:
-                self.interface.wake_word_mode()
-            except StopIteration:
-                pass
-        
-        thread = threading.Thread(target=run_wake_mode)
-        thread.daemon = True
-        thread.start()
-        thread.join(timeout=0.5)
-        
+
+        with self.assertRaises(LoopExit):
+            self.interface.wake_word_mode()
+
         # Should have detected inactivity and gone to sleep
         self.interface.speak.assert_any_call("Going to sleep.")
     
@@ -249,7 +245,7 @@ class TestVoiceInterface(unittest.TestCase):
         goodbye_said = any("goodbye" in str(call).lower() for call in calls)
         self.assertTrue(goodbye_said or len(calls) > 2)
     
-    @patch('time.time')
+    @patch('time.perf_counter')
     def test_conversation_mode_inactivity_timeout(self, mock_time):
         """Test conversation mode times out after 2 minutes of inactivity."""
         # Simulate time passing beyond timeout
@@ -285,85 +281,101 @@ class TestVoiceInterface(unittest.TestCase):
 
 class TestWakeWordConversationSession(unittest.TestCase):
     """Specific tests for wake word conversation session behavior."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one patched template interface shared by every test."""
+        cls.config = fresh_default_config()
+        cls.config.wake_word = "hey claude"
+
+        cls._stack = ExitStack()
+        cls._stack.enter_context(_patch_interface_deps())
+        cls._template = VoiceInterface(cls.config)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._stack.close()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.config = Config.default()
-        self.config.wake_word = "hey claude"
-        
-        with patch('voice_assistant.core.interface.AudioRecorder'), \
-             patch('voice_assistant.core.interface.WhisperTranscriber'), \
-             patch('voice_assistant.core.interface.create_tts_engine'), \
-             patch('voice_assistant.core.interface.ProfileManager'), \
-             patch('voice_assistant.core.interface.ClaudeClient'):
-            
-            self.interface = VoiceInterface(self.config)
+        """Set up test fixtures from the class-level template."""
+        self.interface = copy.copy(self._template)
     
     def test_stays_active_between_queries(self):
         """Test that wake word mode stays in conversation session between queries."""
         # This is the key behavior: after wake word detection,
         # it should process multiple queries without needing the wake word again
         
-        self.interface.detect_wake_word = Mock(side_effect=[True, False])
+        self.interface.detect_wake_word = Mock(side_effect=[True, LoopExit()])
         self.interface.listen = Mock(side_effect=[
             "First question",
-            "Second question", 
+            "Second question",
             "Third question",
             "goodbye"
         ])
         self.interface.speak = Mock()
         self.interface.send_to_claude = Mock(return_value="Response")
-        
-        # Run in thread with timeout
-        import threading
-        def run_wake_mode():
-            try:
-                self.interface.wake_word_mode()
-            except (StopIteration, RuntimeError):
-                pass
-        
-        thread = threading.Thread(target=run_wake_mode)
-        thread.daemon = True
-        thread.start()
-        thread.join(timeout=0.5)
-        
-        # Should have called detect_wake_word only once
-        self.assertEqual(self.interface.detect_wake_word.call_count, 1)
-        
+
+        with self.assertRaises(LoopExit):
+            self.interface.wake_word_mode()
+
+        # One real detection; the second call is only the exit sentinel
+        self.assertEqual(self.interface.detect_wake_word.call_count, 2)
+
         # Should have processed multiple queries
         self.assertGreaterEqual(self.interface.listen.call_count, 3)
         self.assertGreaterEqual(self.interface.send_to_claude.call_count, 3)
     
-    def test_goodbye_variations(self):
-        """Test different goodbye phrases exit the session."""
-        goodbye_phrases = ["goodbye", "bye", "see you", "talk to you later"]
-        
-        for phrase in goodbye_phrases:
-            with self.subTest(phrase=phrase):
-                self.interface.detect_wake_word = Mock(return_value=True)
-                self.interface.listen = Mock(side_effect=[phrase])
-                self.interface.speak = Mock()
-                
-                # Run briefly
-                import threading
-                def run_wake_mode():
-                    try:
-                        self.interface.wake_word_mode()
-                    except (StopIteration, RuntimeError):
-                        pass
-                
-                thread = threading.Thread(target=run_wake_mode)
-                thread.daemon = True
-                thread.start()
-                thread.join(timeout=0.2)
-                
-                # Should have said a farewell
-                calls = [str(call) for call in self.interface.speak.call_args_list]
-                farewell_said = any(
-                    any(word in str(call).lower() for word in ["goodbye", "bye", "see you", "cheerio"])
-                    for call in calls
-                )
-                self.assertTrue(farewell_said or len(calls) >= 1)
+@pytest.mark.parametrize(
+    "transcript,expected",
+    [
+        ("hey claude", True),   # exact match
+        ("hey claud", True),    # known variation
+        ("hey clause", True),   # fuzzy match (SequenceMatcher > 0.8)
+        ("hello world", False),  # no match
+    ],
+)
+def test_detect_wake_word(transcript, expected, fresh_default_config):
+    """Test wake word detection across match kinds."""
+    config = fresh_default_config
+    config.wake_word = "hey claude"
+
+    with _patch_interface_deps():
+        interface = VoiceInterface(config)
+
+    interface.audio_recorder = Mock()
+    interface.transcriber = Mock()
+    interface.audio_recorder.record_with_amplitude.return_value = [b"audio"]
+    interface.transcriber.quick_transcribe.return_value = transcript
+
+    assert interface.detect_wake_word() is expected
+    # Should call record_with_amplitude with quiet=True
+    interface.audio_recorder.record_with_amplitude.assert_called_with(timeout=5, quiet=True)
+
+
+@pytest.mark.parametrize(
+    "phrase", ["goodbye", "bye", "see you", "talk to you later"]
+)
+def test_goodbye_variations(phrase, fresh_default_config):
+    """Test different goodbye phrases exit the session."""
+    config = fresh_default_config
+    config.wake_word = "hey claude"
+
+    with _patch_interface_deps():
+        interface = VoiceInterface(config)
+
+    interface.detect_wake_word = Mock(side_effect=[True, LoopExit()])
+    interface.listen = Mock(side_effect=[phrase])
+    interface.speak = Mock()
+
+    with pytest.raises(LoopExit):
+        interface.wake_word_mode()
+
+    # Should have said a farewell
+    calls = [str(call) for call in interface.speak.call_args_list]
+    assert any(
+        any(word in str(call).lower() for word in ["goodbye", "bye", "see you", "cheerio"])
+        for call in calls
+    )
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -19,24 +21,34 @@ class TestSampleRateConfiguration:
         assert config.audio.sample_rate == 48000
 
     def test_cli_accepts_sample_rate_argument(self):
-        """Test that the CLI script accepts --sample-rate argument."""
+        """Test that the CLI parser accepts --sample-rate argument."""
+        import claude_voice
+
+        help_text = claude_voice.build_parser().format_help()
+        assert "--sample-rate" in help_text
+        assert "16000" in help_text
+        assert "48000" in help_text
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("subprocess")
+    def test_cli_help_smoke(self):
+        """End-to-end smoke test: the script itself prints usable help."""
         result = subprocess.run(
             [sys.executable, "claude_voice.py", "--help"],
             capture_output=True,
             text=True,
         )
         assert "--sample-rate" in result.stdout
-        assert "16000" in result.stdout
-        assert "48000" in result.stdout
 
-    def test_cli_passes_sample_rate_to_config(self):
+    def test_cli_passes_sample_rate_to_config(self, tmp_path):
         """Test that CLI passes sample rate to Config correctly."""
         # This test verifies the integration by checking that
         # the sample_rate parameter gets passed through
         from unittest.mock import patch
         import claude_voice
-        
-        with patch("claude_voice.VoiceInterface") as mock_interface:
+
+        with patch("claude_voice.VoiceInterface") as mock_interface, \
+             patch("claude_voice.CONFIG_CACHE_FILE", tmp_path / "voice_config.pkl"):
             with patch("sys.argv", ["claude_voice.py", "wake", "--sample-rate", "48000"]):
                 # Capture the config that gets created
                 original_from_args = Config.from_args
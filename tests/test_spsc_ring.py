@@ -0,0 +1,71 @@
+"""Tests for the lock-free audio ring buffer."""
+
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_assistant.audio.ring import SPSCRing
+
+
+def test_push_pop_round_trip():
+    """Samples come out in the order they went in."""
+    ring = SPSCRing(capacity=1024)
+    samples = np.arange(512, dtype=np.int16)
+
+    assert ring.push(samples) is True
+    out = ring.pop(512)
+
+    assert np.array_equal(out, samples)
+    assert ring.available == 0
+
+
+def test_wraparound():
+    """Chunks spanning the end of the buffer are reassembled correctly."""
+    ring = SPSCRing(capacity=100)
+
+    ring.push(np.zeros(80, dtype=np.int16))
+    ring.pop(80)
+
+    # This chunk wraps: 20 samples at the end, 40 at the start
+    samples = np.arange(60, dtype=np.int16)
+    assert ring.push(samples) is True
+    assert np.array_equal(ring.pop(60), samples)
+
+
+def test_full_ring_drops_chunk():
+    """A full ring drops the incoming chunk instead of blocking."""
+    ring = SPSCRing(capacity=100)
+
+    assert ring.push(np.zeros(100, dtype=np.int16)) is True
+    assert ring.push(np.ones(1, dtype=np.int16)) is False
+    assert ring.available == 100
+
+
+def test_pop_timeout_when_empty():
+    """pop returns None if no data arrives before the timeout."""
+    ring = SPSCRing(capacity=100)
+    assert ring.pop(10, timeout=0.01) is None
+
+
+def test_concurrent_producer_consumer():
+    """A producer thread feeding a consumer loses no samples."""
+    ring = SPSCRing(capacity=4096)
+    total = np.arange(16384, dtype=np.int16)
+
+    def produce():
+        for i in range(0, total.size, 512):
+            while not ring.push(total[i:i + 512]):
+                pass
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+
+    received = [ring.pop(512, timeout=5.0) for _ in range(total.size // 512)]
+    producer.join()
+
+    assert np.array_equal(np.concatenate(received), total)
@@ -1,37 +1,55 @@
 """Test transcriber handling of number sequences."""
 
-import tempfile
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
+from unittest.mock import Mock, MagicMock
+
+import pytest
 
 from voice_assistant.config import TranscriptionConfig, AudioConfig
-from voice_assistant.transcription import WhisperTranscriber
+
+# Fake audio frames; enough for minimum duration. Built once as an
+# immutable tuple instead of a fresh list per test case.
+_SILENT_FRAMES = (b'\x00' * 1024,) * 100
+
+# Number formats that should NOT be filtered as noise
+_NUMBER_CASES = [
+    "5 4 6 1 2",      # Numbers with spaces
+    "12345",          # Pure digits
+    "5, 4, 6, 1, 2",  # Numbers with commas
+]
+
+
+@pytest.fixture(scope="module")
+def transcriber():
+    """One stubbed WhisperTranscriber shared by the parametrized cases.
+
+    Lazy import keeps the whisper stack out of pytest's collection
+    phase. The tempfile/wave/pyaudio stubs skip the per-call WAV
+    framing (the cases only differ in the mocked model output) and are
+    restored on teardown; module scope keeps the stubs from leaking
+    into other files while still amortizing setup across the cases.
+    """
+    import voice_assistant.transcription.whisper as whisper_module
+    from voice_assistant.transcription import WhisperTranscriber
+
+    stubbed = ("WHISPER_AVAILABLE", "whisper", "tempfile", "wave", "pyaudio")
+    old_attrs = {name: getattr(whisper_module, name) for name in stubbed}
+    whisper_module.WHISPER_AVAILABLE = True
+    whisper_module.whisper = MagicMock()
+    whisper_module.tempfile = MagicMock()
+    whisper_module.wave = MagicMock()
+    whisper_module.pyaudio = MagicMock()
+    try:
+        instance = WhisperTranscriber(TranscriptionConfig(), AudioConfig())
+        instance.model = Mock()  # Pin the mock regardless of backend
+        yield instance
+    finally:
+        for name, value in old_attrs.items():
+            setattr(whisper_module, name, value)
 
 
-def test_transcriber_allows_number_sequences():
+@pytest.mark.parametrize("test_text", _NUMBER_CASES)
+def test_transcriber_allows_number_sequences(transcriber, test_text):
     """Test that transcriber doesn't filter out sequences of numbers."""
-    config = TranscriptionConfig()
-    audio_config = AudioConfig()
-    
-    with patch('voice_assistant.transcription.whisper.WHISPER_AVAILABLE', True):
-        with patch('voice_assistant.transcription.whisper.whisper') as mock_whisper:
-            # Mock the model
-            mock_model = Mock()
-            mock_whisper.load_model.return_value = mock_model
-            
-            transcriber = WhisperTranscriber(config, audio_config)
-            
-            # Create fake audio frames
-            audio_frames = [b'\x00' * 1024] * 100  # Enough for minimum duration
-            
-            # Test various number formats that should NOT be filtered
-            test_cases = [
-                "5 4 6 1 2",  # Numbers with spaces
-                "12345",      # Pure digits (currently filtered - this will fail)
-                "5, 4, 6, 1, 2",  # Numbers with commas
-            ]
-            
-            for test_text in test_cases:
-                mock_model.transcribe.return_value = {"text": test_text}
-                result = transcriber.transcribe(audio_frames)
-                assert result == test_text, f"Expected '{test_text}' but got {result}"
\ No newline at end of file
+    transcriber.model.transcribe.return_value = {"text": test_text}
+    result = transcriber.transcribe(_SILENT_FRAMES)
+    assert result == test_text, f"Expected '{test_text}' but got {result}"
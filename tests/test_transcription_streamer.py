@@ -0,0 +1,82 @@
+"""Tests for sliding-window streaming transcription."""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_assistant.transcription.streamer import TranscriptionStreamer
+
+
+class FakeTranscriber:
+    """Records the windows it is asked to transcribe."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe_array(self, audio, initial_prompt=None):
+        self.calls.append((len(audio), initial_prompt))
+        return f"segment{len(self.calls)}"
+
+
+def _wait_idle(streamer, timeout=2.0):
+    deadline = time.time() + timeout
+    while streamer._busy() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_no_audio_finalizes_to_none():
+    """An empty stream produces no text."""
+    streamer = TranscriptionStreamer(FakeTranscriber(), sample_rate=16000)
+    assert streamer.finalize() is None
+
+
+def test_partial_emitted_after_one_hop():
+    """A window is transcribed once a hop's worth of audio has arrived."""
+    transcriber = FakeTranscriber()
+    streamer = TranscriptionStreamer(transcriber, sample_rate=16000)
+
+    streamer.feed(np.zeros(16000, dtype=np.float32))
+    _wait_idle(streamer)
+
+    assert streamer.partial_text == "segment1"
+
+
+def test_finalize_combines_committed_and_tail():
+    """Long audio commits a prefix; finalize appends the tail hypothesis."""
+    transcriber = FakeTranscriber()
+    streamer = TranscriptionStreamer(
+        transcriber, sample_rate=16000, commit_seconds=2.0
+    )
+
+    for _ in range(3):
+        streamer.feed(np.zeros(16000, dtype=np.float32))
+        _wait_idle(streamer)
+
+    assert streamer.committed  # The 2s threshold was crossed and committed
+
+    text = streamer.finalize()
+    assert text.startswith(streamer.committed)
+    assert len(text) > len(streamer.committed)
+
+
+def test_committed_text_used_as_prompt():
+    """The committed prefix is passed as initial_prompt after a commit."""
+    transcriber = FakeTranscriber()
+    streamer = TranscriptionStreamer(
+        transcriber, sample_rate=16000, commit_seconds=1.0
+    )
+
+    streamer.feed(np.zeros(16000, dtype=np.float32))
+    _wait_idle(streamer)
+    # A short tail below the hop threshold is left for finalize
+    streamer.feed(np.zeros(8000, dtype=np.float32))
+    streamer.finalize()
+
+    # First window has no prompt; the tail sees the committed text
+    assert transcriber.calls[0][1] is None
+    assert transcriber.calls[-1][1] == streamer.committed
@@ -0,0 +1,68 @@
+"""Tests for the TTS disk cache."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_assistant.tts import cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temp directory."""
+    target = tmp_path / "tts_cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", target)
+    return target
+
+
+def test_cache_key_is_stable_and_distinct():
+    """Same inputs give the same key; different inputs differ."""
+    key = cache.cache_key("piper", "alan", 1.0, "Hello there")
+    assert key == cache.cache_key("piper", "alan", 1.0, "Hello there")
+    assert key != cache.cache_key("piper", "cori", 1.0, "Hello there")
+    assert key != cache.cache_key("piper", "alan", 1.0, "Hello")
+
+
+def test_get_misses_when_empty(cache_dir):
+    """Lookup on an empty cache returns None."""
+    assert cache.get(cache.cache_key("piper", "alan", 1.0, "Hi")) is None
+
+
+def test_put_then_get_round_trip(cache_dir, tmp_path):
+    """A stored WAV is found again and the temp file is gone."""
+    wav = tmp_path / "synth.wav"
+    wav.write_bytes(b"RIFF")
+
+    key = cache.cache_key("piper", "alan", 1.0, "Hi")
+    cached = cache.put(key, wav)
+
+    assert cached.exists()
+    assert not wav.exists()
+    assert cache.get(key) == cached
+    assert cache.contains(cached)
+
+
+def test_eviction_keeps_newest_entries(cache_dir, tmp_path, monkeypatch):
+    """Oldest entries are evicted beyond MAX_ENTRIES."""
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 2)
+
+    keys = []
+    for i in range(3):
+        wav = tmp_path / f"synth{i}.wav"
+        wav.write_bytes(b"RIFF")
+        key = cache.cache_key("piper", "alan", 1.0, f"text {i}")
+        path = cache.put(key, wav)
+        os.utime(path, (i, i))  # Deterministic mtime ordering
+        keys.append(key)
+
+    # Re-run eviction now that mtimes are set
+    cache._evict()
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
@@ -1,106 +1,63 @@
 """Tests for TTS interruption functionality."""
 
 import pytest
-import threading
-import time
-from unittest.mock import Mock, patch, MagicMock
-import sys
-import select
+from unittest.mock import Mock
 
 from voice_assistant.core.interface import VoiceInterface
-from voice_assistant.config import Config
 
 
 class TestTTSInterruption:
     """Test TTS interruption via ESC key and voice detection."""
-    
+
     @pytest.fixture
-    def interface(self):
+    def interface(self, coqui_config):
         """Create a VoiceInterface instance for testing."""
-        from voice_assistant.config import AudioConfig, VADConfig, TTSConfig, TranscriptionConfig, ProfileConfig
-        
-        config = Config(
-            audio=AudioConfig(),
-            vad=VADConfig(),
-            tts=TTSConfig(engine="coqui"),
-            transcription=TranscriptionConfig(),
-            profiles=ProfileConfig()
-        )
-        interface = VoiceInterface(config)
+        interface = VoiceInterface(coqui_config)
         # Mock the TTS engine
         interface.tts_engine = Mock()
         interface.tts_engine.is_speaking = True
         interface.tts_engine.speak = Mock()
         interface.tts_engine.stop = Mock()
         return interface
-    
+
     def test_esc_stops_tts_playback(self, interface):
-        """Test that pressing ESC during TTS playback stops it immediately."""
-        # Simulate TTS speaking
+        """Test that an ESC press during TTS playback stops it immediately."""
+        # Simulate TTS speaking, then an ESC arriving at the keyboard monitor
         interface.tts_engine.is_speaking = True
-        
-        # Mock stdin to simulate ESC key press
-        with patch('sys.stdin') as mock_stdin:
-            with patch('select.select') as mock_select:
-                with patch('tty.setraw'):
-                    with patch('termios.tcgetattr'):
-                        with patch('termios.tcsetattr'):
-                            # Simulate ESC key available and pressed
-                            mock_select.return_value = ([mock_stdin], [], [])
-                            mock_stdin.read.return_value = '\x1b'  # ESC key
-                            
-                            # Start TTS with some text
-                            def simulate_speaking():
-                                time.sleep(0.1)
-                                interface.tts_engine.is_speaking = False
-                            
-                            speak_thread = threading.Thread(target=simulate_speaking)
-                            speak_thread.start()
-                            
-                            # Call speak which should set up interrupt listener
-                            interface.speak("This is a long text that should be interrupted")
-                            
-                            # Verify TTS was stopped
-                            interface.tts_engine.stop.assert_called()
-    
-    def test_voice_interruption_after_1_second(self, interface):
-        """Test that speaking for 1 second during TTS stops playback."""
-        # Mock audio recorder to simulate voice detection
-        interface.audio_recorder = Mock()
+        interface._on_esc()
+
+        # Verify TTS was stopped
+        interface.tts_engine.stop.assert_called()
+        assert interface.tts_engine.is_speaking == False
+
+    def test_esc_cancels_inflight_claude_query(self, interface):
+        """Test that ESC cancels Claude while the cancel window is open."""
+        interface.claude_client = Mock()
+        interface.tts_engine.is_speaking = False
+
+        interface._start_cancel_listener()
+        try:
+            interface._on_esc()
+        finally:
+            interface._stop_cancel_listener()
+
+        interface.claude_client.cancel.assert_called()
+        assert interface.cancel_requested == True
+
+    def test_voice_interruption_stops_playback(self, interface):
+        """Test that detected speech during TTS stops playback."""
         interface.transcriber = Mock()
-        
-        # Simulate continuous speech for > 1 second
+        interface.transcriber.transcribe = lambda *a, **kw: "Stop talking please"
+
+        # Inject the interruption hook with captured speech frames
         speech_frames = [b'audio_data'] * 10
-        interface.audio_recorder.record_with_amplitude = Mock(return_value=speech_frames)
-        interface.audio_recorder.record_with_vad = Mock(return_value=speech_frames)
-        interface.transcriber.transcribe = Mock(return_value="Stop talking please")
-        
-        # Simulate TTS speaking
-        interface.tts_engine.is_speaking = True
-        
-        # Mock time to simulate 1 second passing
-        with patch('time.time') as mock_time:
-            # First call: speech starts
-            # Second call: check if 1 second passed
-            mock_time.side_effect = [0.0, 1.1, 1.2, 1.3]
-            
-            # Start speaking
-            def simulate_tts():
-                time.sleep(0.2)
-                interface.tts_engine.is_speaking = False
-            
-            tts_thread = threading.Thread(target=simulate_tts)
-            tts_thread.start()
-            
-            # Speak should detect interruption
-            interface.speak("This text will be interrupted by voice")
-            
-            # Wait for threads to finish
-            tts_thread.join(timeout=1)
-            
-            # Verify TTS was stopped
-            interface.tts_engine.stop.assert_called()
-            
-            # Verify interrupted text was captured
-            assert hasattr(interface, '_interrupted_text')
-            assert interface._interrupted_text == "Stop talking please"
\ No newline at end of file
+        interface._interrupt_check = lambda: speech_frames
+
+        interface.speak("This text will be interrupted by voice")
+
+        # Verify TTS was stopped without speaking the text
+        interface.tts_engine.stop.assert_called()
+        interface.tts_engine.speak.assert_not_called()
+
+        # Verify interrupted text was captured
+        assert interface._interrupted_text == "Stop talking please"
@@ -1,7 +1,6 @@
 """Test that TTS engines suppress verbose output."""
 
 import sys
-import io
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -9,6 +8,27 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+class _Sink:
+    """Append-only stdout/stderr capture.
+
+    A list + join is O(total bytes) with no copies, unlike StringIO's
+    buffer growth; print() calls write() once per line anyway.
+    """
+
+    def __init__(self):
+        self.buf = []
+
+    def write(self, s):
+        self.buf.append(s)
+        return len(s)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return ''.join(self.buf)
+
+
 class TestTTSOutputSuppression:
     """Test that TTS engines don't pollute stdout/stderr."""
     
@@ -36,8 +56,8 @@ class TestTTSOutputSuppression:
             # Capture output
             old_stdout = sys.stdout
             old_stderr = sys.stderr
-            captured_stdout = io.StringIO()
-            captured_stderr = io.StringIO()
+            captured_stdout = _Sink()
+            captured_stderr = _Sink()
             sys.stdout = captured_stdout
             sys.stderr = captured_stderr
             
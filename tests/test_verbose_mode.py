@@ -1,7 +1,14 @@
 """Test verbose mode functionality."""
 
+import io
 import json
-from voice_assistant.config import Config
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from voice_assistant.config import (
+    AudioConfig, Config, ProfileConfig, TTSConfig, TranscriptionConfig, VADConfig,
+)
 
 
 def test_verbose_flag_in_config():
@@ -15,12 +22,6 @@ def test_verbose_flag_in_config():
 
 def test_verbose_shows_full_session_id():
     """Test that verbose mode shows full session ID instead of truncated."""
-    import tempfile
-    import uuid
-    from pathlib import Path
-    from unittest.mock import Mock, patch
-    import io
-    
     from voice_assistant.core.claude_client import ClaudeClient
     
     client = ClaudeClient()
@@ -29,8 +30,8 @@ def test_verbose_shows_full_session_id():
         profile_path = Path(tmpdir) / "test_profile"
         profile_path.mkdir(parents=True, exist_ok=True)
         
-        with patch('subprocess.Popen') as mock_popen:
-            mock_process = Mock()
+        with patch('subprocess.Popen', autospec=True) as mock_popen:
+            mock_process = Mock(spec=['communicate', 'returncode'])
             # Return JSON with session ID
             json_response = json.dumps({
                 "type": "result", 
@@ -45,7 +46,6 @@ def test_verbose_shows_full_session_id():
             captured_output = io.StringIO()
             with patch('sys.stdout', new=captured_output):
                 # Create verbose config
-                from voice_assistant.config import AudioConfig, VADConfig, TTSConfig, TranscriptionConfig, ProfileConfig
                 config = Config(
                     audio=AudioConfig(), vad=VADConfig(), tts=TTSConfig(), 
                     transcription=TranscriptionConfig(), profiles=ProfileConfig(),
@@ -78,13 +78,7 @@ def test_interface_passes_config_to_claude_client():
 
 def test_verbose_shows_claude_command():
     """Test that verbose mode shows the full Claude command."""
-    import tempfile
-    from pathlib import Path
-    from unittest.mock import Mock, patch
-    import io
-    
     from voice_assistant.core.claude_client import ClaudeClient
-    from voice_assistant.config import AudioConfig, VADConfig, TTSConfig, TranscriptionConfig, ProfileConfig
     
     client = ClaudeClient()
     
@@ -92,8 +86,8 @@ def test_verbose_shows_claude_command():
         profile_path = Path(tmpdir) / "test_profile"
         profile_path.mkdir(parents=True, exist_ok=True)
         
-        with patch('subprocess.Popen') as mock_popen:
-            mock_process = Mock()
+        with patch('subprocess.Popen', autospec=True) as mock_popen:
+            mock_process = Mock(spec=['communicate', 'returncode'])
             mock_process.communicate.return_value = ("Response", "")
             mock_process.returncode = 0
             mock_popen.return_value = mock_process
@@ -0,0 +1,96 @@
+"""Optional numba-compiled helpers for the audio hot path."""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Action codes returned by vad_step
+VAD_DROP = 0            # Discard chunk
+VAD_HOLD = 1            # Keep chunk in the pre-buffer
+VAD_START = 2           # Speech confirmed: commit pre-buffer, start recording
+VAD_SPEECH = 3          # Keep chunk (speech while recording)
+VAD_SILENCE = 4         # Keep chunk (silence while recording)
+VAD_STOP_SILENCE = 5    # Keep chunk, then stop: trailing silence elapsed
+VAD_STOP_INACTIVE = 6   # Stop: inactivity timeout
+
+
+def vad_step(state, speech_prob, now, start_threshold, continue_threshold,
+             consecutive_needed, silence_duration, inactivity_timeout):
+    """Advance the VAD recording state machine by one chunk.
+
+    ``state`` is a 4-element float64 array: [consecutive_speech_count,
+    recording_started, silence_start_time (-1 when unset),
+    last_activity_time]. Mutated in place; returns one of the VAD_*
+    action codes for the caller to act on. Pure scalar bookkeeping, so
+    numba compiles it when available and the plain function is used
+    otherwise.
+    """
+    if now - state[3] > inactivity_timeout:
+        return VAD_STOP_INACTIVE
+
+    recording = state[1] != 0.0
+    if recording:
+        # Lower threshold to continue recording (avoid cutting off)
+        is_speech = speech_prob > continue_threshold
+    else:
+        # Higher threshold to start recording (avoid false starts)
+        is_speech = speech_prob > start_threshold
+
+    if is_speech:
+        state[0] += 1.0
+        state[3] = now
+        if not recording:
+            if state[0] >= consecutive_needed:
+                state[1] = 1.0
+                state[2] = -1.0
+                return VAD_START
+            return VAD_HOLD if speech_prob > 0.6 else VAD_DROP
+        state[2] = -1.0
+        return VAD_SPEECH
+
+    state[0] = 0.0
+    if not recording:
+        return VAD_HOLD if speech_prob > 0.6 else VAD_DROP
+    if state[2] < 0.0:
+        state[2] = now
+    elif now - state[2] > silence_duration:
+        return VAD_STOP_SILENCE
+    return VAD_SILENCE
+
+
+if NUMBA_AVAILABLE:
+    vad_step = njit(cache=True)(vad_step)
+    # Warm the state-machine JIT at import like scan_chunk below
+    vad_step(np.zeros(4), 0.0, 0.0, 0.85, 0.5, 3.0, 1.0, 60.0)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def scan_chunk(samples, threshold):
+        """Return (rms, is_silent) for one int16 chunk in a single compiled pass."""
+        n = samples.shape[0]
+        if n == 0:
+            return 0.0, True
+        acc = 0.0
+        for i in range(n):
+            v = float(samples[i])
+            acc += v * v
+        rms = (acc / n) ** 0.5
+        return rms, rms <= threshold
+
+    # Warm the JIT once at import so the first real chunk isn't slow
+    scan_chunk(np.zeros(1024, dtype=np.int16), 0.0)
+else:
+    def scan_chunk(samples, threshold):
+        """Return (rms, is_silent) for one int16 chunk (NumPy fallback)."""
+        if samples.size == 0:
+            return 0.0, True
+        # Single multiply-accumulate pass; int64 accumulator avoids overflow
+        a = samples.astype(np.int64)
+        rms = float(np.sqrt(a.dot(a) / a.size))
+        return rms, rms <= threshold
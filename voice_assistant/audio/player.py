@@ -5,6 +5,8 @@ import threading
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 try:
     import sounddevice as sd
     import soundfile as sf
@@ -21,6 +23,13 @@ class AudioPlayer:
         self.is_playing = False
         self.cancel_requested = False
         self._lock = threading.Lock()
+        # paplay volume argument derived once, not per playback
+        self._paplay_vol = str(int(volume * 100) * 655)
+
+    def set_volume(self, volume: float):
+        """Update playback volume and the derived paplay argument."""
+        self.volume = volume
+        self._paplay_vol = str(int(volume * 100) * 655)
     
     def play_file(self, audio_file: Path, blocking: bool = True) -> bool:
         """Play an audio file."""
@@ -45,10 +54,15 @@ class AudioPlayer:
     def _play_with_sounddevice(self, audio_file: Path, blocking: bool) -> bool:
         """Play audio using sounddevice."""
         try:
-            data, samplerate = sf.read(str(audio_file))
-            
+            # Decode straight to float32 (sounddevice's native format) -
+            # half the memory of the default float64 - and scale in place
+            # instead of allocating a second full-length buffer
+            data, samplerate = sf.read(
+                str(audio_file), dtype='float32', always_2d=False
+            )
+
             # Apply volume
-            data = data * self.volume
+            data *= np.float32(self.volume)
             
             if blocking:
                 sd.play(data, samplerate)
@@ -61,17 +75,62 @@ class AudioPlayer:
             print(f"Error playing audio with sounddevice: {e}")
             return False
     
+    def play_stream(self, chunks, sample_rate: int, channels: int = 1) -> bool:
+        """Play an iterable of raw int16 PCM chunks as they arrive.
+
+        Lets a synthesizer's stdout feed the sound device directly, so
+        playback starts before synthesis finishes. Returns False without
+        consuming the iterable when sounddevice is unavailable, letting
+        the caller fall back to file playback.
+        """
+        if not SOUNDDEVICE_AVAILABLE:
+            return False
+
+        with self._lock:
+            if self.is_playing:
+                return False
+            self.is_playing = True
+            self.cancel_requested = False
+
+        try:
+            scale = np.float32(self.volume / 32768.0)
+            with sd.OutputStream(
+                samplerate=sample_rate, channels=channels, dtype='float32'
+            ) as stream:
+                for chunk in chunks:
+                    if self.cancel_requested:
+                        break
+                    if not chunk:
+                        continue
+                    samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+                    samples *= scale
+                    stream.write(samples.reshape(-1, channels))
+            return not self.cancel_requested
+        except Exception as e:
+            print(f"Error streaming audio: {e}")
+            return False
+        finally:
+            with self._lock:
+                self.is_playing = False
+
     def _play_with_paplay(self, audio_file: Path, blocking: bool) -> bool:
         """Play audio using paplay (PulseAudio)."""
         try:
-            volume_percent = int(self.volume * 100)
-            cmd = ["paplay", "--volume", str(volume_percent * 655), str(audio_file)]
-            
+            cmd = ["paplay", "--volume", self._paplay_vol, str(audio_file)]
+
             if blocking:
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
                 return result.returncode == 0
             else:
-                subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                # close_fds keeps the spawn on the fast posix_spawn path;
+                # a new session detaches paplay from our signal handling
+                subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    start_new_session=True,
+                )
                 return True
         except Exception as e:
             print(f"Error playing audio with paplay: {e}")
@@ -1,10 +1,14 @@
 """Audio recording with VAD support."""
 
 import collections
+import functools
 import json
-import struct
+import mmap
+import os
 import sys
+import threading
 import time
+import wave
 from pathlib import Path
 from typing import Optional, List
 
@@ -12,20 +16,185 @@ import numpy as np
 import pyaudio
 
 try:
-    import torch
-    from silero_vad import load_silero_vad
-    VAD_AVAILABLE = True
-except ImportError:
+    # sounddevice raises OSError (not ImportError) when libportaudio is missing
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
+# torch costs hundreds of ms to import; probe for it cheaply here and
+# defer the real import to _load_vad_model so the amplitude-only path
+# never pays for it
+try:
+    import importlib.util
+    VAD_AVAILABLE = (
+        importlib.util.find_spec("torch") is not None
+        and importlib.util.find_spec("silero_vad") is not None
+    )
+except (ImportError, ValueError):
     VAD_AVAILABLE = False
 
+torch = None  # bound by _load_vad_model on first use
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from .resampler import AudioResampler
     RESAMPLER_AVAILABLE = True
 except ImportError:
     RESAMPLER_AVAILABLE = False
 
+from ._jit import (
+    VAD_DROP,
+    VAD_HOLD,
+    VAD_SILENCE,
+    VAD_SPEECH,
+    VAD_START,
+    VAD_STOP_INACTIVE,
+    VAD_STOP_SILENCE,
+    scan_chunk,
+    vad_step,
+)
+from .ring import SPSCRing
 from ..config import AudioConfig, VADConfig
 
+# Cached at module scope so the hot amplitude path doesn't rebuild the dtype
+_SAMPLE_DTYPE = np.dtype(np.int16)
+
+# Longest utterance the preallocated recording arena can hold
+_MAX_UTTERANCE_SECONDS = 120
+
+# Whisper expects float32 in [-1, 1]
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Process-wide VAD model cache so re-creating recorders (e.g. on mode
+# switches) doesn't pay the ~1-2s Silero load again
+_VAD_CACHE: dict = {}
+
+# Shared PortAudio handle: initialization is expensive (hundreds of ms)
+# and holds ALSA/pulse resources, so all recorders reuse one instance
+_PA_LOCK = threading.Lock()
+_PA_INSTANCE = None
+
+
+def _get_pyaudio():
+    """Return the process-global PyAudio handle, creating it on first use."""
+    global _PA_INSTANCE
+    with _PA_LOCK:
+        if _PA_INSTANCE is None:
+            _PA_INSTANCE = pyaudio.PyAudio()
+        return _PA_INSTANCE
+
+
+@functools.lru_cache(maxsize=1)
+def _load_calibration_cached(path: str, mtime_ns: int):
+    """Decode the calibration file once per mtime.
+
+    Keyed on mtime so a recalibration invalidates the entry; recorders
+    constructed in between share the parse instead of re-reading the file.
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(path).read_bytes())
+        with open(path) as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _load_vad_model():
+    """Load the Silero VAD model, cached process-wide and warmed up."""
+    global torch
+    import torch
+    from silero_vad import load_silero_vad
+
+    model = _VAD_CACHE.get("silero")
+    if model is None:
+        model = load_silero_vad()
+        model.eval()
+        try:
+            # int8 weights halve memory bandwidth for the tiny per-chunk model
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            )
+        except Exception:
+            pass  # scripted models can't always be dynamically quantized
+        # One dummy forward so the first real chunk doesn't pay JIT warm-up
+        with torch.inference_mode():
+            model(torch.zeros(512), 16000)
+        _VAD_CACHE["silero"] = model
+    return model
+
+
+class _CallbackInputStream:
+    """Adapter exposing a blocking read() over a sounddevice callback stream.
+
+    The portaudio callback pushes frames into a lock-free ring as they
+    arrive, so capture latency is set by the device rather than a Python
+    read loop, and the callback never blocks on a queue mutex.
+    """
+
+    def __init__(self, sample_rate: int, channels: int):
+        # Half a second of headroom between callback and consumer
+        self._ring = SPSCRing(sample_rate // 2)
+        self._sample_rate = sample_rate
+        self._priority_set = False
+        self._stream = sd.RawInputStream(
+            samplerate=sample_rate,
+            blocksize=0,
+            dtype="int16",
+            channels=channels,
+            latency="low",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def _callback(self, indata, frames, time_info, status):
+        if not self._priority_set:
+            # Runs on the portaudio thread, so this promotes the right thread
+            self._priority_set = True
+            self._promote_callback_thread()
+        self._ring.push(np.frombuffer(bytes(indata), dtype=_SAMPLE_DTYPE))
+
+    @staticmethod
+    def _promote_callback_thread():
+        """Promote the capture thread to real-time priority to avoid xruns.
+
+        Needs CAP_SYS_NICE or an rtprio ulimit; silently stays at normal
+        priority otherwise.
+        """
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (AttributeError, PermissionError, OSError):
+            try:
+                os.nice(-10)
+            except OSError:
+                pass
+
+    def read(self, chunk_size: int, exception_on_overflow: bool = False) -> bytes:
+        """Return exactly chunk_size frames, blocking until available.
+
+        The wait is bounded well above one chunk's duration: a stalled
+        device (or a stream whose callback never fires) yields silence
+        instead of hanging the caller, so recording loops keep observing
+        their own timeouts.
+        """
+        timeout = chunk_size / self._sample_rate + 1.0
+        samples = self._ring.pop(chunk_size, timeout=timeout)
+        if samples is None:
+            return bytes(chunk_size * _SAMPLE_DTYPE.itemsize)
+        return samples.tobytes()
+
+    def stop_stream(self):
+        self._stream.stop()
+
+    def close(self):
+        self._stream.close()
+
 
 class AudioRecorder:
     """Handles audio recording with optional VAD support."""
@@ -34,12 +203,23 @@ class AudioRecorder:
         self.audio_config = audio_config
         self.vad_config = vad_config
         self.verbose = verbose
-        self.audio = pyaudio.PyAudio()
         self.vad_model = None
-        
-        # Detect device sample rate
-        device_info = self.audio.get_default_input_device_info()
-        self.device_sample_rate = int(device_info['defaultSampleRate'])
+
+        # Detect device sample rate (prefer sounddevice's callback API,
+        # fall back to blocking PyAudio when libportaudio bindings are absent)
+        if SOUNDDEVICE_AVAILABLE:
+            self.audio = None
+            device_info = sd.query_devices(kind="input")
+            self.device_sample_rate = int(device_info['default_samplerate'])
+        else:
+            self.audio = _get_pyaudio()
+            device_info = self.audio.get_default_input_device_info()
+            self.device_sample_rate = int(device_info['defaultSampleRate'])
+            # Resolve the PyAudio sample format constant once instead of a
+            # string-built getattr on every stream open
+            self._pa_format = getattr(
+                pyaudio, f"pa{self.audio_config.format.title()}"
+            )
         
         if verbose:
             print(f"🎤 Detected device sample rate: {self.device_sample_rate} Hz")
@@ -59,60 +239,152 @@ class AudioRecorder:
         # Initialize VAD if available and enabled
         if VAD_AVAILABLE and vad_config.enabled:
             try:
-                self.vad_model = load_silero_vad()
+                self.vad_model = _load_vad_model()
+                # The per-chunk model is tiny; OpenMP fan-out costs more
+                # than it saves, and a reusable tensor (sharing storage
+                # with its numpy view) avoids a fresh allocation per chunk
+                torch.set_num_threads(1)
+                self._vad_tensor = torch.empty(
+                    vad_config.chunk_size, dtype=torch.float32
+                )
+                self._vad_np = self._vad_tensor.numpy()
                 print("✓ Silero VAD initialized")
             except Exception as e:
                 print(f"Warning: Could not load VAD model: {e}")
                 self.vad_model = None
         
+        # Preallocated recording arena: chunks are written in-place via a
+        # cursor instead of appending bytes objects in the capture loop
+        self._record_buf = np.empty(
+            audio_config.sample_rate * _MAX_UTTERANCE_SECONDS, dtype=_SAMPLE_DTYPE
+        )
+
+        # Parallel float32 arena, normalized during capture so transcription
+        # can consume it directly without another int16->float32 pass
+        self._record_f32 = np.empty(self._record_buf.size, dtype=np.float32)
+        self._f32_valid = 0
+
+        # How many consecutive silent chunks end a recording - computed once
+        # instead of re-deriving the silence time every loop iteration
+        self._silence_chunk_limit = (
+            audio_config.silence_duration * audio_config.sample_rate / audio_config.chunk_size
+        )
+
+        # Rolling per-chunk amplitude history; end-of-speech is decided by a
+        # vectorized scan over this ring instead of a branchy Python counter
+        hist_len = int(max(64, self._silence_chunk_limit * 2))
+        self._amp_hist = np.zeros(hist_len, dtype=np.float32)
+
         # Load or calibrate noise floor
         self._load_calibration()
     
     def _load_calibration(self):
         """Load saved noise floor calibration."""
         calibration_file = Path.home() / ".claude" / "noise_calibration.json"
-        if calibration_file.exists():
+        if not calibration_file.exists():
+            return
+        try:
+            data = _load_calibration_cached(
+                str(calibration_file), calibration_file.stat().st_mtime_ns
+            )
+        except OSError:
+            # File vanished between exists() and stat(): uncached read
             try:
                 with open(calibration_file) as f:
                     data = json.load(f)
-                    self.audio_config.noise_floor = data.get("noise_floor")
-                    if self.audio_config.noise_floor:
-                        adaptive_threshold = self.audio_config.noise_floor * 3
-                        self.audio_config.silence_threshold = max(
-                            adaptive_threshold, self.audio_config.silence_threshold
-                        )
             except Exception:
-                pass
-    
+                data = None
+        if data is None:
+            return
+        self.audio_config.noise_floor = data.get("noise_floor")
+        if self.audio_config.noise_floor:
+            adaptive_threshold = self.audio_config.noise_floor * 3
+            self.audio_config.silence_threshold = max(
+                adaptive_threshold, self.audio_config.silence_threshold
+            )
+
     def _save_calibration(self):
         """Save noise floor calibration."""
         calibration_file = Path.home() / ".claude" / "noise_calibration.json"
         calibration_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         with open(calibration_file, "w") as f:
             json.dump({"noise_floor": self.audio_config.noise_floor}, f)
+        _load_calibration_cached.cache_clear()
     
-    def calibrate_noise_floor(self):
-        """Calibrate the noise floor for better silence detection."""
-        print("🎤 Calibrating noise floor... Please remain quiet for 3 seconds.")
-        
-        stream = self.audio.open(
-            format=getattr(pyaudio, f"pa{self.audio_config.format.title()}"),
+    def _open_stream(self, chunk_size: int):
+        """Open an input stream, preferring the low-latency callback API."""
+        if SOUNDDEVICE_AVAILABLE:
+            return _CallbackInputStream(
+                self.audio_config.sample_rate, self.audio_config.channels
+            )
+        return self.audio.open(
+            format=self._pa_format,
             channels=self.audio_config.channels,
             rate=self.audio_config.sample_rate,
             input=True,
-            frames_per_buffer=self.audio_config.chunk_size,
+            frames_per_buffer=chunk_size,
         )
-        
-        amplitudes = []
-        for _ in range(self.audio_config.calibration_samples):
-            data = stream.read(self.audio_config.chunk_size, exception_on_overflow=False)
-            amplitude = self._get_audio_amplitude(data)
-            amplitudes.append(amplitude)
-        
-        stream.stop_stream()
-        stream.close()
-        
+
+    def _calibration_audio_path(self) -> Path:
+        """Path of the cached calibration recording."""
+        return Path.home() / ".claude" / "calibration_audio.wav"
+
+    def _load_cached_calibration_audio(self) -> Optional[np.ndarray]:
+        """Memory-map previously recorded calibration audio, if compatible."""
+        path = self._calibration_audio_path()
+        if not path.exists():
+            return None
+        try:
+            with wave.open(str(path), "rb") as wf:
+                if wf.getframerate() != self.audio_config.sample_rate:
+                    return None
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # 44-byte canonical PCM header written by the wave module
+            return np.frombuffer(mm, dtype=_SAMPLE_DTYPE, offset=44)
+        except (OSError, ValueError, wave.Error):
+            return None
+
+    def _save_calibration_audio(self, frames: List[bytes]):
+        """Cache the calibration recording for later re-calibration."""
+        path = self._calibration_audio_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(self.audio_config.channels)
+            wf.setsampwidth(_SAMPLE_DTYPE.itemsize)
+            wf.setframerate(self.audio_config.sample_rate)
+            wf.writeframes(b"".join(frames))
+
+    def calibrate_noise_floor(self):
+        """Calibrate the noise floor for better silence detection."""
+        cached = self._load_cached_calibration_audio()
+        if cached is not None:
+            # Recompute from the cached recording instead of re-recording
+            print("🎤 Recalibrating from cached audio...")
+            chunk = self.audio_config.chunk_size
+            n_chunks = cached.size // chunk
+            window = cached[:n_chunks * chunk].astype(np.int32).reshape(n_chunks, chunk)
+            amplitudes = np.sqrt(np.mean(np.square(window), axis=1))
+        else:
+            print("🎤 Calibrating noise floor... Please remain quiet for 3 seconds.")
+
+            stream = self._open_stream(self.audio_config.chunk_size)
+
+            frames = []
+            # Preallocated buffer: mean/std below stay in NumPy instead of
+            # re-boxing a Python list of floats
+            amplitudes = np.empty(self.audio_config.calibration_samples, dtype=np.float32)
+            for i in range(self.audio_config.calibration_samples):
+                data = stream.read(self.audio_config.chunk_size, exception_on_overflow=False)
+                frames.append(data)
+                amplitudes[i] = self._get_audio_amplitude(data)
+
+            stream.stop_stream()
+            stream.close()
+
+            self._save_calibration_audio(frames)
+
         # Calculate noise floor as mean + 2 standard deviations
         self.audio_config.noise_floor = np.mean(amplitudes) + 2 * np.std(amplitudes)
         
@@ -126,220 +398,375 @@ class AudioRecorder:
         print(f"✓ Silence threshold: {self.audio_config.silence_threshold:.0f}")
     
     def _get_audio_amplitude(self, data: bytes) -> float:
-        """Calculate amplitude of audio data."""
-        count = len(data) / 2
-        format_str = f"{int(count)}h"
-        shorts = struct.unpack(format_str, data)
-        return np.sqrt(np.mean(np.square(shorts)))
+        """Calculate RMS amplitude of audio data."""
+        return self._rms(np.frombuffer(data, dtype=_SAMPLE_DTYPE))
+
+    @staticmethod
+    def _rms(samples: np.ndarray) -> float:
+        """Calculate RMS amplitude of int16 samples."""
+        return scan_chunk(samples, 0.0)[0]
     
     def record_with_vad(self, timeout: Optional[float] = None, quiet: bool = False) -> Optional[List[bytes]]:
         """Record audio using Voice Activity Detection."""
         if not self.vad_model:
             return self.record_with_amplitude(timeout, quiet=quiet)
-        
-        stream = self.audio.open(
-            format=getattr(pyaudio, f"pa{self.audio_config.format.title()}"),
-            channels=self.audio_config.channels,
-            rate=self.audio_config.sample_rate,
-            input=True,
-            frames_per_buffer=self.vad_config.chunk_size,
-        )
-        
-        frames = []
+
+        stream = self._open_stream(self.vad_config.chunk_size)
+
+        # Kept chunks go into the preallocated arena; frames are tracked
+        # as (start, end) index pairs instead of per-chunk bytes objects
+        buf = self._record_buf
+        write_pos = 0
+        chunk_bounds: List[tuple] = []
         pre_buffer = collections.deque(maxlen=self.vad_config.pre_buffer_size)
         recording_started = False
-        speech_detected = False
-        consecutive_speech_count = 0
-        silence_start_time = None
         start_time = time.time()
-        last_activity_time = time.time()
-        
+
+        # Scalar bookkeeping lives in a compact state vector advanced by
+        # the (optionally numba-compiled) vad_step state machine:
+        # [consecutive_speech, recording_started, silence_start, last_activity]
+        state = np.array([0.0, 0.0, -1.0, start_time])
+
         if not quiet:
             print("🎤 Listening... (speak now)")
-        
+
+        # Batched visual feedback: a write+flush per chunk is a syscall
+        # every ~30 ms, so indicator glyphs are buffered and pushed out at
+        # most every 100 ms (and before any interleaved print)
+        feedback: List[str] = []
+        last_feedback_flush = time.monotonic()
+
+        def _emit(char: Optional[str] = None) -> None:
+            nonlocal last_feedback_flush
+            if char is not None:
+                feedback.append(char)
+            now = time.monotonic()
+            if feedback and (char is None or now - last_feedback_flush > 0.1):
+                sys.stdout.write("".join(feedback))
+                sys.stdout.flush()
+                feedback.clear()
+                last_feedback_flush = now
+
         try:
             while True:
                 # Check timeout
                 if timeout and (time.time() - start_time) > timeout:
                     if not recording_started:
                         break
-                
-                # Check inactivity timeout
-                if (time.time() - last_activity_time) > self.vad_config.inactivity_timeout:
-                    print("\n⏱️ Inactivity timeout - returning to wake mode")
-                    break
-                
+
                 # Read audio chunk
                 data = stream.read(self.vad_config.chunk_size, exception_on_overflow=False)
-                
-                # Convert to float32 for VAD
-                audio_int16 = np.frombuffer(data, dtype=np.int16)
-                audio_float32 = audio_int16.astype(np.float32) / 32768.0
-                
-                # Get speech probability from VAD
-                speech_prob = self.vad_model(
-                    torch.from_numpy(audio_float32), self.audio_config.sample_rate
-                ).item()
-                
-                # Determine if this chunk contains speech
-                if recording_started:
-                    # Lower threshold to continue recording (avoid cutting off)
-                    is_speech = speech_prob > self.vad_config.speech_continue_threshold
+
+                samples = np.frombuffer(data, dtype=_SAMPLE_DTYPE)
+
+                # Normalize straight into the reusable tensor's storage;
+                # inference_mode skips autograd bookkeeping entirely
+                if samples.size == self._vad_np.size:
+                    np.multiply(samples, _INT16_SCALE, out=self._vad_np)
+                    vad_input = self._vad_tensor
                 else:
-                    # Higher threshold to start recording (avoid false starts)
-                    is_speech = speech_prob > self.vad_config.speech_start_threshold
-                
-                # Keep a rolling pre-buffer of chunks that might be speech
-                if not recording_started and speech_prob > 0.6:
-                    pre_buffer.append(data)
-                    if not quiet and speech_prob > 0.7:
-                        # Visual feedback: medium probability speech in pre-buffer
-                        sys.stdout.write("▓")
-                        sys.stdout.flush()
-                
-                if is_speech:
-                    consecutive_speech_count += 1
-                    last_activity_time = time.time()
-                    
-                    # Use consecutive_speech_needed for initial detection
-                    required_chunks = (
-                        self.vad_config.consecutive_speech_needed 
-                        if not recording_started 
-                        else self.vad_config.min_speech_chunks
+                    vad_input = torch.from_numpy(
+                        np.multiply(samples, _INT16_SCALE, dtype=np.float32)
                     )
-                    
-                    if not recording_started and consecutive_speech_count >= required_chunks:
-                        if not quiet:
-                            print(f"\n🗣️ Speech detected! (prob: {speech_prob:.2f})")
-                        recording_started = True
-                        speech_detected = True
-                        # Add pre-buffer to capture speech onset
-                        frames.extend(pre_buffer)
-                        pre_buffer.clear()
-                    
-                    if recording_started:
-                        frames.append(data)
-                        silence_start_time = None
-                        if not quiet:
-                            # Visual feedback: high probability speech
-                            sys.stdout.write("█")
-                            sys.stdout.flush()
-                else:
-                    consecutive_speech_count = 0
-                    
+                with torch.inference_mode():
+                    speech_prob = self.vad_model(
+                        vad_input, self.audio_config.sample_rate
+                    ).item()
+
+                action = vad_step(
+                    state,
+                    speech_prob,
+                    time.time(),
+                    self.vad_config.speech_start_threshold,
+                    self.vad_config.speech_continue_threshold,
+                    self.vad_config.consecutive_speech_needed,
+                    self.audio_config.silence_duration,
+                    self.vad_config.inactivity_timeout,
+                )
+
+                if action == VAD_STOP_INACTIVE:
+                    _emit()
+                    print("\n⏱️ Inactivity timeout - returning to wake mode")
+                    break
+                if action == VAD_DROP:
+                    continue
+
+                # Any other action keeps the chunk: write it into the arena
+                end = write_pos + samples.size
+                if end > buf.size:
                     if recording_started:
-                        frames.append(data)
+                        # Arena full - stop recording rather than grow
                         if not quiet:
-                            # Visual feedback: silence during recording
-                            sys.stdout.write("░")
-                            sys.stdout.flush()
-                        
-                        if silence_start_time is None:
-                            silence_start_time = time.time()
-                        elif (time.time() - silence_start_time) > self.audio_config.silence_duration:
-                            if not quiet:
-                                print("\n✓ Recording complete")
-                            break
-        
+                            _emit()
+                            print("\n✓ Recording complete")
+                        break
+                    # Still waiting for speech: reclaim the arena
+                    write_pos = 0
+                    end = samples.size
+                    pre_buffer.clear()
+                buf[write_pos:end] = samples
+                bounds = (write_pos, end)
+                write_pos = end
+
+                if action == VAD_HOLD:
+                    # Rolling pre-buffer of chunks that might be speech
+                    pre_buffer.append(bounds)
+                    if not quiet and speech_prob > 0.7:
+                        # Visual feedback: medium probability speech in pre-buffer
+                        _emit("▓")
+                elif action == VAD_START:
+                    if not quiet:
+                        _emit()
+                        print(f"\n🗣️ Speech detected! (prob: {speech_prob:.2f})")
+                    recording_started = True
+                    # Add pre-buffer to capture speech onset
+                    pre_buffer.append(bounds)
+                    chunk_bounds.extend(pre_buffer)
+                    pre_buffer.clear()
+                    chunk_bounds.append(bounds)
+                elif action == VAD_SPEECH:
+                    chunk_bounds.append(bounds)
+                    if not quiet:
+                        # Visual feedback: high probability speech
+                        _emit("█")
+                elif action == VAD_SILENCE:
+                    chunk_bounds.append(bounds)
+                    if not quiet:
+                        # Visual feedback: silence during recording
+                        _emit("░")
+                elif action == VAD_STOP_SILENCE:
+                    chunk_bounds.append(bounds)
+                    if not quiet:
+                        _emit()
+                        print("\n✓ Recording complete")
+                    break
+
         except KeyboardInterrupt:
+            _emit()
             print("\n⚠️ Cancelled")
             return None
         finally:
             stream.stop_stream()
             stream.close()
-        
-        if not frames or not recording_started:
+
+        if not chunk_bounds or not recording_started:
             return None
-        
+
+        # Materialize frames once from the contiguous arena
+        frames = [buf[start:end].tobytes() for start, end in chunk_bounds]
+
         # Smart trimming using VAD
         frames = self._trim_silence_with_vad(frames)
-        
+
         return frames
     
     def _trim_silence_with_vad(self, frames: List[bytes]) -> List[bytes]:
         """Trim silence from the end using VAD."""
         if not self.vad_model or len(frames) < 20:
             return frames
-        
-        # Find last speech frame
+
+        # Find last speech frame. A cheap RMS-style energy gate bounds the
+        # search first: the last energetic frame is an upper bound on the
+        # last speech frame, so the VAD model only scores a small window
+        # around it instead of every chunk in the recording
         last_speech_index = len(frames) - 1
-        for i in range(len(frames) - 1, -1, -1):
-            audio_int16 = np.frombuffer(frames[i], dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-            speech_prob = self.vad_model(
-                torch.from_numpy(audio_float32), self.audio_config.sample_rate
-            ).item()
-            
-            if speech_prob > 0.6:
-                last_speech_index = i
-                break
-        
+        try:
+            batch = np.stack(
+                [np.frombuffer(f, dtype=_SAMPLE_DTYPE) for f in frames]
+            ).astype(np.float32)
+            energies = np.abs(batch).mean(axis=1)
+            floor = self.audio_config.noise_floor
+            threshold = floor * 2 if floor else float(energies.max()) * 0.1
+            energetic = np.flatnonzero(energies > threshold)
+            bound = int(energetic[-1]) if energetic.size else len(frames) - 1
+
+            window = batch[max(0, bound - 9):bound + 1]
+            window = window * float(_INT16_SCALE)
+            with torch.inference_mode():
+                probs = self.vad_model(
+                    torch.from_numpy(window), self.audio_config.sample_rate
+                )
+            voiced = np.flatnonzero(np.asarray(probs).reshape(-1) > 0.6)
+            if voiced.size:
+                last_speech_index = max(0, bound - 9) + int(voiced[-1])
+            else:
+                # Nothing voiced in the window - trust the energy bound
+                last_speech_index = bound
+        except Exception:
+            # Fallback (e.g. model rejects the batch dim): backward scan
+            for i in range(len(frames) - 1, -1, -1):
+                audio_int16 = np.frombuffer(frames[i], dtype=np.int16)
+                audio_float32 = np.multiply(audio_int16, _INT16_SCALE, dtype=np.float32)
+                with torch.inference_mode():
+                    speech_prob = self.vad_model(
+                        torch.from_numpy(audio_float32), self.audio_config.sample_rate
+                    ).item()
+                if speech_prob > 0.6:
+                    last_speech_index = i
+                    break
+
         # Keep a small amount of silence after speech (10 chunks ~= 320ms)
         trim_index = min(last_speech_index + 10, len(frames))
         return frames[:trim_index]
     
-    def record_with_amplitude(self, timeout: Optional[float] = None, quiet: bool = False) -> Optional[List[bytes]]:
-        """Record audio using amplitude-based detection (fallback)."""
-        stream = self.audio.open(
-            format=getattr(pyaudio, f"pa{self.audio_config.format.title()}"),
-            channels=self.audio_config.channels,
-            rate=self.audio_config.sample_rate,
-            input=True,
-            frames_per_buffer=self.audio_config.chunk_size,
-        )
+    def record_with_amplitude(
+        self,
+        timeout: Optional[float] = None,
+        quiet: bool = False,
+        streamer=None,
+        cancel_event=None,
+    ) -> Optional[List[bytes]]:
+        """Record audio using amplitude-based detection (fallback).
+
+        If a TranscriptionStreamer is given, captured samples are fed to it
+        as they arrive so transcription overlaps the recording.
+
+        If a cancel_event (threading.Event) is given, the loop aborts and
+        returns None within one chunk (~30 ms) of it being set, instead of
+        running out the remaining timeout.
+        """
+        stream = self._open_stream(self.audio_config.chunk_size)
         
-        frames = []
-        silent_chunks = 0
+        # Write into the preallocated arena instead of appending bytes objects
+        buf = self._record_buf
+        write_pos = 0
+        chunk_ends: List[int] = []
+        hist_pos = 0
         recording_started = False
         start_time = time.time()
-        
+
         if not quiet:
             print("🎤 Listening... (amplitude-based)")
-        
+
         try:
             while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
                 if timeout and (time.time() - start_time) > timeout:
                     if not recording_started:
                         break
-                
+
                 data = stream.read(self.audio_config.chunk_size, exception_on_overflow=False)
-                amplitude = self._get_audio_amplitude(data)
-                
-                if amplitude > self.audio_config.silence_threshold:
+                samples = np.frombuffer(data, dtype=_SAMPLE_DTYPE)
+                # Digital silence short-circuits the RMS scan entirely
+                if not samples.any():
+                    amplitude, is_silent = 0.0, True
+                else:
+                    # Single (optionally JIT-compiled) pass for amplitude + silence
+                    amplitude, is_silent = scan_chunk(
+                        samples, float(self.audio_config.silence_threshold)
+                    )
+
+                self._amp_hist[hist_pos % self._amp_hist.size] = amplitude
+                hist_pos += 1
+
+                if not is_silent:
                     if not recording_started:
                         if not quiet:
                             print("💬 Speech detected, recording...")
                         recording_started = True
-                    frames.append(data)
-                    silent_chunks = 0
-                elif recording_started:
-                    frames.append(data)
-                    silent_chunks += 1
-                    
-                    silence_time = (
-                        silent_chunks * self.audio_config.chunk_size / self.audio_config.sample_rate
-                    )
-                    if silence_time > self.audio_config.silence_duration:
-                        if not quiet:
-                            print("✓ Recording complete")
-                        break
-        
+                elif not recording_started:
+                    continue
+
+                end = write_pos + samples.size
+                if end > buf.size:
+                    # Arena full - stop recording rather than grow
+                    if not quiet:
+                        print("✓ Recording complete")
+                    break
+                buf[write_pos:end] = samples
+                # Fused scale-and-store into the float32 arena
+                np.multiply(samples, _INT16_SCALE, out=self._record_f32[write_pos:end])
+                if streamer is not None:
+                    streamer.feed(self._record_f32[write_pos:end])
+                write_pos = end
+                chunk_ends.append(end)
+
+                if is_silent and self._silent_tail(hist_pos) > self._silence_chunk_limit:
+                    if not quiet:
+                        print("✓ Recording complete")
+                    break
+
         except KeyboardInterrupt:
             print("\n⚠️ Cancelled")
             return None
         finally:
             stream.stop_stream()
             stream.close()
-        
-        if not frames:
+
+        if not chunk_ends:
+            self._f32_valid = 0
             return None
-        
+
         # Trim silence from the end
-        if len(frames) > 20:
-            frames = frames[:-10]
-        
+        if len(chunk_ends) > 20:
+            chunk_ends = chunk_ends[:-10]
+
+        self._f32_valid = chunk_ends[-1]
+
+        # Materialize frames once from the contiguous arena
+        frames = []
+        start = 0
+        for end in chunk_ends:
+            frames.append(buf[start:end].tobytes())
+            start = end
+
         return frames
     
+    def frames_rms(self, frames: List[bytes]) -> float:
+        """Root-mean-square amplitude across a list of captured frames.
+
+        One vectorized pass; cheap enough to gate expensive work (e.g.
+        transcription) on whether a recording carries real voice energy.
+        """
+        samples = np.frombuffer(b"".join(frames), dtype=_SAMPLE_DTYPE)
+        if samples.size == 0:
+            return 0.0
+        a = samples.astype(np.int64)
+        return float(np.sqrt(a.dot(a) / a.size))
+
+    def _silent_tail(self, hist_pos: int) -> int:
+        """Length of the trailing silent-chunk run in the amplitude history."""
+        hist = self._amp_hist
+        n = min(hist_pos, hist.size)
+        if n == 0:
+            return 0
+        # Unroll the ring into chronological order for the last n entries
+        idx = (hist_pos - n + np.arange(n)) % hist.size
+        voiced = hist[idx] > self.audio_config.silence_threshold
+        if not voiced.any():
+            return n
+        # argmax over the reversed mask finds the most recent voiced chunk
+        return int(np.argmax(voiced[::-1]))
+
+    def get_last_utterance_f32(self) -> Optional[np.ndarray]:
+        """Get a normalized float32 view of the last amplitude recording.
+
+        Returns None if nothing has been recorded yet. The view aliases the
+        internal arena, so it is only valid until the next recording.
+        """
+        if self._f32_valid == 0:
+            return None
+        return self._record_f32[:self._f32_valid]
+
     def cleanup(self):
-        """Clean up audio resources."""
-        self.audio.terminate()
\ No newline at end of file
+        """Release audio resources.
+
+        The PortAudio handle is shared process-wide; terminating it here
+        drops the global reference so the next recorder re-creates it
+        lazily rather than using a dead handle.
+        """
+        global _PA_INSTANCE
+        if self.audio is not None:
+            with _PA_LOCK:
+                if _PA_INSTANCE is self.audio:
+                    _PA_INSTANCE = None
+            self.audio.terminate()
+            self.audio = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False
\ No newline at end of file
@@ -1,13 +1,47 @@
 """Audio resampling utilities for optimal Whisper compatibility."""
 
-import numpy as np
-from scipy import signal
+import importlib
 from typing import Optional
 
+import numpy as np
+
+try:
+    # SIMD polyphase resampler, 5-10x faster than scipy with native
+    # streaming state; scipy remains the fallback
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
+# scipy costs ~100 ms to import; defer it until a resampler actually
+# needs to design or run a filter (the identity path never pays for it)
+signal = None
+
+
+def _load_signal():
+    """Import scipy.signal on first use and cache it at module scope."""
+    global signal
+    if signal is None:
+        signal = importlib.import_module("scipy.signal")
+    return signal
+
+
+def int16_to_float32_norm(samples: np.ndarray) -> np.ndarray:
+    """Convert int16 PCM to normalized float32 [-1, 1] in one fused pass.
+
+    np.multiply with an explicit dtype casts and scales in a single SIMD
+    sweep instead of astype-then-divide's two passes over the data.
+    """
+    return np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+
 
 class AudioResampler:
     """Handles resampling audio to 16kHz for Whisper."""
-    
+
+    # Memoized up/down ratios keyed by (source_rate, target_rate) so
+    # repeated construction skips the Fraction reduction
+    _RATIO_CACHE: dict = {}
+
     def __init__(self, source_rate: int, target_rate: int = 16000):
         """
         Initialize the resampler.
@@ -23,9 +57,12 @@ class AudioResampler:
         if self.needs_resampling:
             # Calculate resampling ratio
             self.resample_ratio = self.target_rate / self.source_rate
-            
+
+            cached = self._RATIO_CACHE.get((source_rate, target_rate))
+            if cached is not None:
+                self.up, self.down = cached
             # For common rates, use optimized ratios
-            if source_rate == 48000 and target_rate == 16000:
+            elif source_rate == 48000 and target_rate == 16000:
                 self.up = 1
                 self.down = 3
             elif source_rate == 44100 and target_rate == 16000:
@@ -41,7 +78,39 @@ class AudioResampler:
                 frac = Fraction(target_rate, source_rate).limit_denominator(1000)
                 self.up = frac.numerator
                 self.down = frac.denominator
-    
+            self._RATIO_CACHE[(source_rate, target_rate)] = (self.up, self.down)
+
+            # A degenerate ratio (e.g. limit_denominator rounding to 1/1)
+            # means no real work - take the pass-through path entirely
+            if self.up == self.down:
+                self.needs_resampling = False
+                return
+
+            if SOXR_AVAILABLE:
+                # Streaming state lives in the library; no manual
+                # overlap-save context needed on this path
+                self._soxr_stream = soxr.ResampleStream(
+                    source_rate, target_rate, 1, dtype="float32", quality="HQ"
+                )
+                return
+
+            _load_signal()
+
+            # Precompute the anti-aliasing FIR once. When given a window spec,
+            # resample_poly redesigns the filter on every call; passing the
+            # coefficients directly skips that per-chunk work.
+            max_rate = max(self.up, self.down)
+            half_len = 10 * max_rate
+            self._fir = signal.firwin(
+                2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)
+            ) * self.up
+
+            # Streaming state for resample_chunk: filter edge extent in
+            # input samples, rounded to a multiple of `down` so emitted
+            # output offsets stay integral across chunk boundaries
+            self._stream_window = -(-half_len // self.down) * self.down
+            self._stream_context = np.zeros(0, dtype=np.float32)
+
     def resample(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Resample audio data to target rate.
@@ -54,27 +123,44 @@ class AudioResampler:
         """
         if not self.needs_resampling:
             return audio_data
-            
-        # Use scipy's resample_poly for high quality resampling
-        # This uses an anti-aliasing filter to prevent artifacts
-        resampled = signal.resample_poly(audio_data, self.up, self.down)
-        
+
+        if SOXR_AVAILABLE:
+            resampled = soxr.resample(
+                audio_data.astype(np.float32),
+                self.source_rate, self.target_rate, quality="HQ",
+            )
+        else:
+            # Polyphase resampling through the precomputed anti-aliasing filter
+            resampled = signal.resample_poly(
+                audio_data.astype(np.float32), self.up, self.down, window=self._fir
+            )
+
+        # Clip before casting back so filter overshoot can't wrap int16
+        if np.issubdtype(audio_data.dtype, np.integer):
+            limits = np.iinfo(audio_data.dtype)
+            resampled = np.clip(resampled, limits.min, limits.max)
+
         return resampled.astype(audio_data.dtype)
     
     def resample_chunk(self, chunk: bytes, format_bits: int = 16) -> bytes:
         """
-        Resample a raw audio chunk.
-        
+        Resample a raw audio chunk from a continuous stream.
+
+        Carries filter context across calls (overlap-save), so chunk
+        boundaries are resampled with their true neighbours instead of
+        zero padding. Output therefore trails the input by one filter
+        window and may be empty while context accumulates.
+
         Args:
             chunk: Raw audio bytes
             format_bits: Bits per sample (16 or 32)
-            
+
         Returns:
             Resampled audio bytes
         """
         if not self.needs_resampling:
             return chunk
-            
+
         # Convert bytes to numpy array
         if format_bits == 16:
             audio_array = np.frombuffer(chunk, dtype=np.int16)
@@ -82,13 +168,55 @@ class AudioResampler:
             audio_array = np.frombuffer(chunk, dtype=np.int32)
         else:
             raise ValueError(f"Unsupported format: {format_bits} bits")
-            
-        # Resample
-        resampled_array = self.resample(audio_array)
-        
-        # Convert back to bytes
-        return resampled_array.tobytes()
+
+        if SOXR_AVAILABLE:
+            out = self._soxr_stream.resample_chunk(audio_array.astype(np.float32))
+        else:
+            w = self._stream_window
+            ctx = self._stream_context
+            buf = np.concatenate((ctx, audio_array.astype(np.float32)))
+
+            # Hold samples until there is a full window of future context
+            if buf.size <= 2 * w:
+                self._stream_context = buf
+                return b""
+
+            resampled = signal.resample_poly(buf, self.up, self.down, window=self._fir)
+
+            # Emit up to the last grid-aligned input position with a full
+            # window of right-hand context; the carried context always starts
+            # on a multiple of `down`, keeping the polyphase grid continuous
+            p = ((buf.size - w) // self.down) * self.down
+            start = (w * self.up // self.down) if ctx.size else 0
+            stop = p * self.up // self.down
+            out = resampled[start:stop]
+            self._stream_context = buf[p - w:]
+
+        # Clip before casting back so filter overshoot can't wrap the PCM
+        dtype = audio_array.dtype
+        limits = np.iinfo(dtype)
+        return np.clip(out, limits.min, limits.max).astype(dtype).tobytes()
     
+    def resample_to_float32(self, chunk: bytes) -> np.ndarray:
+        """Resample a raw int16 chunk straight to normalized float32.
+
+        Whisper wants float32 in [-1, 1] anyway, so this skips the int16
+        round trip and keeps the polyphase math in float32 (half the
+        memory traffic of scipy's default float64 upcast).
+        """
+        samples = int16_to_float32_norm(np.frombuffer(chunk, dtype=np.int16))
+        if not self.needs_resampling:
+            return samples
+        if SOXR_AVAILABLE:
+            resampled = soxr.resample(
+                samples, self.source_rate, self.target_rate, quality="HQ"
+            )
+        else:
+            resampled = signal.resample_poly(
+                samples, self.up, self.down, window=self._fir
+            )
+        return resampled.astype(np.float32, copy=False)
+
     def get_resampled_chunk_size(self, original_size: int) -> int:
         """
         Calculate the expected size of a resampled chunk.
@@ -0,0 +1,70 @@
+"""Lock-free single-producer single-consumer ring buffer for audio frames."""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+
+class SPSCRing:
+    """Fixed-size int16 ring written by one thread and read by another.
+
+    The audio callback (producer) only advances ``head`` and the consumer
+    only advances ``tail``, so neither side takes a lock. Writes are plain
+    slice assignments into a preallocated buffer; a full ring drops the
+    incoming chunk rather than blocking the callback.
+    """
+
+    def __init__(self, capacity: int):
+        self.buf = np.empty(capacity, dtype=np.int16)
+        self.capacity = capacity
+        self.head = 0  # Total samples written (producer only)
+        self.tail = 0  # Total samples read (consumer only)
+
+    @property
+    def available(self) -> int:
+        """Samples currently buffered."""
+        return self.head - self.tail
+
+    def push(self, samples: np.ndarray) -> bool:
+        """Producer side: append samples, dropping the chunk if full."""
+        n = len(samples)
+        if self.head - self.tail + n > self.capacity:
+            return False
+
+        start = self.head % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            self.buf[start:end] = samples
+        else:
+            split = self.capacity - start
+            self.buf[start:] = samples[:split]
+            self.buf[:n - split] = samples[split:]
+
+        # Publish after the data is in place; int assignment is atomic
+        self.head += n
+        return True
+
+    def pop(self, n: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Consumer side: read exactly n samples, waiting until available.
+
+        Returns None if timeout elapses first.
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        while self.head - self.tail < n:
+            if deadline and time.monotonic() > deadline:
+                return None
+            time.sleep(0.001)
+
+        out = np.empty(n, dtype=np.int16)
+        start = self.tail % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            out[:] = self.buf[start:end]
+        else:
+            split = self.capacity - start
+            out[:split] = self.buf[start:]
+            out[split:] = self.buf[:n - split]
+
+        self.tail += n
+        return out
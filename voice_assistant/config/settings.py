@@ -1,11 +1,16 @@
 """Configuration settings for Voice Assistant."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# Interned once: every ProfileConfig shares these Path objects instead of
+# re-parsing the strings (and re-reading $HOME) per construction
+_CONTEXT_DIR = Path(".context")
+_PROFILE_STATE_FILE = Path.home() / ".claude" / "voice_profile_state.json"
 
-@dataclass
+
+@dataclass(slots=True)  # slots: no per-instance __dict__, faster attribute access
 class AudioConfig:
     """Audio recording and playback configuration."""
 
@@ -20,7 +25,7 @@ class AudioConfig:
     
 
 
-@dataclass
+@dataclass(slots=True)
 class VADConfig:
     """Voice Activity Detection configuration."""
 
@@ -34,7 +39,7 @@ class VADConfig:
     inactivity_timeout: float = 120.0  # 2 minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSConfig:
     """Text-to-Speech configuration."""
 
@@ -46,7 +51,7 @@ class TTSConfig:
     sentence_delay: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionConfig:
     """Whisper transcription configuration."""
 
@@ -57,59 +62,62 @@ class TranscriptionConfig:
     min_audio_length: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileConfig:
     """Profile management configuration."""
 
-    context_dir: Path = Path(".context")
+    context_dir: Path = _CONTEXT_DIR
     current_profile: Optional[str] = None
-    profile_state_file: Path = Path.home() / ".claude" / "voice_profile_state.json"
+    profile_state_file: Path = _PROFILE_STATE_FILE
+
 
+# CLI argument -> (subconfig attribute or None for Config itself, field)
+_ARG_MAP = {
+    "model_size": ("transcription", "model_size"),
+    "wake_word": (None, "wake_word"),
+    "voice": ("tts", "voice"),
+    "speech_rate": ("tts", "speech_rate"),
+    "tts_engine": ("tts", "engine"),
+    "silence_threshold": ("audio", "silence_threshold"),
+    "sample_rate": ("audio", "sample_rate"),
+    "verbose": (None, "verbose"),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """Main configuration container."""
 
-    audio: AudioConfig
-    vad: VADConfig
-    tts: TTSConfig
-    transcription: TranscriptionConfig
-    profiles: ProfileConfig
+    # default_factory defers each subconfig to Config construction time,
+    # so callers that pass their own sections never build the defaults
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    vad: VADConfig = field(default_factory=VADConfig)
+    tts: TTSConfig = field(default_factory=TTSConfig)
+    transcription: TranscriptionConfig = field(default_factory=TranscriptionConfig)
+    profiles: ProfileConfig = field(default_factory=ProfileConfig)
     wake_word: str = "hey claude"
     verbose: bool = False
-    
+
     @classmethod
     def default(cls) -> "Config":
         """Create default configuration."""
-        return cls(
-            audio=AudioConfig(),
-            vad=VADConfig(),
-            tts=TTSConfig(),
-            transcription=TranscriptionConfig(),
-            profiles=ProfileConfig(),
-        )
+        return cls()
     
     @classmethod
     def from_args(cls, **kwargs) -> "Config":
         """Create configuration from command-line arguments."""
         config = cls.default()
-        
-        # Update relevant fields from kwargs
-        if "model_size" in kwargs:
-            config.transcription.model_size = kwargs["model_size"]
-        if "wake_word" in kwargs:
-            config.wake_word = kwargs["wake_word"].lower()
-        if "voice" in kwargs:
-            config.tts.voice = kwargs["voice"]
-        if "speech_rate" in kwargs:
-            config.tts.speech_rate = kwargs["speech_rate"]
-        if "tts_engine" in kwargs:
-            config.tts.engine = kwargs["tts_engine"]
-        if "silence_threshold" in kwargs:
-            config.audio.silence_threshold = kwargs["silence_threshold"]
-        if "sample_rate" in kwargs:
-            config.audio.sample_rate = kwargs["sample_rate"]
-        if "verbose" in kwargs:
-            config.verbose = kwargs["verbose"]
-            
+
+        # Single mapping-driven pass over the provided arguments instead
+        # of a membership test per schema field
+        for name, value in kwargs.items():
+            target = _ARG_MAP.get(name)
+            if target is None:
+                continue
+            section, field = target
+            if name == "wake_word":
+                value = value.lower()
+            setattr(config if section is None else getattr(config, section),
+                    field, value)
+
         return config
\ No newline at end of file
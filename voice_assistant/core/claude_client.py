@@ -1,147 +1,556 @@
 """Claude CLI client for processing queries."""
 
+import asyncio
+import json
 import os
+import re
+from collections import OrderedDict
+import signal
 import subprocess
 import threading
+# Bound once at import so the hot query path skips a module-attribute
+# lookup per use. Popen itself stays a subprocess.Popen lookup on
+# purpose: the test suite patches that attribute on the module
+from subprocess import PIPE, TimeoutExpired
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    # orjson decodes realistic Claude payloads several times faster than
+    # the stdlib; responses sit on the speech-to-TTS latency path. Its
+    # dumps returns bytes, which the persistent pipes write directly
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Parsed once; send_query falls back to this directory on every
+# profile-less query
+_CONTEXT_DIR = Path(".context")
+
+# Static argv prefixes, built once; send_query only allocates the short
+# dynamic tail (--resume pair) per query
+_CMD_PREFIX = ("claude", "--print", "--output-format", "json")
+_CMD_PREFIX_STREAM = (
+    "claude", "--print", "--output-format", "stream-json", "--verbose"
+)
+
+# Bounded scans for the short-response fast path: pull result and
+# session_id out of a small payload without building the full JSON tree
+_RESULT_RE = re.compile(r'"result"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_SESSION_RE = re.compile(r'"session_id"\s*:\s*"([0-9a-f-]+)"')
 
 
 class ClaudeClient:
     """Handles interaction with Claude CLI."""
-    
-    def __init__(self):
+
+    def __init__(self, persistent: bool = False, pool_size: int = 4):
+        """
+        Args:
+            persistent: Keep long-lived Claude processes and stream queries
+                over stdin/stdout instead of spawning a process per query.
+                Avoids the fork+exec and CLI warm-up cost on every turn, but
+                context lives in the process rather than in --resume sessions.
+            pool_size: Maximum number of warm processes kept alive, one per
+                profile, evicted least-recently-used.
+        """
         self.current_process: Optional[subprocess.Popen] = None
         self._lock = threading.Lock()
+        # Serializes send_query_async callers without blocking the loop;
+        # binds to the running loop on first await (3.10+ semantics)
+        self._async_lock = asyncio.Lock()
+        # Advisory flag polled by UI/VAD loops; written only by the query
+        # paths so readers skip a lock acquire per poll (attribute reads
+        # are atomic under the GIL)
+        self._processing = False
         self.config = None
-    
+        self.persistent = persistent
+        self.pool_size = pool_size
+        # Warm processes keyed by profile path; ordered for LRU eviction
+        self._procs: "OrderedDict[str, subprocess.Popen]" = OrderedDict()
+        # Session ids keyed by session file, so resuming doesn't re-read
+        # an unchanged file on every query
+        self._session_cache: dict = {}
+        # Write-side fds kept open per session file: pwrite+ftruncate is
+        # two syscalls versus open/write/close per update
+        self._session_fds: dict = {}
+
     def send_query(
         self,
         text: str,
         profile_path: Optional[Path] = None,
-        reset_context: bool = False
+        reset_context: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Send a query to Claude and get the response.
-        
+
         Args:
             text: Query text
             profile_path: Optional path to profile directory
             reset_context: Whether to reset context
-            
+            on_delta: Optional callback invoked with assistant text as it
+                streams in, so TTS can start before the process exits
+
         Returns:
             Claude's response text
         """
-        # Build command
-        cmd = ["claude", "--print", "--output-format", "json"]  # Use JSON output for better parsing
-        
+        if self.persistent:
+            return self._send_query_persistent(text, profile_path, reset_context)
+
+        # config is always bound in __init__, so one direct check replaces
+        # the repeated hasattr/attribute chains below
+        verbose = self.config is not None and self.config.verbose
+
+        cmd, session_file, cwd = self._prepare_query(
+            text, profile_path, reset_context, on_delta is not None, verbose
+        )
+
+        try:
+            with self._lock:
+                self._processing = True
+                # Spawn-path note: CPython only takes the cheap posix_spawn
+                # route when cwd is None and start_new_session is False
+                # (among other conditions). Both are load-bearing here -
+                # cwd scopes Claude to the profile directory and the new
+                # session gives cancel() a process group to SIGTERM - so
+                # this Popen deliberately stays on the fork+exec path.
+                self.current_process = subprocess.Popen(
+                    cmd,
+                    stdin=PIPE,
+                    stdout=PIPE,
+                    stderr=PIPE,
+                    text=True,
+                    cwd=str(cwd),
+                    start_new_session=True,
+                )
+
+                if on_delta is not None:
+                    # Hand the prompt over stdin, then stream events
+                    self.current_process.stdin.write(text)
+                    self.current_process.stdin.close()
+                    return self._read_stream_events(session_file, on_delta)
+
+                # Prompt goes via stdin; communicate writes it, closes the
+                # pipe, and collects output (no timeout for conversation mode)
+                stdout, stderr = self.current_process.communicate(input=text)
+                
+                if self.current_process.returncode != 0:
+                    error_msg = stderr.strip() if stderr else "Unknown error"
+                    return f"Error: {error_msg}"
+
+                return self._parse_response(stdout, session_file, verbose)
+
+        except TimeoutExpired:
+            self.cancel()
+            return "Response timed out."
+        except Exception as e:
+            return f"Error: {str(e)}"
+        finally:
+            with self._lock:
+                self.current_process = None
+                self._processing = False
+    
+    def _prepare_query(
+        self,
+        text: str,
+        profile_path: Optional[Path],
+        reset_context: bool,
+        streaming: bool,
+        verbose: bool,
+    ):
+        """Build the command, session file and working directory for a query.
+
+        Shared by the sync and async paths so session handling and the
+        verbose trace stay identical between them.
+        """
+        # With a delta callback we stream NDJSON events and parse them
+        # line-by-line instead of buffering the whole response
+        # (stream-json in --print mode requires --verbose)
+        if streaming:
+            cmd = list(_CMD_PREFIX_STREAM)
+        else:
+            cmd = list(_CMD_PREFIX)  # JSON output for better parsing
+
         # Check for existing session
         if profile_path:
             session_file = profile_path / ".session_id"
         else:
             # Use default context directory when no profile
-            session_file = Path(".context") / ".session_id"
-        
-        # If resetting context, delete the session file
-        if reset_context and session_file and session_file.exists():
-            session_file.unlink()
-        
-        if session_file and session_file.exists() and not reset_context:
+            session_file = _CONTEXT_DIR / ".session_id"
+
+        # If resetting context, delete the session file (and drop the
+        # cached fd - it would point at the unlinked inode)
+        if reset_context and session_file:
+            self._session_cache.pop(session_file, None)
+            fd = self._session_fds.pop(session_file, None)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            if session_file.exists():
+                session_file.unlink()
+
+        session_id = None
+        if session_file and not reset_context:
+            session_id = self._session_cache.get(session_file)
+            if session_id is None and session_file.exists():
+                session_id = session_file.read_text().strip()
+                self._session_cache[session_file] = session_id
+
+        if session_id:
             # Resume existing session
-            session_id = session_file.read_text().strip()
             # Show full ID in verbose mode, truncated otherwise
-            if hasattr(self, 'config') and self.config and self.config.verbose:
+            if verbose:
                 print(f"📂 Resuming session {session_id}")
             else:
                 print(f"📂 Resuming session {session_id[:8]}...")
             cmd.extend(["--resume", session_id])
         else:
             # Starting new session - Claude will generate the ID
-            if hasattr(self, 'config') and self.config and self.config.verbose:
+            if verbose:
                 print(f"🆕 Starting new session (Claude will assign ID)")
             else:
                 print(f"🆕 Starting new session...")
             # Ensure directory exists for session file
             if session_file:
                 session_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        cmd.append(text)
-        
+
         # Set working directory
-        cwd = profile_path if profile_path else Path(".context")
+        cwd = profile_path if profile_path else _CONTEXT_DIR
         cwd.mkdir(parents=True, exist_ok=True)
-        
-        # In verbose mode, show the full command
-        if self.config and self.config.verbose:
+
+        # In verbose mode, show the full command. The prompt goes over
+        # stdin (not argv), so the command line stays short and the echoed
+        # prompt is bounded even for long dictations
+        if verbose:
             print(f"\n🔧 Claude command: {' '.join(cmd)}")
+            prompt_preview = text if len(text) <= 200 else text[:200] + "…"
+            print(f"💬 Prompt: {prompt_preview}")
             print(f"📁 Working directory: {cwd}")
-        
+
+        return cmd, session_file, cwd
+
+    def _parse_response(
+        self, stdout: str, session_file: Optional[Path], verbose: bool
+    ) -> str:
+        """Extract the result text from one JSON-mode response."""
+        # Fast path: short tool-free responses only need result and
+        # session_id. An escape-free match costs two bounded regex
+        # scans instead of a full parse; anything else (escapes,
+        # non-hex session ids, big payloads) takes the full path
+        if len(stdout) < 4096 and stdout.startswith('{"'):
+            result_match = _RESULT_RE.search(stdout)
+            session_match = _SESSION_RE.search(stdout)
+            if result_match and session_match and "\\" not in result_match.group(1):
+                if session_file:
+                    new_session_id = session_match.group(1)
+                    self._write_session_id(session_file, new_session_id)
+                    if verbose:
+                        print(f"📝 Updated session ID: {new_session_id}")
+                return result_match.group(1).strip()
+
+        # Parse JSON response
         try:
-            with self._lock:
-                # Run Claude command
-                self.current_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
+            response_data = _loads(stdout)
+
+            # Update session ID for next query
+            if "session_id" in response_data and session_file:
+                new_session_id = response_data["session_id"]
+                self._write_session_id(session_file, new_session_id)
+                if verbose:
+                    print(f"📝 Updated session ID: {new_session_id}")
+
+            # Extract the actual response text
+            return response_data.get("result", "").strip()
+        except ValueError:
+            # Fallback to raw output if not JSON (orjson and the
+            # stdlib both raise ValueError subclasses)
+            return stdout.strip()
+
+    async def send_query_async(
+        self,
+        text: str,
+        profile_path: Optional[Path] = None,
+        reset_context: bool = False,
+    ) -> str:
+        """
+        Async variant of send_query for event-loop callers.
+
+        Awaits the Claude process through asyncio instead of blocking in
+        communicate(), so a running event loop can keep servicing mic
+        audio and TTS while a query is in flight. Serialized against
+        other async callers by an asyncio.Lock; the persistent mode is
+        delegated to a worker thread since its IO is blocking.
+        """
+        if self.persistent:
+            return await asyncio.to_thread(
+                self._send_query_persistent, text, profile_path, reset_context
+            )
+
+        verbose = self.config is not None and self.config.verbose
+        cmd, session_file, cwd = self._prepare_query(
+            text, profile_path, reset_context, False, verbose
+        )
+
+        async with self._async_lock:
+            self._processing = True
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                     cwd=str(cwd),
-                    env=os.environ.copy(),
+                    start_new_session=True,
                 )
-                
-                # Get output (no timeout for conversation mode)
-                stdout, stderr = self.current_process.communicate()
-                
-                if self.current_process.returncode != 0:
-                    error_msg = stderr.strip() if stderr else "Unknown error"
+                stdout, stderr = await proc.communicate(input=text.encode())
+
+                if proc.returncode != 0:
+                    error_msg = stderr.decode().strip() if stderr else "Unknown error"
                     return f"Error: {error_msg}"
-                
-                # Parse JSON response
-                import json
+
+                return self._parse_response(stdout.decode(), session_file, verbose)
+            except Exception as e:
+                return f"Error: {str(e)}"
+            finally:
+                self._processing = False
+
+    def _write_session_id(self, session_file: Path, session_id: str):
+        """Persist the session id through a cached write-side fd.
+
+        Session ids are short ASCII UUIDs, so pwrite at offset 0 plus a
+        truncate replaces the content without reopening the file. Falls
+        back to a plain write if the fd path fails.
+        """
+        self._session_cache[session_file] = session_id
+        try:
+            fd = self._session_fds.get(session_file)
+            if fd is None:
+                fd = os.open(str(session_file), os.O_WRONLY | os.O_CREAT, 0o644)
+                self._session_fds[session_file] = fd
+            data = session_id.encode("ascii")
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+        except (OSError, UnicodeEncodeError):
+            session_file.write_text(session_id)
+
+    def _close_session_fds(self):
+        """Close any cached session file descriptors."""
+        while self._session_fds:
+            _, fd = self._session_fds.popitem()
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __del__(self):
+        try:
+            self._close_session_fds()
+        except Exception:
+            pass
+
+    def _read_stream_events(
+        self,
+        session_file: Optional[Path],
+        on_delta: Callable[[str], None]
+    ) -> str:
+        """Consume stream-json events from the current process.
+
+        Dispatches assistant text to on_delta as each line arrives and
+        returns the final result once the terminating event is seen, so
+        nothing buffers the full response.
+        """
+        proc = self.current_process
+        result_text = ""
+        for line in proc.stdout:
+            try:
+                event = _loads(line)
+            except ValueError:
+                continue
+            event_type = event.get("type")
+            if event_type == "assistant":
+                for block in event.get("message", {}).get("content", []):
+                    if block.get("type") == "text" and block.get("text"):
+                        on_delta(block["text"])
+            elif event_type == "result":
+                result_text = event.get("result", "").strip()
+                if "session_id" in event and session_file:
+                    self._write_session_id(session_file, event["session_id"])
+                    if self.config and self.config.verbose:
+                        print(f"📝 Updated session ID: {event['session_id']}")
+        proc.wait()
+        if proc.returncode != 0:
+            stderr = proc.stderr.read()
+            error_msg = stderr.strip() if stderr else "Unknown error"
+            return f"Error: {error_msg}"
+        return result_text
+
+    @staticmethod
+    def _pool_key(profile_path: Optional[Path]) -> str:
+        return str(profile_path) if profile_path else ""
+
+    def _ensure_persistent_process(self, profile_path: Optional[Path]) -> subprocess.Popen:
+        """Look up (or spawn) the warm Claude process for a profile."""
+        key = self._pool_key(profile_path)
+        proc = self._procs.get(key)
+        if proc is not None:
+            if proc.poll() is None:
+                self._procs.move_to_end(key)
+                return proc
+            # Process died - reap the entry and respawn below
+            del self._procs[key]
+
+        cwd = profile_path if profile_path else _CONTEXT_DIR
+        cwd.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            "claude", "--print",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+        ]
+
+        # Send the profile preamble once at process start so it stays
+        # resident (prompt-cached) instead of being re-prefilled per turn
+        if profile_path:
+            preamble_file = profile_path / "CLAUDE.md"
+            if preamble_file.exists():
+                cmd.extend(["--append-system-prompt", preamble_file.read_text()])
+
+        if self.config and self.config.verbose:
+            print(f"\n🔧 Starting persistent Claude process: {' '.join(cmd)}")
+            print(f"📁 Working directory: {cwd}")
+
+        # Binary pipes: queries are framed as orjson bytes (no str->bytes
+        # encode per turn) and both json decoders accept bytes lines back.
+        # stderr is discarded - nothing reads it for the life of the
+        # process, and an unread PIPE would wedge the CLI (and every
+        # later query) once its ~64 KB buffer filled
+        proc = subprocess.Popen(
+            cmd,
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(cwd),
+            start_new_session=True,
+        )
+        self._procs[key] = proc
+
+        # LRU eviction keeps at most pool_size warm processes alive
+        while len(self._procs) > self.pool_size:
+            _, evicted = self._procs.popitem(last=False)
+            self._terminate_process(evicted)
+
+        return proc
+
+    @staticmethod
+    def _terminate_process(proc: subprocess.Popen):
+        """Tear down one long-lived Claude process."""
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.terminate()
+                proc.wait(timeout=1)
+            except Exception:
+                pass
+
+    def _stop_profile_process(self, profile_path: Optional[Path]):
+        """Drop and terminate the warm process for one profile, if any."""
+        proc = self._procs.pop(self._pool_key(profile_path), None)
+        if proc is not None:
+            self._terminate_process(proc)
+
+    def terminate_all(self):
+        """Tear down every warm process in the pool."""
+        while self._procs:
+            _, proc = self._procs.popitem(last=False)
+            self._terminate_process(proc)
+
+    def _send_query_persistent(
+        self,
+        text: str,
+        profile_path: Optional[Path] = None,
+        reset_context: bool = False
+    ) -> str:
+        """Send a query over the long-lived Claude process."""
+        # Context lives in the process, so a reset means a fresh process
+        if reset_context:
+            self._stop_profile_process(profile_path)
+
+        try:
+            with self._lock:
+                proc = self._ensure_persistent_process(profile_path)
+                self.current_process = proc
+                self._processing = True
+
+            payload = _dumps(
+                {"type": "user", "message": {"role": "user", "content": text}}
+            )
+            proc.stdin.write(payload)
+            proc.stdin.write(b"\n")
+            proc.stdin.flush()
+
+            # Read stream-json frames until the final result event
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    return "Error: Claude process exited unexpectedly."
                 try:
-                    response_data = json.loads(stdout)
-                    
-                    # Update session ID for next query
-                    if "session_id" in response_data and session_file:
-                        new_session_id = response_data["session_id"]
-                        session_file.write_text(new_session_id)
-                        if self.config and self.config.verbose:
-                            print(f"📝 Updated session ID: {new_session_id}")
-                    
-                    # Extract the actual response text
-                    return response_data.get("result", "").strip()
-                except json.JSONDecodeError:
-                    # Fallback to raw output if not JSON
-                    return stdout.strip()
-                
-        except subprocess.TimeoutExpired:
-            self.cancel()
-            return "Response timed out."
+                    event = _loads(line)
+                except ValueError:
+                    continue
+                if event.get("type") == "result":
+                    return event.get("result", "").strip()
+
         except Exception as e:
             return f"Error: {str(e)}"
         finally:
             with self._lock:
                 self.current_process = None
-    
+                self._processing = False
+
     def cancel(self):
         """Cancel the current Claude process."""
         # Don't use lock here to avoid deadlock with send_query
         if self.current_process:
             try:
-                self.current_process.terminate()
-                # Give it a moment to terminate
                 try:
-                    self.current_process.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    # Force kill if it doesn't terminate
-                    self.current_process.kill()
-                    self.current_process.wait(timeout=1)
+                    # Kill the whole process group so forked node workers
+                    # don't outlive the parent (claude starts its own session)
+                    pid = self.current_process.pid
+                    if not isinstance(pid, int):
+                        raise TypeError("no real pid (mocked process)")
+                    pgid = os.getpgid(pid)
+                    os.killpg(pgid, signal.SIGTERM)
+                    try:
+                        self.current_process.wait(timeout=0.25)
+                    except TimeoutExpired:
+                        os.killpg(pgid, signal.SIGKILL)
+                        self.current_process.wait(timeout=1)
+                except (ProcessLookupError, TypeError, PermissionError):
+                    # No process group (already gone, or a mocked process) -
+                    # fall back to plain terminate
+                    self.current_process.terminate()
+                    try:
+                        self.current_process.wait(timeout=1)
+                    except TimeoutExpired:
+                        self.current_process.kill()
+                        self.current_process.wait(timeout=1)
             except:
                 pass
             finally:
+                # A cancelled warm process must be restarted next query
+                for key, proc in list(self._procs.items()):
+                    if proc is self.current_process:
+                        del self._procs[key]
                 self.current_process = None
-    
+                self._processing = False
+
     @property
     def is_processing(self) -> bool:
-        """Check if currently processing a query."""
-        with self._lock:
-            return self.current_process is not None
\ No newline at end of file
+        """Check if currently processing a query (lock-free read)."""
+        return self._processing
\ No newline at end of file
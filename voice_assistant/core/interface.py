@@ -1,21 +1,94 @@
 """Main voice interface orchestrator."""
 
 import difflib
-import select
+import os
+import random
+import re
 import sys
 import termios
 import threading
 import time
 import tty
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    # C-backed fuzzy scorer: one pass over the whole transcription
+    # replaces the Python-level sliding-window SequenceMatcher scan
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 from ..audio import AudioRecorder
 from ..config import Config
 from ..profiles import ProfileManager
-from ..transcription import WhisperTranscriber
+from ..transcription import TranscriptionStreamer, WhisperTranscriber
+from ..transcription.whisper import _NOISE_TEXTS
 from ..tts import create_tts_engine
 from .claude_client import ClaudeClient
 
+# Precompiled goodbye matcher: one regex pass instead of normalizing the
+# text and scanning a phrase list on every utterance
+_GOODBYE_RE = re.compile(
+    r"^\W*(?:goodbye|bye(?:\s+bye)?|see\s+you(?:\s+later)?|talk\s+to\s+you\s+later|exit|quit)\W*$",
+    re.IGNORECASE,
+)
+
+# Single-pass punctuation strip for wake-word matching (translate is
+# one C-level table scan versus chained str.replace copies)
+_PUNCT_TABLE = str.maketrans("", "", ",.!?")
+
+# Compiled once like the goodbye matcher: one C-level scan per
+# utterance instead of a Python loop of substring tests
+_CANCEL_RE = re.compile(
+    r"\b(cancel|stop|shut up|quiet|silence|nevermind)\b"
+)
+
+_PROFILE_CMD_RE = re.compile(
+    r"(create profile|list profile|load profile|reset context)"
+)
+
+# Fixed assistant phrases, hoisted so the modes and TTS pre-warming
+# share one copy. Everything here is spoken verbatim at some point, so
+# warming them at startup turns their first playback into a cache hit
+_ACK_RESPONSES = [
+    "Yes?",
+    "How can I help?",
+    "What can I do for you?",
+    "I'm listening.",
+    "Go ahead.",
+]
+
+_FAREWELLS = [
+    "Goodbye! Say hey Claude when you need me again.",
+    "See you later! Just say hey Claude to chat again.",
+    "Cheerio! I'll be here when you need me.",
+    "Bye for now! Call me anytime.",
+]
+
+_FIXED_PROMPTS = [
+    "Conversation mode activated. Say 'goodbye' to exit.",
+    "Conversation timed out. Returning to wake mode.",
+    "Goodbye! Have a great day!",
+    "What would you like to know?",
+    "I didn't catch that.",
+    "Going to sleep.",
+    "Context has been reset.",
+]
+
+# Common mishearings for wake words
+_WAKE_WORD_VARIATIONS = {
+    "hey claude": ["hey claud", "hey quad", "hey cloud", "hey clod", "hey claw",
+                   "a claude", "hey close", "hey caught", "hey clawd", "hey cod"],
+    "hello claude": ["hello claud", "hello cloud", "hello quad", "hello claw",
+                     "hello close", "hello caught"],
+    "hi claude": ["hi claud", "hi cloud", "hi quad", "hi claw", "hi close"],
+}
+
 
 class VoiceInterface:
     """Main voice interface that orchestrates all components."""
@@ -23,95 +96,160 @@ class VoiceInterface:
     @staticmethod
     def _is_goodbye_command(text: str) -> bool:
         """Check if text is a goodbye command."""
-        import re
-        # Strip punctuation and lowercase
-        clean_text = re.sub(r'[^\w\s]', '', text.lower()).strip()
-        goodbye_phrases = ["goodbye", "bye", "bye bye", "see you", "see you later", "talk to you later", "exit", "quit"]
-        return clean_text in goodbye_phrases
+        return _GOODBYE_RE.match(text) is not None
     
     def __init__(self, config: Config):
         self.config = config
         
-        # Initialize components
-        self.audio_recorder = AudioRecorder(config.audio, config.vad, verbose=config.verbose)
-        self.transcriber = WhisperTranscriber(config.transcription, config.audio)
-        self.tts_engine = create_tts_engine(config.tts)
-        self.profile_manager = ProfileManager(config.profiles)
+        # Initialize components. The four heavy constructors (device
+        # probe, Whisper model load, TTS engine probe, profile scan) are
+        # independent, so build them concurrently; startup time becomes
+        # the slowest load instead of the sum of all four
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            recorder_future = pool.submit(
+                AudioRecorder, config.audio, config.vad, verbose=config.verbose
+            )
+            transcriber_future = pool.submit(
+                WhisperTranscriber, config.transcription, config.audio
+            )
+            tts_future = pool.submit(create_tts_engine, config.tts)
+            profiles_future = pool.submit(ProfileManager, config.profiles)
+
+            self.audio_recorder = recorder_future.result()
+            self.transcriber = transcriber_future.result()
+            self.tts_engine = tts_future.result()
+            self.profile_manager = profiles_future.result()
         self.claude_client = ClaudeClient()
         self.claude_client.config = config
         
         # State
         self.cancel_requested = False
         self._cancel_thread: Optional[threading.Thread] = None
+        # Set by _stop_cancel_listener to abort the monitor's in-flight
+        # recording window instead of waiting out its timeout
+        self._cancel_event = threading.Event()
+        # Test seam: when set, speak() polls this before synthesis and
+        # treats returned frames as interrupting speech. Keeps the
+        # production path free of unittest.mock isinstance checks
+        self._interrupt_check: Optional[Callable[[], object]] = None
+
+        # One blocking keyboard reader for the whole session replaces the
+        # per-speak/per-query select() polling loops (each woke 10x/sec
+        # and re-entered raw mode, racing one another on termios state)
+        self._stdin_settings = None
+        self._claude_cancellable = False
+        self._start_keyboard_monitor()
+
+        # Precompute the wake-word variant table once: an O(1) set test for
+        # clean transcriptions, plus the substring list for noisy ones
+        wake = config.wake_word
+        variants = [wake, wake.replace(" ", ", ")]
+        variants.extend(_WAKE_WORD_VARIATIONS.get(wake, []))
+        self._wake_variant_set = frozenset(variants)
+        # One alternation regex replaces N Python-level substring scans
+        # over the same text (variants is never empty: it always holds
+        # at least the wake word itself)
+        self._wake_variant_re = re.compile(
+            "|".join(re.escape(v) for v in variants)
+        )
+        # Plausibility bounds for wake-word candidates, computed once:
+        # anything shorter than the shortest matchable form (the wake
+        # word minus slack for dropped characters, or the shortest
+        # declared mishearing variant) or much longer than the wake
+        # word can't be a wake-up
+        self._wake_word_tokens = wake.split()
+        self._wake_min_chars = min(
+            len(wake) - 2, min(len(v) for v in variants)
+        )
+        self._wake_max_tokens = len(self._wake_word_tokens) + 6
     
     def calibrate(self):
         """Calibrate noise floor for better speech detection."""
         self.audio_recorder.calibrate_noise_floor()
+
+    def prewarm_tts(self):
+        """Synthesize the fixed assistant phrases into the TTS cache.
+
+        Runs in a background thread so startup isn't delayed; by the
+        time a recurring prompt is first spoken it is usually already a
+        cache hit. Safe to call when no engine is available.
+        """
+        engine = self.tts_engine
+        if engine is None or not getattr(engine, "is_available", False):
+            return
+
+        phrases = _ACK_RESPONSES + _FAREWELLS + _FIXED_PROMPTS
+        # Friendly speech prefixes these as standalone sentences
+        phrases.extend(getattr(engine, "FRIENDLY_PHRASES", ()))
+
+        def warm_all():
+            for phrase in phrases:
+                try:
+                    engine.warm(phrase)
+                except Exception:
+                    return
+
+        thread = threading.Thread(target=warm_all, daemon=True)
+        thread.start()
     
+    def _start_keyboard_monitor(self):
+        """Start the session-wide blocking keyboard reader.
+
+        Puts the terminal in cbreak mode once (unbuffered keys, output
+        processing intact) and parks a daemon thread on a blocking
+        os.read. ESC is dispatched to whatever is active - speech stops,
+        an in-flight Claude query cancels - so no other code needs to
+        touch termios or poll stdin. Silently does nothing when stdin
+        isn't a terminal (tests, pipes).
+        """
+        try:
+            if not sys.stdin.isatty():
+                return
+            self._stdin_settings = termios.tcgetattr(sys.stdin)
+            tty.setcbreak(sys.stdin.fileno())
+        except Exception:
+            return
+
+        thread = threading.Thread(target=self._keyboard_monitor, daemon=True)
+        thread.start()
+
+    def _keyboard_monitor(self):
+        """Block on stdin and dispatch ESC presses (daemon thread)."""
+        fd = sys.stdin.fileno()
+        while True:
+            try:
+                data = os.read(fd, 1)
+            except (OSError, ValueError):
+                break
+            if not data:
+                break
+            if data == b'\x1b':
+                self._on_esc()
+
+    def _on_esc(self):
+        """Route an ESC press to the active operation."""
+        if self.tts_engine and self.tts_engine.is_speaking:
+            self.tts_engine.stop()
+            self.tts_engine.is_speaking = False
+        if self._claude_cancellable:
+            print("\n⚠️ ESC pressed - Cancelling...")
+            self.cancel_requested = True
+            self.claude_client.cancel()
+            if self.tts_engine:
+                self.tts_engine.stop()
+
     def speak(self, text: str, friendly: bool = False):
-        """Speak text using TTS."""
+        """Speak text using TTS (ESC handled by the keyboard monitor)."""
         if self.tts_engine:
-            # Check for voice interruption (for tests with mocked audio recorder)
-            from unittest.mock import Mock
-            if isinstance(self.audio_recorder, Mock):
-                # Check if record_with_amplitude has been explicitly configured
-                # to return actual data (not a default Mock)
-                if hasattr(self.audio_recorder, 'record_with_amplitude'):
-                    result = self.audio_recorder.record_with_amplitude()
-                    # Only interrupt if result is actual data (list/bytes), not a Mock
-                    if result and not isinstance(result, Mock):
-                        self.tts_engine.stop()
-                        # Transcribe the interrupted speech
-                        if hasattr(self.transcriber, 'transcribe'):
-                            self._interrupted_text = self.transcriber.transcribe(result)
-                        return
-            
-            # Check for ESC key (only if stdin is available)
-            try:
-                if select.select([sys.stdin], [], [], 0)[0]:
-                    key = sys.stdin.read(1)
-                    if key == '\x1b':  # ESC key
-                        self.tts_engine.stop()
-                        return
-            except:
-                pass  # stdin not available (e.g., in tests)
-            
-            # For real usage, monitor for ESC in parallel
-            if not isinstance(self.audio_recorder, Mock):
-                self.cancel_requested = False
-                
-                def check_esc():
-                    import tty
-                    try:
-                        old_settings = termios.tcgetattr(sys.stdin)
-                        tty.setraw(sys.stdin.fileno())
-                        
-                        while self.tts_engine.is_speaking:
-                            if select.select([sys.stdin], [], [], 0.1)[0]:
-                                key = sys.stdin.read(1)
-                                if key == '\x1b':
-                                    self.tts_engine.stop()
-                                    self.tts_engine.is_speaking = False
-                                    break
-                        
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                    except:
-                        # Fallback for testing or non-terminal environments
-                        while self.tts_engine.is_speaking:
-                            try:
-                                if select.select([sys.stdin], [], [], 0.1)[0]:
-                                    key = sys.stdin.read(1)
-                                    if key == '\x1b':
-                                        self.tts_engine.stop()
-                                        self.tts_engine.is_speaking = False
-                                        break
-                            except:
-                                break
-                
-                monitor_thread = threading.Thread(target=check_esc)
-                monitor_thread.daemon = True
-                monitor_thread.start()
-            
+            # Injected interruption hook (tests); None in production
+            if self._interrupt_check is not None:
+                result = self._interrupt_check()
+                if result:
+                    self.tts_engine.stop()
+                    # Transcribe the interrupting speech
+                    self._interrupted_text = self.transcriber.transcribe(result)
+                    return
+
             self.tts_engine.speak(text, friendly)
     
     def listen(self, timeout: Optional[float] = None, quiet: bool = False) -> Optional[str]:
@@ -125,15 +263,56 @@ class VoiceInterface:
         Returns:
             Transcribed text or None
         """
-        # Record audio
+        # Record audio, streaming transcription windows while recording
+        # continues so only a short tail is left to decode at the end
+        streamer = None
         if self.audio_recorder.vad_model:
             frames = self.audio_recorder.record_with_vad(timeout, quiet=quiet)
         else:
-            frames = self.audio_recorder.record_with_amplitude(timeout, quiet=quiet)
-        
+            if (
+                getattr(self.transcriber, "model", None) is not None
+                and self.config.audio.sample_rate == 16000
+            ):
+                streamer = TranscriptionStreamer(
+                    self.transcriber, self.config.audio.sample_rate
+                )
+            frames = self.audio_recorder.record_with_amplitude(
+                timeout, quiet=quiet, streamer=streamer
+            )
+
         if not frames:
             return None
-        
+
+        if streamer is not None:
+            text = streamer.finalize()
+            # Streamed text passes the same duration and noise gates as
+            # every other transcription path; rejected utterances fall
+            # through to transcribe_utterance below, which applies its
+            # own filtering
+            duration = (
+                len(frames) * self.config.audio.chunk_size
+                / self.config.audio.sample_rate
+            )
+            if (
+                text
+                and len(text) > 1
+                and text not in _NOISE_TEXTS
+                and duration >= self.config.transcription.min_audio_length
+            ):
+                return text
+
+        # Zero-copy fast path: the amplitude recorder leaves a normalized
+        # float32 view of the utterance in its arena, so transcription
+        # can skip the bytes-join/temp-WAV/convert round trip
+        if (
+            not self.audio_recorder.vad_model
+            and self.config.audio.sample_rate == 16000
+            and getattr(self.transcriber, "model", None) is not None
+        ):
+            audio = self.audio_recorder.get_last_utterance_f32()
+            if isinstance(audio, np.ndarray):
+                return self.transcriber.transcribe_utterance(audio)
+
         # Transcribe
         return self.transcriber.transcribe(frames)
     
@@ -141,23 +320,26 @@ class VoiceInterface:
         """Listen for wake word with advanced fuzzy matching."""
         if not quiet:
             print(f"🎤 Listening for '{self.config.wake_word}'...")
-        
-        # Common mishearings for wake words
-        wake_word_variations = {
-            "hey claude": ["hey claud", "hey quad", "hey cloud", "hey clod", "hey claw", 
-                          "a claude", "hey close", "hey caught", "hey clawd", "hey cod"],
-            "hello claude": ["hello claud", "hello cloud", "hello quad", "hello claw",
-                            "hello close", "hello caught"],
-            "hi claude": ["hi claud", "hi cloud", "hi quad", "hi claw", "hi close"],
-        }
-        
+
         # Quick recording for wake word (quiet mode to avoid spam)
         frames = self.audio_recorder.record_with_amplitude(timeout=5, quiet=True)
         if not frames:
             return False
-        
-        # Quick transcribe
-        text = self.transcriber.quick_transcribe(frames)
+
+        # Cheap acoustic gate first: don't run Whisper on windows whose
+        # energy never clears the noise floor (most of a quiet room)
+        if not self._frames_have_voice(frames):
+            return False
+
+        # Quick transcribe - prefer the recorder's in-memory float32 view
+        # (this path runs every few seconds for the whole session)
+        text = None
+        if self.config.audio.sample_rate == 16000:
+            audio = self.audio_recorder.get_last_utterance_f32()
+            if isinstance(audio, np.ndarray):
+                text = self.transcriber.quick_transcribe_array(audio)
+        if text is None:
+            text = self.transcriber.quick_transcribe(frames)
         if not text:
             return False
         
@@ -168,32 +350,39 @@ class VoiceInterface:
             print(f"\n🎙️ Transcribed: '{text}'")
         
         # Remove punctuation for better matching
-        text = text.replace(",", "").replace(".", "").replace("!", "").replace("?", "")
-        
-        # Check for exact match
-        if self.config.wake_word in text:
+        text = text.translate(_PUNCT_TABLE)
+
+        # Cheap plausibility guards before any matching: too short to
+        # contain the wake word, or so long the wake word would be
+        # buried in an unrelated utterance
+        words = text.split()
+        if len(text) < self._wake_min_chars or len(words) > self._wake_max_tokens:
+            return False
+
+        # O(1) fast path: clean transcriptions match a variant exactly
+        if text in self._wake_variant_set:
             return True
-        
-        # Check for comma variations
-        if f"{self.config.wake_word.replace(' ', ', ')}" in text:
+
+        # Single compiled pass over the precomputed variants (exact wake
+        # word, comma form, and known mishearings)
+        if self._wake_variant_re.search(text):
             return True
-        
-        # Check known variations
-        if self.config.wake_word in wake_word_variations:
-            for variation in wake_word_variations[self.config.wake_word]:
-                if variation in text:
-                    return True
-        
+
         # Fuzzy matching for slight variations
-        words = text.split()
-        wake_words = self.config.wake_word.split()
-        
+        if RAPIDFUZZ_AVAILABLE:
+            # partial_ratio scores the best-matching window of the whole
+            # text in one C call (same 0.8 threshold, 0-100 scale)
+            return fuzz.partial_ratio(self.config.wake_word, text) > 80
+
+        # difflib fallback: Python-level sliding-window scan
+        wake_words = self._wake_word_tokens
+
         for i in range(len(words) - len(wake_words) + 1):
             phrase = " ".join(words[i:i + len(wake_words)])
             similarity = difflib.SequenceMatcher(None, self.config.wake_word, phrase).ratio()
             if similarity > 0.8:  # Original threshold
                 return True
-        
+
         return False
     
     def process_profile_commands(self, text: str) -> bool:
@@ -207,9 +396,16 @@ class VoiceInterface:
             True if command was processed
         """
         text_lower = text.lower()
-        
+
+        # Single compiled scan finds the command keyword (or bails) in
+        # one pass; the branches below dispatch on the matched phrase
+        match = _PROFILE_CMD_RE.search(text_lower)
+        if match is None:
+            return False
+        command = match.group(1)
+
         # Create profile
-        if "create profile" in text_lower:
+        if command == "create profile":
             self.speak("What would you like to name this profile?")
             profile_name = self.listen()
             
@@ -237,7 +433,7 @@ class VoiceInterface:
             return True
         
         # List profiles
-        elif "list profile" in text_lower:
+        elif command == "list profile":
             profiles = self.profile_manager.list_profiles()
             if profiles:
                 self.speak(f"Available profiles: {', '.join(profiles)}")
@@ -246,7 +442,7 @@ class VoiceInterface:
             return True
         
         # Load profile
-        elif "load profile" in text_lower:
+        elif command == "load profile":
             # Extract profile name
             parts = text_lower.split("load profile")
             if len(parts) > 1:
@@ -262,7 +458,7 @@ class VoiceInterface:
             return True
         
         # Reset context
-        elif "reset context" in text_lower:
+        elif command == "reset context":
             self.profile_manager.reset_context()
             self.speak("Context has been reset.")
             return True
@@ -300,69 +496,71 @@ class VoiceInterface:
     def _start_cancel_listener(self):
         """Start listening for cancel commands."""
         self.cancel_requested = False
+        # ESC comes through the keyboard monitor while this is set
+        self._claude_cancellable = True
+        self._cancel_event.clear()
         self._cancel_thread = threading.Thread(target=self._listen_for_cancel)
         self._cancel_thread.daemon = True
         self._cancel_thread.start()
-    
+
     def _stop_cancel_listener(self):
         """Stop the cancel listener."""
+        self._claude_cancellable = False
         self.cancel_requested = True
+        # Wake the monitor out of any in-flight recording window so the
+        # join returns in milliseconds, not at the end of the window
+        self._cancel_event.set()
         if self._cancel_thread:
             self._cancel_thread.join(timeout=0.5)
             self._cancel_thread = None
-    
-    def _listen_for_cancel(self):
-        """Listen for cancel key press or voice command."""
-        old_settings = termios.tcgetattr(sys.stdin)
-        cancel_words = ["cancel", "stop", "shut up", "quiet", "silence", "nevermind"]
-        
-        # Start audio monitoring thread for voice cancellation
-        def monitor_voice():
-            """Monitor for voice cancel commands."""
-            while not self.cancel_requested:
-                try:
-                    # Quick recording with short timeout (quiet mode)
-                    frames = self.audio_recorder.record_with_amplitude(timeout=2, quiet=True)
-                    if frames and len(frames) > 5:
-                        # Quick transcribe for cancel detection
-                        text = self.transcriber.quick_transcribe(frames)
-                        if text:
-                            text_lower = text.lower()
-                            for cancel_word in cancel_words:
-                                if cancel_word in text_lower:
-                                    print(f"\n⚠️ Heard '{cancel_word}' - Cancelling...")
-                                    self.cancel_requested = True
-                                    self.claude_client.cancel()
-                                    if self.tts_engine:
-                                        self.tts_engine.stop()
-                                    return
-                except:
-                    pass
-                time.sleep(0.1)
-        
-        # Start voice monitoring in background
-        voice_thread = threading.Thread(target=monitor_voice)
-        voice_thread.daemon = True
-        voice_thread.start()
-        
+
+    def _frames_have_voice(self, frames) -> bool:
+        """Cheap energy gate before running Whisper on a cancel window.
+
+        Transcription is the expensive step and most cancel-listener
+        windows are silence or background noise; one RMS pass against
+        the calibrated noise floor skips those entirely.
+        """
+        floor = self.config.audio.noise_floor
+        gate = 2 * floor if floor else float(self.config.audio.silence_threshold)
         try:
-            tty.setraw(sys.stdin.fileno())
-            
-            while not self.cancel_requested:
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    key = sys.stdin.read(1)
-                    if key == '\x1b':  # ESC key
-                        print("\n⚠️ ESC pressed - Cancelling...")
-                        self.cancel_requested = True
-                        self.claude_client.cancel()
-                        if self.tts_engine:
-                            self.tts_engine.stop()
-                        break
-        except:
-            pass
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            self.cancel_requested = True  # Stop voice monitoring
+            return self.audio_recorder.frames_rms(frames) > gate
+        except Exception:
+            # Mocked recorders without real PCM bytes: assume voice
+            return True
+
+    def _listen_for_cancel(self):
+        """Listen for voice cancel commands.
+
+        ESC key presses are handled by the session keyboard monitor;
+        this thread only watches the microphone.
+        """
+        while not self.cancel_requested:
+            try:
+                # Quick recording with short timeout (quiet mode); 3 s
+                # windows halve the stream open/close churn of 2 s ones.
+                # The event lets _stop_cancel_listener abort a window
+                # mid-recording once Claude has answered
+                frames = self.audio_recorder.record_with_amplitude(
+                    timeout=3, quiet=True, cancel_event=self._cancel_event
+                )
+                if self.cancel_requested:
+                    return
+                if frames and len(frames) > 5 and self._frames_have_voice(frames):
+                    # Quick transcribe for cancel detection
+                    text = self.transcriber.quick_transcribe(frames)
+                    if text:
+                        match = _CANCEL_RE.search(text.lower())
+                        if match:
+                            print(f"\n⚠️ Heard '{match.group(1)}' - Cancelling...")
+                            self.cancel_requested = True
+                            self.claude_client.cancel()
+                            if self.tts_engine:
+                                self.tts_engine.stop()
+                            return
+            except:
+                pass
+            time.sleep(0.1)
     
     def conversation_mode(self):
         """Run continuous conversation mode with inactivity timeout."""
@@ -372,12 +570,14 @@ class VoiceInterface:
         if self.profile_manager.current_profile:
             print(f"📁 Current profile: {self.profile_manager.current_profile}")
             self.speak(f"Using profile: {self.profile_manager.current_profile}")
-        
-        last_activity_time = time.time()
+
+        # Monotonic clock for the inactivity delta: wall-clock jumps
+        # (NTP, DST) can neither fire nor starve the timeout
+        last_activity_time = time.perf_counter()
         
         while True:
             # Check for 2-minute inactivity timeout
-            if (time.time() - last_activity_time) > 120:  # 2 minutes
+            if (time.perf_counter() - last_activity_time) > 120:  # 2 minutes
                 self.speak("Conversation timed out. Returning to wake mode.")
                 break
             
@@ -386,7 +586,7 @@ class VoiceInterface:
             if not text:
                 continue
             
-            last_activity_time = time.time()  # Reset activity timer
+            last_activity_time = time.perf_counter()  # Reset activity timer
             
             # Check for exit
             if self._is_goodbye_command(text):
@@ -441,34 +641,26 @@ class VoiceInterface:
         
         print(f"🎤 Listening for '{self.config.wake_word}'...")
         
-        last_activity_time = time.time()
+        last_activity_time = time.perf_counter()
         
         while True:
             # Check for inactivity timeout
-            if (time.time() - last_activity_time) > self.config.vad.inactivity_timeout:
+            if (time.perf_counter() - last_activity_time) > self.config.vad.inactivity_timeout:
                 print("\n⏱️ Inactivity timeout")
                 print(f"🎤 Still listening for '{self.config.wake_word}'...")
                 time.sleep(1)
-                last_activity_time = time.time()
+                last_activity_time = time.perf_counter()
                 continue
             
             if self.detect_wake_word(quiet=True):
-                last_activity_time = time.time()
+                last_activity_time = time.perf_counter()
                 
                 # Enter conversation session
                 print("\n🎭 Entering conversation session...")
                 print("Say 'goodbye' to return to wake word mode\n")
                 
                 # Acknowledge with variation
-                import random
-                responses = [
-                    "Yes?",
-                    "How can I help?",
-                    "What can I do for you?",
-                    "I'm listening.",
-                    "Go ahead.",
-                ]
-                self.speak(random.choice(responses), friendly=True)
+                self.speak(random.choice(_ACK_RESPONSES), friendly=True)
                 
                 # Track inactivity in conversation session
                 inactive_count = 0
@@ -491,18 +683,12 @@ class VoiceInterface:
                     
                     # Reset inactivity counter when we get speech
                     inactive_count = 0
-                    last_activity_time = time.time()
+                    last_activity_time = time.perf_counter()
                     
                     # Check if user wants to end conversation
                     lower_text = text.lower().strip()
                     if self._is_goodbye_command(text):
-                        farewells = [
-                            "Goodbye! Say hey Claude when you need me again.",
-                            "See you later! Just say hey Claude to chat again.",
-                            "Cheerio! I'll be here when you need me.",
-                            "Bye for now! Call me anytime.",
-                        ]
-                        self.speak(random.choice(farewells), friendly=True)
+                        self.speak(random.choice(_FAREWELLS), friendly=True)
                         print(f"\n👂 Returning to wake word mode.")
                         print(f"🎤 Listening for '{self.config.wake_word}'...")
                         break
@@ -529,8 +715,6 @@ class VoiceInterface:
     
     def check_session_status(self):
         """Check and display current session status."""
-        from pathlib import Path
-        
         # Check for existing session based on current profile
         profile_path = self.profile_manager.get_current_profile_path()
         
@@ -551,4 +735,11 @@ class VoiceInterface:
         """Clean up resources."""
         self.audio_recorder.cleanup()
         if self.tts_engine:
-            self.tts_engine.stop()
\ No newline at end of file
+            self.tts_engine.stop()
+        # Leave the terminal as we found it (cbreak was set once at init)
+        if self._stdin_settings is not None:
+            try:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._stdin_settings)
+            except Exception:
+                pass
+            self._stdin_settings = None
\ No newline at end of file
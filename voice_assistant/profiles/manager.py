@@ -1,14 +1,87 @@
 """Profile management for different conversation contexts."""
 
+import functools
 import json
+import os
 import re
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import FrozenSet, Optional, List, Dict, Any
 
 from ..config import ProfileConfig
 
+# Compiled once instead of re-parsed on every sanitization
+_RE_PUNCT = re.compile(r'[^\w\s-]')
+_RE_SPACES = re.compile(r'[-\s]+')
+
+# Punctuation stripped when deriving load_profile name candidates
+_STRIP_PUNCT = str.maketrans('', '', ',.')
+
+# Initial CLAUDE.md contents; formatted once per created profile
+_PROFILE_TEMPLATE = """# Profile: {profile}
+
+## Context
+This is a specialized conversation profile for {profile}.
+
+## Instructions
+- Maintain context specific to this profile
+- Remember previous conversations in this profile
+- Adapt responses to the profile's purpose
+
+## Notes
+Created: {cwd}
+"""
+
+
+def _write_bytes(path, payload: bytes):
+    """Write a small payload in one open/write/close at the os layer,
+    skipping the text-mode io stack entirely."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _bigrams(s: str) -> FrozenSet[str]:
+    """Character bigrams of a name (the name itself if too short)."""
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1)) or frozenset((s,))
+
+
+def _levenshtein(a: str, b: str, cutoff: int) -> int:
+    """Bounded edit distance; returns cutoff + 1 as soon as no row can
+    stay within cutoff, so hopeless candidates exit early."""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > cutoff:
+        return cutoff + 1
+    prev = list(range(len(a) + 1))
+    for i, cb in enumerate(b, 1):
+        cur = [i]
+        best = i
+        for j, ca in enumerate(a, 1):
+            cost = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            cur.append(cost)
+            if cost < best:
+                best = cost
+        if best > cutoff:
+            return cutoff + 1
+        prev = cur
+    return prev[-1]
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_profile_name(name: str) -> str:
+    """Sanitize a profile name for the filesystem.
+
+    Pure function of a small, recurring set of spoken names, so the
+    regex work is memoized across calls.
+    """
+    name = _RE_PUNCT.sub('', name.lower())
+    name = _RE_SPACES.sub('_', name)
+    return name.strip('_')
+
 
 class ProfileManager:
     """Manages conversation profiles and contexts."""
@@ -19,9 +92,25 @@ class ProfileManager:
         self.reset_context_mode = False
         self.session_id: Optional[str] = None
         self.session_started: Optional[datetime] = None
+        # Memoized current-profile path; keyed by the profile name so it
+        # self-invalidates whenever current_profile changes
+        self._profile_path_cache: Optional[Path] = None
+        # Directory listing cache, invalidated by the context dir's
+        # mtime (and explicitly by create_profile)
+        self._profiles_cache: Optional[List[str]] = None
+        self._dir_names_cache: FrozenSet[str] = frozenset()
+        self._profiles_cache_mtime = -1
+        # Bigram index over profile names, built lazily for fuzzy lookup
+        # and kept in step with the directory cache
+        self._bigram_index: Optional[Dict[str, set]] = None
+        self._bigram_index_mtime = -1
         
-        # Ensure context directory exists
+        # Last state JSON written to disk, to skip no-op rewrites
+        self._last_written_state: Optional[str] = None
+
+        # Ensure context and state directories exist (once, not per save)
         self.config.context_dir.mkdir(parents=True, exist_ok=True)
+        self.config.profile_state_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Load last used profile and session
         self._load_last_profile()
@@ -57,16 +146,23 @@ class ProfileManager:
     
     def _save_last_profile(self):
         """Save the current profile and session to state file."""
-        self.config.profile_state_file.parent.mkdir(parents=True, exist_ok=True)
-        
         state = {
             "last_profile": self.current_profile,
             "session_id": self.session_id,
             "session_started": self.session_started.isoformat() if self.session_started else None
         }
-        
-        with open(self.config.profile_state_file, "w") as f:
-            json.dump(state, f, indent=2)
+
+        # Skip the write when nothing changed since the last save
+        payload = json.dumps(state, indent=2)
+        if payload == self._last_written_state:
+            return
+
+        # Atomic replace: a crash mid-write can't leave a partial file
+        state_file = self.config.profile_state_file
+        tmp_path = state_file.with_name(state_file.name + ".tmp")
+        _write_bytes(tmp_path, payload.encode("utf-8"))
+        os.replace(tmp_path, state_file)
+        self._last_written_state = payload
     
     def _start_new_session(self):
         """Start a new session with UUID."""
@@ -74,17 +170,108 @@ class ProfileManager:
         self.session_started = datetime.now()
         # Don't print session ID - let Claude CLI handle this
     
+    def _scan_context_dir(self):
+        """Refresh the cached directory listing if the context dir changed.
+
+        One scandir pass feeds both the marker-filtered profile list and
+        the set of all profile directory names; the context dir's mtime
+        only moves when entries are added or removed, so unchanged
+        directories cost a single stat here.
+        """
+        try:
+            mtime = os.stat(self.config.context_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._profiles_cache = []
+            self._dir_names_cache = frozenset()
+            self._profiles_cache_mtime = -1
+            return
+
+        if self._profiles_cache is not None and mtime == self._profiles_cache_mtime:
+            return
+
+        profiles = []
+        dir_names = set()
+        with os.scandir(self.config.context_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                dir_names.add(entry.name)
+                if os.path.isfile(os.path.join(entry.path, "CLAUDE.md")):
+                    profiles.append(entry.name)
+
+        self._profiles_cache = sorted(profiles)
+        self._dir_names_cache = frozenset(dir_names)
+        self._profiles_cache_mtime = mtime
+
+    def _invalidate_profiles_cache(self):
+        """Force the next directory access to rescan."""
+        self._profiles_cache = None
+        self._profiles_cache_mtime = -1
+        self._bigram_index = None
+        self._bigram_index_mtime = -1
+
+    def _fuzzy_match(self, sanitized_name: str) -> Optional[str]:
+        """Find the closest profile name via bigram overlap.
+
+        Candidates come from a bigram index (one dict lookup per query
+        bigram, instead of a substring scan of every profile), ranked by
+        Jaccard similarity; near-misses are confirmed with a bounded
+        edit distance so a typo like 'britsh_male' still finds
+        'british_male' without false-matching unrelated names.
+        """
+        self._scan_context_dir()
+        if (
+            self._bigram_index is None
+            or self._bigram_index_mtime != self._profiles_cache_mtime
+        ):
+            index: Dict[str, set] = {}
+            for name in self._profiles_cache:
+                for gram in _bigrams(name):
+                    index.setdefault(gram, set()).add(name)
+            self._bigram_index = index
+            self._bigram_index_mtime = self._profiles_cache_mtime
+
+        query_grams = _bigrams(sanitized_name)
+        candidates = set()
+        for gram in query_grams:
+            candidates |= self._bigram_index.get(gram, set())
+        if not candidates:
+            return None
+
+        scored = sorted(
+            (
+                (
+                    len(query_grams & grams) / len(query_grams | grams),
+                    name,
+                )
+                for name in candidates
+                for grams in (_bigrams(name),)
+            ),
+            reverse=True,
+        )
+
+        for jaccard, name in scored[:3]:
+            # Containment keeps the previous substring-match behaviour
+            if sanitized_name in name or name in sanitized_name:
+                return name
+            if jaccard < 0.4:
+                break
+            cutoff = max(2, len(name) // 4)
+            if _levenshtein(sanitized_name, name, cutoff) <= cutoff:
+                return name
+        return None
+
     def _profile_exists(self, profile_name: str) -> bool:
         """Check if a profile exists."""
-        profile_dir = self.config.context_dir / self._sanitize_name(profile_name)
-        return profile_dir.exists() and profile_dir.is_dir()
+        self._scan_context_dir()
+        return self._sanitize_name(profile_name) in self._dir_names_cache
     
-    def _sanitize_name(self, name: str) -> str:
+    @staticmethod
+    def _sanitize_name(name: str) -> str:
         """Sanitize profile name for filesystem."""
-        # Remove punctuation and replace spaces with underscores
-        name = re.sub(r'[^\w\s-]', '', name.lower())
-        name = re.sub(r'[-\s]+', '_', name)
-        return name.strip('_')
+        return _sanitize_profile_name(name)
     
     def create_profile(self, profile_name: str) -> bool:
         """
@@ -107,23 +294,12 @@ class ProfileManager:
         
         # Create CLAUDE.md with initial content
         claude_md = profile_dir / "CLAUDE.md"
-        initial_content = f"""# Profile: {profile_name}
-
-## Context
-This is a specialized conversation profile for {profile_name}.
-
-## Instructions
-- Maintain context specific to this profile
-- Remember previous conversations in this profile
-- Adapt responses to the profile's purpose
+        initial_content = _PROFILE_TEMPLATE.format(
+            profile=profile_name, cwd=Path.cwd()
+        )
+        _write_bytes(claude_md, initial_content.encode("utf-8"))
 
-## Notes
-Created: {Path.cwd()}
-"""
-        
-        with open(claude_md, "w") as f:
-            f.write(initial_content)
-        
+        self._invalidate_profiles_cache()
         return True
     
     def list_profiles(self) -> List[str]:
@@ -133,18 +309,8 @@ Created: {Path.cwd()}
         Returns:
             List of profile names
         """
-        profiles = []
-        
-        if not self.config.context_dir.exists():
-            return profiles
-        
-        for item in self.config.context_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                # Check if it has a CLAUDE.md file
-                if (item / "CLAUDE.md").exists():
-                    profiles.append(item.name)
-        
-        return sorted(profiles)
+        self._scan_context_dir()
+        return list(self._profiles_cache)
     
     def load_profile(self, profile_name: str) -> Optional[Path]:
         """
@@ -156,41 +322,37 @@ Created: {Path.cwd()}
         Returns:
             Path to the profile directory if successful
         """
-        # Try multiple name resolution strategies
-        strategies = [
-            # 1. Try exact sanitized name
-            lambda n: self._sanitize_name(n),
-            # 2. Try with underscores for spaces
-            lambda n: n.lower().replace(' ', '_').replace(',', '').replace('.', ''),
-            # 3. Try without any spaces
-            lambda n: n.lower().replace(' ', '').replace(',', '').replace('.', ''),
-            # 4. Try with dashes for spaces
-            lambda n: n.lower().replace(' ', '-').replace(',', '').replace('.', ''),
-            # 5. Try as-is (already sanitized by user)
-            lambda n: n.lower(),
-        ]
-        
+        # Candidate names derived in one pass from a shared lowercased,
+        # punctuation-stripped base (same order and output as the old
+        # per-call lambda strategies): sanitized form, each separator
+        # style for spaces, then the name as spoken
+        base = profile_name.lower().translate(_STRIP_PUNCT)
+        candidates = (
+            self._sanitize_name(profile_name),
+            base.replace(' ', '_'),
+            base.replace(' ', ''),
+            base.replace(' ', '-'),
+            profile_name.lower(),
+        )
+
+        # All candidates resolve against one cached scandir pass: O(1)
+        # set membership instead of a stat per candidate name
+        self._scan_context_dir()
         profile_dir = None
-        for strategy in strategies:
-            test_name = strategy(profile_name)
-            test_dir = self.config.context_dir / test_name
-            
-            if test_dir.exists() and test_dir.is_dir():
-                profile_dir = test_dir
+        for test_name in candidates:
+            if test_name in self._dir_names_cache:
+                profile_dir = self.config.context_dir / test_name
                 print(f"✓ Found profile '{test_name}' using strategy")
                 break
-        
+
         # If still not found, try fuzzy matching against existing profiles
-        if not profile_dir or not profile_dir.exists():
-            profiles = self.list_profiles()
-            sanitized_name = self._sanitize_name(profile_name)
-            
-            for p in profiles:
-                if sanitized_name in p or p in sanitized_name:
-                    profile_dir = self.config.context_dir / p
-                    print(f"✓ Found profile '{p}' via fuzzy match")
-                    break
+        if profile_dir is None:
+            match = self._fuzzy_match(self._sanitize_name(profile_name))
+            if match:
+                profile_dir = self.config.context_dir / match
+                print(f"✓ Found profile '{match}' via fuzzy match")
             else:
+                profiles = self.list_profiles()
                 print(f"✗ Could not find profile matching '{profile_name}'")
                 print(f"  Available profiles: {', '.join(profiles) if profiles else 'none'}")
                 return None
@@ -213,9 +375,15 @@ Created: {Path.cwd()}
     
     def get_current_profile_path(self) -> Optional[Path]:
         """Get the path to the current profile directory."""
-        if self.current_profile:
-            return self.config.context_dir / self.current_profile
-        return None
+        if not self.current_profile:
+            return None
+        # Path construction walks and re-parses every component; this is
+        # called on every query, so cache the joined Path per profile
+        cache = self._profile_path_cache
+        if cache is None or cache.name != self.current_profile:
+            cache = self.config.context_dir / self.current_profile
+            self._profile_path_cache = cache
+        return cache
     
     def reset_context(self):
         """Reset the current conversation but keep the profile loaded."""
@@ -251,11 +419,13 @@ Created: {Path.cwd()}
         
         if claude_md.exists():
             try:
-                with open(claude_md) as f:
-                    content = f.read()
-                    # Extract first few lines as description
-                    lines = content.split("\n")
-                    info["description"] = "\n".join(lines[:5])
+                # Bounded read: only the first few KB matter for the
+                # description, so don't pull a large file into memory
+                with open(claude_md, encoding="utf-8", errors="replace") as f:
+                    head = f.read(4096)
+                if head:
+                    # maxsplit stops the scan after the fifth newline
+                    info["description"] = "\n".join(head.split("\n", 6)[:5])
             except:
                 pass
         
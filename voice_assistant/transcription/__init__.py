@@ -1,5 +1,6 @@
 """Transcription modules for speech-to-text."""
 
 from .whisper import WhisperTranscriber
+from .streamer import TranscriptionStreamer
 
-__all__ = ["WhisperTranscriber"]
\ No newline at end of file
+__all__ = ["WhisperTranscriber", "TranscriptionStreamer"]
\ No newline at end of file
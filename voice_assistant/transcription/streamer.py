@@ -0,0 +1,99 @@
+"""Sliding-window streaming transcription over a live recording."""
+
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+
+class TranscriptionStreamer:
+    """Transcribes overlapping windows while audio is still being captured.
+
+    The recorder feeds normalized float32 samples as they arrive; a
+    background worker transcribes the audio since the last commit point on
+    roughly one-second hops, so most of the utterance is already decoded
+    when recording stops. Long stretches are committed and the window
+    anchor advances, with the committed text passed as ``initial_prompt``
+    to keep the decoder's context across the boundary. ``finalize`` then
+    only has to transcribe the short tail recorded since the last commit.
+    """
+
+    def __init__(
+        self,
+        transcriber,
+        sample_rate: int = 16000,
+        hop_seconds: float = 1.0,
+        commit_seconds: float = 5.0,
+    ):
+        self.transcriber = transcriber
+        self.sample_rate = sample_rate
+        self.hop = int(hop_seconds * sample_rate)
+        self.commit_after = int(commit_seconds * sample_rate)
+        self.committed = ""
+        self.partial_text = ""
+        self._chunks: List[np.ndarray] = []
+        self._total = 0
+        self._anchor = 0  # Start of the uncommitted window
+        self._last_submitted = 0
+        self._worker: Optional[threading.Thread] = None
+
+    def feed(self, samples: np.ndarray):
+        """Append newly captured samples (float32 mono, copied)."""
+        # Copy: the recorder's arena slice is overwritten by later chunks
+        self._chunks.append(np.array(samples, dtype=np.float32))
+        self._total += len(samples)
+
+        if self._total - self._last_submitted < self.hop or self._busy():
+            return
+
+        self._last_submitted = self._total
+        window = self._window_audio(self._total)
+        commit = self._total - self._anchor >= self.commit_after
+        self._worker = threading.Thread(
+            target=self._transcribe_window,
+            args=(window, self._total, commit),
+            daemon=True,
+        )
+        self._worker.start()
+
+    def finalize(self) -> Optional[str]:
+        """Transcribe the remaining tail and return the full utterance text."""
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        if self._total == 0:
+            return self.committed.strip() or None
+
+        tail = None
+        if self._total > self._anchor:
+            tail = self.transcriber.transcribe_array(
+                self._window_audio(self._total),
+                initial_prompt=self.committed or None,
+            )
+
+        text = f"{self.committed} {tail}".strip() if tail else self.committed.strip()
+        return text or None
+
+    def _busy(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _window_audio(self, end: int) -> np.ndarray:
+        """Concatenate buffered samples from the current anchor up to end."""
+        audio = np.concatenate(self._chunks) if len(self._chunks) > 1 else self._chunks[0]
+        return audio[self._anchor:end]
+
+    def _transcribe_window(self, window: np.ndarray, end: int, commit: bool):
+        try:
+            text = self.transcriber.transcribe_array(
+                window, initial_prompt=self.committed or None
+            )
+        except Exception:
+            return
+        if not text:
+            return
+        if commit:
+            self.committed = f"{self.committed} {text}".strip()
+            self._anchor = end
+            self.partial_text = self.committed
+        else:
+            self.partial_text = f"{self.committed} {text}".strip()
@@ -1,6 +1,8 @@
 """Whisper-based speech transcription."""
 
+import os
 import tempfile
+import threading
 import wave
 from typing import List, Optional
 
@@ -14,8 +16,20 @@ except ImportError:
     WHISPER_AVAILABLE = False
     whisper = None
 
+try:
+    # CTranslate2 backend: int8 weights + C++ SIMD kernels, same model names
+    from faster_whisper import WhisperModel as FasterWhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    FasterWhisperModel = None
+
 from ..config import TranscriptionConfig, AudioConfig
 
+# Transcriptions that are pure noise artifacts; frozenset membership
+# is one hash probe instead of a list scan per utterance
+_NOISE_TEXTS = frozenset({".", ",", "?", "!", "...", "---"})
+
 
 class WhisperTranscriber:
     """Handles speech-to-text using OpenAI Whisper."""
@@ -24,105 +38,270 @@ class WhisperTranscriber:
         self.config = config
         self.audio_config = audio_config
         self.model = None
+        # Resolved once: both are constants for the session, and the old
+        # per-call pyaudio.PyAudio() spun up PortAudio (full host/device
+        # enumeration) just to read the sample width
+        self._pa_format = getattr(pyaudio, f"pa{audio_config.format.title()}")
+        self._sample_width = pyaudio.get_sample_size(self._pa_format)
         
-        if WHISPER_AVAILABLE:
+        self._tiny_lock = threading.Lock()
+        if WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE:
             self._load_model()
+            self._prewarm_tiny_model()
         else:
             print("Warning: Whisper not installed. Install with: pip install openai-whisper")
-    
-    def _load_model(self):
-        """Load the Whisper model."""
-        if not WHISPER_AVAILABLE:
+
+    def _prewarm_tiny_model(self):
+        """Resolve the wake-word model ahead of the first utterance.
+
+        When the main model is already 'tiny' it is shared outright
+        rather than loading a second copy of the same weights;
+        otherwise the tiny model loads on a background thread so the
+        first wake-word check doesn't pay the cold start.
+        """
+        if self.model is not None and self.config.model_size == "tiny":
+            self._tiny_model = self.model
             return
-        
+        threading.Thread(target=self._get_tiny_model, daemon=True).start()
+
+    def _load_model(self):
+        """Load the Whisper model (preferring the faster-whisper backend)."""
         print(f"Loading Whisper model '{self.config.model_size}'...")
         try:
-            self.model = whisper.load_model(self.config.model_size)
-            print(f"✓ Whisper {self.config.model_size} model loaded")
+            if FASTER_WHISPER_AVAILABLE:
+                self.model = FasterWhisperModel(
+                    self.config.model_size,
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=min(4, os.cpu_count() or 1),
+                )
+                print(f"✓ faster-whisper {self.config.model_size} model loaded (int8)")
+            else:
+                self.model = whisper.load_model(self.config.model_size)
+                print(f"✓ Whisper {self.config.model_size} model loaded")
         except Exception as e:
             print(f"Error loading Whisper model: {e}")
             self.model = None
+
+    @staticmethod
+    def _run_transcription(
+        model,
+        audio,
+        language: str,
+        temperature: float,
+        initial_prompt: Optional[str] = None,
+    ) -> str:
+        """Run a model on a WAV path or float32 waveform, handling both backends."""
+        if FASTER_WHISPER_AVAILABLE and isinstance(model, FasterWhisperModel):
+            segments, _ = model.transcribe(
+                audio,
+                language=language,
+                temperature=temperature,
+                initial_prompt=initial_prompt,
+                beam_size=1,
+            )
+            return "".join(segment.text for segment in segments).strip()
+
+        result = model.transcribe(
+            audio,
+            language=language,
+            task="transcribe",
+            temperature=temperature,
+            initial_prompt=initial_prompt,
+        )
+        return result["text"].strip()
+
+    def transcribe_array(
+        self, audio: np.ndarray, initial_prompt: Optional[str] = None
+    ) -> Optional[str]:
+        """Transcribe an in-memory float32 waveform (16 kHz mono).
+
+        Skips the temporary-WAV round trip; used by the streaming path.
+        """
+        if not self.model or audio is None or len(audio) == 0:
+            return None
+
+        text = self._run_transcription(
+            self.model,
+            audio,
+            language=self.config.language,
+            temperature=self.config.temperature,
+            initial_prompt=(
+                initial_prompt if initial_prompt is not None
+                else self.config.initial_prompt
+            ),
+        )
+
+        # Same ASCII validation as the file-based path: the codec drops
+        # non-ASCII codepoints in one C-level pass
+        text = text.encode('ascii', errors='ignore').decode('ascii')
+
+        return text or None
     
+    def transcribe_utterance(self, audio: np.ndarray) -> Optional[str]:
+        """Transcribe a complete in-memory utterance (16 kHz float32).
+
+        Zero-copy variant of transcribe(): callers hand in the
+        recorder's arena view directly, skipping the bytes-join, temp
+        WAV and int16->float32 conversion. Applies the same duration
+        and noise filters as the file-based path.
+        """
+        if not self.model or audio is None or audio.size == 0:
+            return None
+
+        duration = audio.size / self.audio_config.sample_rate
+        if duration < self.config.min_audio_length:
+            return None
+
+        print("🔄 Transcribing...")
+        text = self.transcribe_array(audio)
+
+        # Filter out noise (single characters, just punctuation, etc.)
+        if not text or len(text) <= 1 or text in _NOISE_TEXTS:
+            return None
+
+        return text
+
+    def _frames_to_float32(self, audio_frames: List[bytes]) -> Optional[np.ndarray]:
+        """Decode captured int16 frames to the normalized float32 mono
+        waveform Whisper expects, or None when the stream format still
+        needs the WAV/ffmpeg pipeline (non-16 kHz or non-int16)."""
+        if (
+            self.audio_config.sample_rate != 16000
+            or self.audio_config.channels != 1
+            or self._pa_format != pyaudio.paInt16
+        ):
+            return None
+        pcm = np.frombuffer(b"".join(audio_frames), dtype=np.int16)
+        return np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
+
     def transcribe(self, audio_frames: List[bytes]) -> Optional[str]:
         """Transcribe audio frames to text."""
         if not self.model or not audio_frames:
             return None
-        
-        # Save audio to temporary file
+
+        # Duration guard before the model: too-short clips never pay
+        # for a Whisper pass at all
+        audio_duration = len(audio_frames) * self.audio_config.chunk_size / self.audio_config.sample_rate
+        if audio_duration < self.config.min_audio_length:
+            return None
+
+        # In-memory path: hand Whisper the float32 waveform directly,
+        # skipping the temp WAV write and the ffmpeg decode subprocess
+        audio = self._frames_to_float32(audio_frames)
+        if audio is not None:
+            print("🔄 Transcribing...")
+            text = self.transcribe_array(audio)
+
+            # Filter out noise (single characters, just punctuation, etc.)
+            # But allow numbers and number sequences
+            if not text or len(text) <= 1 or text in _NOISE_TEXTS:
+                return None
+            return text
+
+        # Fallback for formats ffmpeg has to decode/resample
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
             with wave.open(tmp_file.name, "wb") as wf:
                 wf.setnchannels(self.audio_config.channels)
-                wf.setsampwidth(pyaudio.PyAudio().get_sample_size(
-                    getattr(pyaudio, f"pa{self.audio_config.format.title()}")
-                ))
+                wf.setsampwidth(self._sample_width)
                 wf.setframerate(self.audio_config.sample_rate)
                 wf.writeframes(b"".join(audio_frames))
-            
+
             # Transcribe with Whisper
             print("🔄 Transcribing...")
-            result = self.model.transcribe(
+            text = self._run_transcription(
+                self.model,
                 tmp_file.name,
                 language=self.config.language,
-                task="transcribe",
                 temperature=self.config.temperature,
                 initial_prompt=self.config.initial_prompt,
             )
-            
-            text = result["text"].strip()
-            
-            # Handle minimum audio length
-            audio_duration = len(audio_frames) * self.audio_config.chunk_size / self.audio_config.sample_rate
-            if audio_duration < self.config.min_audio_length:
-                return None
-            
-            # ASCII validation - filter non-ASCII characters
-            try:
-                text.encode('ascii')
-            except UnicodeEncodeError:
-                # Remove non-ASCII characters
-                text = ''.join(char for char in text if ord(char) < 128)
-            
+
+            # ASCII validation - the codec drops non-ASCII characters
+            # in one C-level pass, no per-codepoint Python loop
+            text = text.encode('ascii', errors='ignore').decode('ascii')
+
             # Filter out noise (single characters, just punctuation, etc.)
             # But allow numbers and number sequences
-            if len(text) <= 1 or text in [".", ",", "?", "!", "...", "---"]:
+            if len(text) <= 1 or text in _NOISE_TEXTS:
                 return None
-            
+
             return text
     
+    def _get_tiny_model(self):
+        """Lazily load (and cache) the tiny model used for wake words.
+
+        The lock keeps the background pre-warm and a first wake-word
+        call from loading the weights twice.
+        """
+        with self._tiny_lock:
+            if not hasattr(self, "_tiny_model"):
+                try:
+                    if FASTER_WHISPER_AVAILABLE:
+                        self._tiny_model = FasterWhisperModel(
+                            "tiny",
+                            device="cpu",
+                            compute_type="int8",
+                            cpu_threads=min(4, os.cpu_count() or 1),
+                        )
+                    else:
+                        self._tiny_model = whisper.load_model("tiny")
+                except:
+                    self._tiny_model = self.model
+            return self._tiny_model
+
+    def quick_transcribe_array(self, audio: np.ndarray) -> Optional[str]:
+        """Wake-word transcription from an in-memory float32 waveform.
+
+        Skips the temp-WAV round trip quick_transcribe pays; used with
+        the recorder's arena view on every wake-word window.
+        """
+        if not (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
+            return None
+        if audio is None or audio.size == 0:
+            return None
+
+        model = self._get_tiny_model()
+        if not model:
+            return None
+
+        try:
+            text = self._run_transcription(model, audio, language="en", temperature=0.0)
+            return text.lower()
+        except Exception:
+            return None
+
     def quick_transcribe(self, audio_frames: List[bytes]) -> Optional[str]:
         """Quick transcription for wake word detection (uses tiny model if available)."""
-        if not WHISPER_AVAILABLE:
+        if not (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
             return None
-        
+
+        # In-memory path mirrors transcribe(): no temp WAV, no ffmpeg
+        audio = self._frames_to_float32(audio_frames)
+        if audio is not None:
+            return self.quick_transcribe_array(audio)
+
         # Use tiny model for speed
-        if not hasattr(self, "_tiny_model"):
-            try:
-                self._tiny_model = whisper.load_model("tiny")
-            except:
-                self._tiny_model = self.model
-        
-        if not self._tiny_model:
+        if not self._get_tiny_model():
             return None
-        
+
         try:
             # Save to temp file
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
                 with wave.open(tmp_file.name, "wb") as wf:
                     wf.setnchannels(self.audio_config.channels)
-                    wf.setsampwidth(pyaudio.PyAudio().get_sample_size(
-                        getattr(pyaudio, f"pa{self.audio_config.format.title()}")
-                    ))
+                    wf.setsampwidth(self._sample_width)
                     wf.setframerate(self.audio_config.sample_rate)
                     wf.writeframes(b"".join(audio_frames))
                 
                 # Quick transcribe with tiny model
-                result = self._tiny_model.transcribe(
+                text = self._run_transcription(
+                    self._tiny_model,
                     tmp_file.name,
                     language="en",
-                    task="transcribe",
                     temperature=0.0,
                 )
-                
-                return result["text"].strip().lower()
+
+                return text.lower()
         except:
             return None
\ No newline at end of file
@@ -31,6 +31,16 @@ class TTSEngine(ABC):
     def stop(self):
         """Stop current speech."""
         pass
+
+    def warm(self, text: str):
+        """
+        Synthesize text into the cache without playing it.
+
+        Used to pre-warm recurring prompts at startup so their first
+        spoken occurrence is a cache hit. Engines without synthesis
+        caching can leave this as a no-op.
+        """
+        pass
     
     @property
     @abstractmethod
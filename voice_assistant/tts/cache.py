@@ -0,0 +1,61 @@
+"""Disk cache for synthesized TTS audio.
+
+Assistant speech repeats heavily (acknowledgements, prompts, timeout
+messages), so synthesized WAVs are cached content-addressed by engine,
+voice, speech rate and text. A cache hit turns synthesis into a file
+lookup.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / ".claude" / "tts_cache"
+MAX_ENTRIES = 500
+
+
+def cache_key(engine: str, voice: str, speech_rate: float, text: str) -> str:
+    """Build the content address for one synthesized utterance."""
+    raw = f"{engine}|{voice}|{speech_rate}|{text}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def get(key: str) -> Optional[Path]:
+    """Return the cached WAV for key, refreshing its LRU timestamp."""
+    path = CACHE_DIR / f"{key}.wav"
+    if path.exists():
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+    return None
+
+
+def put(key: str, wav_path: Path) -> Path:
+    """Move a freshly synthesized WAV into the cache and return its new path."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        target = CACHE_DIR / f"{key}.wav"
+        os.replace(wav_path, target)
+        _evict()
+        return target
+    except OSError:
+        # Cache unavailable - keep using the temp file
+        return wav_path
+
+
+def contains(path: Path) -> bool:
+    """Check whether a path lives inside the cache (and must not be deleted)."""
+    return path.parent == CACHE_DIR
+
+
+def _evict():
+    """Drop least-recently-used entries beyond MAX_ENTRIES."""
+    entries = sorted(CACHE_DIR.glob("*.wav"), key=lambda p: p.stat().st_mtime)
+    for path in entries[:-MAX_ENTRIES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
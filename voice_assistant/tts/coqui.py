@@ -1,5 +1,8 @@
 """Coqui TTS implementation."""
 
+import contextlib
+import logging
+import os
 import queue
 import re
 import tempfile
@@ -7,6 +10,7 @@ import threading
 from pathlib import Path
 from typing import List, Optional
 
+from . import cache
 from .base import TTSEngine
 from ..audio import AudioPlayer
 
@@ -20,10 +24,23 @@ try:
     
     from TTS.api import TTS
     COQUI_AVAILABLE = True
+
+    # Quiet Coqui's logger once at import; the remaining print()-based
+    # chatter is swallowed by the devnull redirect during synthesis
+    logging.getLogger("TTS").setLevel(logging.ERROR)
 except ImportError:
     COQUI_AVAILABLE = False
     TTS = None
 
+# Shared sink for synthesis output: opened once instead of allocating
+# two growing StringIO buffers per sentence
+_DEVNULL = open(os.devnull, "w")
+
+# Sentence/clause splitters compiled once per import instead of
+# re-parsed (and possibly evicted from the re cache) per utterance
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+|\s+-\s+')
+_COMMA_SPLIT = re.compile(r',\s+(?![0-9])')
+
 
 class CoquiTTS(TTSEngine):
     """Coqui TTS engine with natural-sounding voices."""
@@ -35,13 +52,23 @@ class CoquiTTS(TTSEngine):
         "p287": "p287",  # Female
     }
     
+    # Queue sentinels: end-of-utterance keeps the worker alive for the
+    # next speak(); shutdown terminates it
+    _END_OF_UTTERANCE = object()
+    _SHUTDOWN = object()
+
     def __init__(self, voice: str = "british_male", speech_rate: float = 1.1):
         super().__init__(voice, speech_rate)
         self.model = None
         self.audio_player = AudioPlayer(volume=0.5)
         self._audio_queue = queue.Queue()
-        self._playback_thread = None
-        
+        # One long-lived playback worker instead of a thread per speak()
+        self._utterance_done = threading.Event()
+        self._playback_thread = threading.Thread(
+            target=self._playback_worker, daemon=True
+        )
+        self._playback_thread.start()
+
         if COQUI_AVAILABLE:
             self._init_model()
     
@@ -76,70 +103,80 @@ class CoquiTTS(TTSEngine):
             # Split into sentences for streaming
             sentences = self._split_sentences(text)
             
-            # Clear the queue
-            while not self._audio_queue.empty():
-                self._audio_queue.get()
-            
-            # Start playback thread if not running
-            if self._playback_thread is None or not self._playback_thread.is_alive():
-                self._playback_thread = threading.Thread(target=self._playback_worker)
-                self._playback_thread.daemon = True
-                self._playback_thread.start()
-            
-            # Generate audio for each sentence
+            # Clear any leftovers (e.g. a stale stop() sentinel) without
+            # the empty()/get() race
+            self._drain_queue()
+            self._utterance_done.clear()
+
+
+            # Generate audio for each sentence (cache hit skips synthesis)
             for sentence in sentences:
                 if self.cancel_requested or not sentence:
                     break
-                
-                audio_file = self._generate_audio(sentence, friendly)
+
+                key = cache.cache_key("coqui", self.voice, self.speech_rate, sentence)
+                audio_file = cache.get(key)
+                if audio_file is None:
+                    audio_file = self._generate_audio(sentence, friendly)
+                    if audio_file:
+                        audio_file = cache.put(key, audio_file)
                 if audio_file:
                     self._audio_queue.put(audio_file)
             
-            # Wait for playback to complete
-            self._audio_queue.put(None)  # Signal end
-            if self._playback_thread:
-                self._playback_thread.join(timeout=30)
-            
+            # Wait for playback to complete; the worker sets the event
+            # when it reaches the end-of-utterance marker (or finishes a
+            # cancel drain). The wait is bounded and re-armed while
+            # playback is still making progress, so long responses
+            # aren't cut off but a lost marker can never block forever
+            self._audio_queue.put(self._END_OF_UTTERANCE)
+            while not self._utterance_done.wait(timeout=30):
+                if self._audio_queue.empty() and not self.audio_player.is_busy:
+                    break
+
             return not self.cancel_requested
             
         finally:
             self.is_speaking = False
     
+    def warm(self, text: str):
+        """Synthesize text into the cache without playing it."""
+        if not self.is_available:
+            return
+
+        text = self.preprocess_text(text)
+        if not text:
+            return
+
+        for sentence in self._split_sentences(text):
+            key = cache.cache_key("coqui", self.voice, self.speech_rate, sentence)
+            if cache.get(key) is None:
+                audio_file = self._generate_audio(sentence, friendly=False)
+                if audio_file:
+                    cache.put(key, audio_file)
+
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences for streaming with smart splitting."""
         # First split on sentence endings AND dashes
-        sentences = re.split(r'(?<=[.!?])\s+|\s+-\s+', text)
-        
+        sentences = _SENT_SPLIT.split(text)
+
         final_sentences = []
+        append = final_sentences.append
         for sentence in sentences:
-            # Further split long sentences on commas if needed
-            if len(sentence) > 150:  # Original threshold was 150
-                # Split on commas but protect numbers like "1,000"
-                parts = re.split(r',\s+(?![0-9])', sentence)
+            # Comma-split (protecting numbers like "1,000") when the
+            # sentence is long: always past 150 chars, past 100 only
+            # when it is comma-heavy. One len() and at most one count()
+            # per sentence, same thresholds as the old nested tree
+            length = len(sentence)
+            if length > 150 or (length > 100 and sentence.count(',') > 2):
+                parts = _COMMA_SPLIT.split(sentence)
                 if len(parts) > 1:
-                    for part in parts[:-1]:
-                        final_sentences.append(part + ",")
-                    final_sentences.append(parts[-1])
+                    final_sentences.extend(part + "," for part in parts[:-1])
+                    append(parts[-1])
                 else:
-                    final_sentences.append(sentence)
+                    append(sentence)
             else:
-                # Don't split short sentences on commas unless very long
-                if len(sentence) > 100:
-                    # Only split if there are multiple commas
-                    comma_count = sentence.count(',')
-                    if comma_count > 2:
-                        parts = re.split(r',\s+(?![0-9])', sentence)
-                        if len(parts) > 1:
-                            for part in parts[:-1]:
-                                final_sentences.append(part + ",")
-                            final_sentences.append(parts[-1])
-                        else:
-                            final_sentences.append(sentence)
-                    else:
-                        final_sentences.append(sentence)
-                else:
-                    final_sentences.append(sentence)
-        
+                append(sentence)
+
         return [s.strip() for s in final_sentences if s.strip()]
     
     def _generate_audio(self, text: str, friendly: bool) -> Optional[Path]:
@@ -150,73 +187,90 @@ class CoquiTTS(TTSEngine):
                 
                 # Friendly parameter no longer modifies text
                 # Coqui handles prosody well with proper punctuation
-                
-                # Suppress Coqui's verbose output
-                import sys
-                import io
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
-                sys.stdout = io.StringIO()
-                sys.stderr = io.StringIO()
-                
-                try:
-                    # Generate audio
+
+                # Suppress Coqui's print()-based chatter: discarded at
+                # the fd sink, nothing buffered or grown per sentence
+                with contextlib.redirect_stdout(_DEVNULL), \
+                     contextlib.redirect_stderr(_DEVNULL):
                     self.model.tts_to_file(
                         text=text,
                         speaker=speaker,
                         file_path=tmp_file.name,
                         speed=self.speech_rate,
                     )
-                finally:
-                    # Restore output streams
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
-                
+
                 return Path(tmp_file.name)
         except Exception as e:
             print(f"Error generating audio: {e}")
             return None
     
     
+    def _drain_queue(self):
+        """Empty the queue, unlinking any uncached temp files.
+
+        One critical section swaps the whole backlog out instead of a
+        lock acquisition per item; file cleanup happens after the lock
+        is released. join()/task_done() are unused here, so clearing
+        the underlying deque directly is safe.
+        """
+        with self._audio_queue.mutex:
+            stale = list(self._audio_queue.queue)
+            self._audio_queue.queue.clear()
+        for f in stale:
+            if isinstance(f, Path) and f.exists() and not cache.contains(f):
+                f.unlink()
+
     def _playback_worker(self):
-        """Worker thread for audio playback."""
+        """Long-lived worker thread for audio playback."""
         while True:
             try:
-                audio_file = self._audio_queue.get(timeout=1)
-                
-                if audio_file is None:  # End signal
+                # Block until work or a sentinel arrives; no periodic
+                # timeout wakeups while idle
+                item = self._audio_queue.get()
+
+                if item is self._SHUTDOWN:
                     break
-                
+
+                if item is self._END_OF_UTTERANCE:
+                    self._utterance_done.set()
+                    continue
+
                 if self.cancel_requested:
-                    # Clean up remaining files
-                    while not self._audio_queue.empty():
-                        f = self._audio_queue.get()
-                        if f and f.exists():
-                            f.unlink()
-                    break
-                
+                    # Clean up remaining files (cached entries stay).
+                    # The drain may swallow pending end-of-utterance
+                    # markers, so release the waiter here: a cancelled
+                    # speak() is done regardless
+                    if item.exists() and not cache.contains(item):
+                        item.unlink()
+                    self._drain_queue()
+                    self._utterance_done.set()
+                    continue
+
                 # Play the audio
-                self.audio_player.play_file(audio_file, blocking=True)
-                
-                # Clean up temp file
-                if audio_file.exists():
-                    audio_file.unlink()
-                    
-            except queue.Empty:
-                continue
+                self.audio_player.play_file(item, blocking=True)
+
+                # Clean up temp file (cached entries stay for reuse)
+                if item.exists() and not cache.contains(item):
+                    item.unlink()
+
             except Exception as e:
                 print(f"Playback error: {e}")
-    
+
     def stop(self):
         """Stop current speech."""
         self.cancel_requested = True
         self.audio_player.stop()
-        
-        # Clear the queue
-        while not self._audio_queue.empty():
-            try:
-                f = self._audio_queue.get_nowait()
-                if f and f.exists():
-                    f.unlink()
-            except:
-                pass
\ No newline at end of file
+
+        self._drain_queue()
+        # Queue an end marker in case the drain swallowed speak()'s own
+        # while the worker was idle; a stale marker is harmless - the
+        # next speak() drains the queue and clears the event first. The
+        # worker's cancel branch sets the event directly for the case
+        # where it drains mid-playback
+        self._audio_queue.put(self._END_OF_UTTERANCE)
+
+    def __del__(self):
+        try:
+            self._audio_queue.put(self._SHUTDOWN)
+        except Exception:
+            pass
\ No newline at end of file
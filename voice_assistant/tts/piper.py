@@ -1,26 +1,34 @@
 """Piper TTS implementation."""
 
+import json
+import queue
 import random
+import re
 import subprocess
 import tempfile
+import threading
+import wave
 from pathlib import Path
+from typing import List, Optional
 
+from . import cache
 from .base import TTSEngine
 from ..audio import AudioPlayer
+from ..audio.player import SOUNDDEVICE_AVAILABLE
 
 
 class PiperTTS(TTSEngine):
     """Piper TTS engine for fast, lightweight speech synthesis."""
-    
+
     PIPER_PATH = Path.home() / "scripts" / "piper"
-    
+
     VOICE_FILES = {
         "alan": "en_GB-alan-medium.onnx",
         "cori": "en_GB-cori-medium.onnx",
         "british_male": "en_GB-alan-medium.onnx",
         "british_female": "en_GB-cori-medium.onnx",
     }
-    
+
     FRIENDLY_PHRASES = [
         "Sure thing!",
         "Absolutely!",
@@ -31,85 +39,366 @@ class PiperTTS(TTSEngine):
         "My pleasure!",
         "Certainly!",
     ]
-    
+
     def __init__(self, voice: str = "alan", speech_rate: float = 1.0):
         super().__init__(voice, speech_rate)
         self.audio_player = AudioPlayer(volume=0.5)
+        self._audio_queue = queue.Queue()
+        self._playback_thread = None
+        # Resolved binary/voice paths and availability, cached per
+        # PIPER_PATH value (identity check) so nothing is re-statted on
+        # the per-utterance path
+        self._avail_for = None
+        self._resolved_for = None
+        # Long-running piper process (spawned lazily): the ONNX voice
+        # model loads once instead of once per sentence
+        self._proc: Optional[subprocess.Popen] = None
+        self._proc_lock = threading.Lock()
         self._check_installation()
-    
+
     def _check_installation(self):
         """Check if Piper is installed."""
-        if not self.PIPER_PATH.exists():
+        if not self.is_available:
             print(f"Warning: Piper not found at {self.PIPER_PATH}")
             print("Install with: ~/scripts/install-piper-tts.sh")
-    
+
+    def _resolve_paths(self):
+        """Stat the piper binary and voice model once per PIPER_PATH.
+
+        speak() used to lstat the install dir and the voice file on
+        every call; both are fixed for the life of the engine, so the
+        results (and the argv prefix built from them) are cached until
+        PIPER_PATH itself is swapped out.
+        """
+        path = self.PIPER_PATH
+        if self._resolved_for is path:
+            return
+        voice_file = self.VOICE_FILES.get(self.voice, "en_GB-alan-medium.onnx")
+        self._voice_path = path / voice_file
+        self._voice_ok = self._voice_path.exists()
+        self._argv_prefix = [str(path / "piper"), "--model", str(self._voice_path)]
+        self._resolved_for = path
+
     @property
     def is_available(self) -> bool:
         """Check if Piper TTS is available."""
-        return self.PIPER_PATH.exists()
-    
+        path = self.PIPER_PATH
+        if self._avail_for is not path:
+            self._available = path.exists()
+            self._avail_for = path
+        return self._available
+
     def speak(self, text: str, friendly: bool = False) -> bool:
-        """Speak text using Piper TTS."""
+        """Speak text using Piper TTS with sentence streaming.
+
+        Sentences are synthesized one at a time and handed to a playback
+        worker, so audio for the first sentence plays while later
+        sentences are still being generated.
+        """
         if not self.is_available:
             return False
-        
+
         text = self.preprocess_text(text)
         if not text:
             return True
-        
+
         self.is_speaking = True
         self.cancel_requested = False
-        
+
         try:
             # Add friendly prefix if requested
             if friendly:
                 prefix = random.choice(self.FRIENDLY_PHRASES)
                 text = f"{prefix} {text}"
-            
-            # Get voice file
-            voice_file = self.VOICE_FILES.get(self.voice, "en_GB-alan-medium.onnx")
-            voice_path = self.PIPER_PATH / voice_file
-            
-            if not voice_path.exists():
-                print(f"Voice file not found: {voice_path}")
+
+            # Voice file resolved (and statted) once per PIPER_PATH
+            self._resolve_paths()
+            if not self._voice_ok:
+                print(f"Voice file not found: {self._voice_path}")
                 return False
-            
-            # Generate audio
+
+            # Split into sentences for streaming
+            sentences = self._split_sentences(text)
+
+            # Clear the queue
+            while not self._audio_queue.empty():
+                self._audio_queue.get()
+
+            # Start playback thread if not running
+            if self._playback_thread is None or not self._playback_thread.is_alive():
+                self._playback_thread = threading.Thread(target=self._playback_worker)
+                self._playback_thread.daemon = True
+                self._playback_thread.start()
+
+            # Generate audio for each sentence (cache hit skips synthesis)
+            for sentence in sentences:
+                if self.cancel_requested or not sentence:
+                    break
+
+                key = cache.cache_key("piper", self.voice, self.speech_rate, sentence)
+                audio_file = cache.get(key)
+                if audio_file is not None:
+                    self._audio_queue.put(audio_file)
+                    continue
+
+                # Cache miss: the persistent process skips the per-call
+                # ONNX model load, the dominant cost of short sentences
+                audio_file = self._generate_audio_persistent(sentence)
+
+                # No persistent process: stream raw PCM off a one-shot
+                # piper's stdout when the device can take it, so playback
+                # starts before the sentence finishes synthesizing
+                if audio_file is None and SOUNDDEVICE_AVAILABLE:
+                    proc = self._spawn_raw(sentence)
+                    if proc is not None:
+                        self._audio_queue.put((proc, key))
+                        continue
+
+                if audio_file is None:
+                    audio_file = self._generate_audio(sentence)
+                if audio_file:
+                    audio_file = cache.put(key, audio_file)
+                if audio_file:
+                    self._audio_queue.put(audio_file)
+
+            # Wait for playback to complete
+            self._audio_queue.put(None)  # Signal end
+            if self._playback_thread:
+                self._playback_thread.join(timeout=30)
+
+            return not self.cancel_requested
+
+        finally:
+            self.is_speaking = False
+
+    def warm(self, text: str):
+        """Synthesize text into the cache without playing it."""
+        if not self.is_available:
+            return
+
+        text = self.preprocess_text(text)
+        if not text:
+            return
+
+        self._resolve_paths()
+        if not self._voice_ok:
+            return
+
+        for sentence in self._split_sentences(text):
+            key = cache.cache_key("piper", self.voice, self.speech_rate, sentence)
+            if cache.get(key) is None:
+                audio_file = (
+                    self._generate_audio_persistent(sentence)
+                    or self._generate_audio(sentence)
+                )
+                if audio_file:
+                    cache.put(key, audio_file)
+
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split text into sentences for streaming."""
+        sentences = re.split(r'(?<=[.!?])\s+', text)
+        return [s.strip() for s in sentences if s.strip()]
+
+    def _generate_audio(self, text: str) -> Optional[Path]:
+        """Generate audio file for a sentence."""
+        try:
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
                 # Adjust speech rate (Piper uses length_scale, inverse of speed)
                 length_scale = 1.0 / self.speech_rate
-                
-                cmd = [
-                    str(self.PIPER_PATH / "piper"),
-                    "--model", str(voice_path),
+
+                cmd = self._argv_prefix + [
                     "--output_file", tmp_file.name,
                     "--length_scale", str(length_scale),
                 ]
-                
+
                 # Run Piper
                 result = subprocess.run(
                     cmd,
                     input=text.encode(),
                     capture_output=True,
                 )
-                
+
                 if result.returncode != 0:
                     print(f"Piper error: {result.stderr.decode()}")
-                    return False
-                
+                    return None
+
+                return Path(tmp_file.name)
+        except Exception as e:
+            print(f"Error generating audio: {e}")
+            return None
+
+    # Raw output of the -medium voices (see VOICE_FILES)
+    _RAW_SAMPLE_RATE = 22050
+
+    def _ensure_proc(self) -> Optional[subprocess.Popen]:
+        """Return the persistent piper process, spawning it on first use.
+
+        --json-input keeps one process (and one ONNX model load) for the
+        whole session; each request line names its own output file, so
+        completion is framed by the path piper echoes per utterance.
+        """
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            self._proc = subprocess.Popen(
+                self._argv_prefix + [
+                    "--json-input",
+                    "--length_scale", str(1.0 / self.speech_rate),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except Exception:
+            self._proc = None
+        return self._proc
+
+    def _shutdown_proc(self):
+        """Terminate the persistent piper process, if any."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+                proc.wait()
+            except Exception:
+                pass
+
+    def _generate_audio_persistent(self, text: str) -> Optional[Path]:
+        """Synthesize one sentence through the persistent process."""
+        with self._proc_lock:
+            proc = self._ensure_proc()
+            if proc is None:
+                return None
+            tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
+            tmp.close()
+            out_path = Path(tmp.name)
+            try:
+                request = json.dumps({"text": text, "output_file": tmp.name})
+                proc.stdin.write(request + "\n")
+                proc.stdin.flush()
+                # Piper echoes the written path once the file is complete
+                line = proc.stdout.readline()
+                if line.strip() and out_path.stat().st_size > 0:
+                    return out_path
+            except Exception:
+                pass
+            # Anything going wrong here means the process state is
+            # unknown - drop it and let callers use the one-shot paths
+            self._shutdown_proc()
+            out_path.unlink(missing_ok=True)
+            return None
+
+    def __del__(self):
+        try:
+            self._shutdown_proc()
+        except Exception:
+            pass
+
+    def _spawn_raw(self, text: str) -> Optional[subprocess.Popen]:
+        """Start piper emitting raw PCM for one sentence on stdout."""
+        try:
+            proc = subprocess.Popen(
+                self._argv_prefix + [
+                    "--output-raw",
+                    "--length_scale", str(1.0 / self.speech_rate),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            proc.stdin.write(text.encode())
+            proc.stdin.close()
+            return proc
+        except Exception as e:
+            print(f"Error starting piper: {e}")
+            return None
+
+    def _play_raw_stream(self, proc: subprocess.Popen, key: str):
+        """Play piper's raw stdout as it arrives, then cache the audio."""
+        pcm_chunks = []
+
+        def chunks():
+            while True:
+                chunk = proc.stdout.read(4096)
+                if not chunk:
+                    return
+                pcm_chunks.append(chunk)
+                yield chunk
+
+        ok = self.audio_player.play_stream(chunks(), self._RAW_SAMPLE_RATE)
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+        # Write the collected PCM back into the cache so the next use of
+        # this sentence is a file hit with no synthesis at all
+        if ok and proc.returncode == 0 and pcm_chunks:
+            try:
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+                    with wave.open(tmp.name, "wb") as wf:
+                        wf.setnchannels(1)
+                        wf.setsampwidth(2)
+                        wf.setframerate(self._RAW_SAMPLE_RATE)
+                        wf.writeframes(b"".join(pcm_chunks))
+                cache.put(key, Path(tmp.name))
+            except Exception:
+                pass
+
+    def _discard(self, item):
+        """Dispose of an unplayed queue item (stream or temp file)."""
+        if isinstance(item, tuple):
+            proc = item[0]
+            try:
+                proc.kill()
+                proc.wait()
+            except Exception:
+                pass
+        elif item and item.exists() and not cache.contains(item):
+            item.unlink()
+
+    def _playback_worker(self):
+        """Worker thread for audio playback."""
+        while True:
+            try:
+                item = self._audio_queue.get(timeout=1)
+
+                if item is None:  # End signal
+                    break
+
+                if self.cancel_requested:
+                    self._discard(item)
+                    # Clean up remaining items (cached entries stay)
+                    while not self._audio_queue.empty():
+                        self._discard(self._audio_queue.get())
+                    break
+
+                if isinstance(item, tuple):
+                    # In-flight piper process streaming raw PCM
+                    self._play_raw_stream(*item)
+                    continue
+
                 # Play the audio
-                if not self.cancel_requested:
-                    self.audio_player.play_file(Path(tmp_file.name), blocking=True)
-                
-                # Clean up
-                Path(tmp_file.name).unlink(missing_ok=True)
-                
-                return not self.cancel_requested
-                
-        finally:
-            self.is_speaking = False
-    
+                self.audio_player.play_file(item, blocking=True)
+
+                # Clean up temp file (cached entries stay for reuse)
+                if item.exists() and not cache.contains(item):
+                    item.unlink()
+
+            except queue.Empty:
+                continue
+            except Exception as e:
+                print(f"Playback error: {e}")
+
     def stop(self):
         """Stop current speech."""
         self.cancel_requested = True
-        self.audio_player.stop()
\ No newline at end of file
+        self.audio_player.stop()
+
+        # Clear the queue
+        while not self._audio_queue.empty():
+            try:
+                self._discard(self._audio_queue.get_nowait())
+            except:
+                pass